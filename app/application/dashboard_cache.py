@@ -0,0 +1,212 @@
+"""
+In-process cache for dashboard statistics.
+
+Each dashboard request runs several aggregate queries whose results change
+slowly, so the computed statistics are kept for a short TTL under a
+``(role, *args)`` key. Services that write the counted rows invalidate the
+affected roles.
+
+System-wide counters are instead refreshed periodically in the background by
+a ``DashboardMetricAggregator``, so reading them never waits on the database.
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Segundos que se sirven las estadísticas sin volver a consultar la base de datos
+DASHBOARD_CACHE_TTL = 30
+
+# Segundos entre dos recálculos en segundo plano de los contadores globales
+DASHBOARD_METRICS_INTERVAL = 60
+
+
+class DashboardStatsCache:
+    """
+    TTL cache of dashboard statistics.
+
+    Concurrent misses on the same key are coalesced behind a per-key lock, so
+    a burst of dashboard loads runs the queries once. Results computed while
+    an invalidation happened are returned but not stored.
+    """
+
+    def __init__(self, ttl: float = DASHBOARD_CACHE_TTL, maxsize: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl (float): Seconds an entry stays valid
+            maxsize (int): Maximum number of cached entries
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._generation = 0
+        self._listeners: Dict[Hashable, List[Callable[[], None]]] = {}
+
+    def _lookup(self, key: Hashable) -> Any:
+        """Return the live value stored under ``key``, or None."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for ``key``, computing it on a miss.
+
+        Args:
+            key (Hashable): Cache key, starting with the dashboard role
+            compute (Callable[[], Awaitable[Any]]): Coroutine factory producing the value
+
+        Returns:
+            Any: Cached or freshly computed value
+        """
+        value = self._lookup(key)
+        if value is not None:
+            return value
+
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            value = self._lookup(key)
+            if value is not None:
+                return value
+
+            generation = self._generation
+            value = await compute()
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+                self._entries.move_to_end(key)
+                if len(self._entries) > self.maxsize:
+                    evicted, _ = self._entries.popitem(last=False)
+                    self._locks.pop(evicted, None)
+            return value
+
+    def on_invalidate(self, role: Hashable, callback: Callable[[], None]) -> None:
+        """
+        Register a callback run whenever ``role`` is invalidated.
+
+        Args:
+            role (Hashable): Dashboard role to watch
+            callback (Callable[[], None]): Synchronous callback, e.g. ``mark_dirty``
+        """
+        callbacks = self._listeners.setdefault(role, [])
+        if callback not in callbacks:
+            callbacks.append(callback)
+
+    def invalidate(self, *roles: Hashable) -> None:
+        """
+        Drop cached statistics.
+
+        Args:
+            *roles: Roles whose entries should be dropped; with no arguments
+                every entry is dropped
+        """
+        self._generation += 1
+        for role, callbacks in self._listeners.items():
+            if not roles or role in roles:
+                for callback in callbacks:
+                    callback()
+        if not roles:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] in roles]:
+            del self._entries[key]
+
+
+class DashboardMetricAggregator:
+    """
+    Background refresher of a snapshot of dashboard counters.
+
+    ``start`` launches a task that recomputes the snapshot every ``interval``
+    seconds, or as soon as ``mark_dirty`` is called. Readers get the last
+    snapshot without touching the database.
+    """
+
+    def __init__(self, interval: float = DASHBOARD_METRICS_INTERVAL):
+        """
+        Initialize the aggregator.
+
+        Args:
+            interval (float): Seconds between two refreshes
+        """
+        self.interval = interval
+        self._snapshot: Optional[Dict[str, int]] = None
+        self._dirty = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def snapshot(self) -> Optional[Dict[str, int]]:
+        """Last computed counters, or None before the first refresh."""
+        return self._snapshot
+
+    def start(self, fetch: Callable[[], Awaitable[Dict[str, int]]]) -> None:
+        """
+        Start refreshing the snapshot in the background.
+
+        Args:
+            fetch (Callable[[], Awaitable[Dict[str, int]]]): Coroutine factory computing the counters
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop(fetch))
+
+    async def stop(self) -> None:
+        """Cancel the refresh task and forget the snapshot."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._snapshot = None
+
+    def mark_dirty(self) -> None:
+        """Ask for a refresh without waiting for the next interval."""
+        self._dirty.set()
+
+    async def _refresh_loop(self, fetch: Callable[[], Awaitable[Dict[str, int]]]) -> None:
+        """Recompute the snapshot until cancelled."""
+        while True:
+            self._dirty.clear()
+            try:
+                self._snapshot = await fetch()
+            except Exception:
+                # Se conserva el último snapshot; se reintenta en el siguiente ciclo
+                logger.exception("Dashboard metrics refresh failed")
+            try:
+                await asyncio.wait_for(self._dirty.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+dashboard_cache = DashboardStatsCache()
+admin_metrics = DashboardMetricAggregator()
+
+
+def cached_stats(role: Hashable) -> Callable:
+    """
+    Serve an async statistics method from ``dashboard_cache``.
+
+    The cache key is ``role`` followed by the positional call arguments
+    (excluding ``self``), e.g. ``(UserRole.DENTIST, dentist_id)``.
+
+    Args:
+        role (Hashable): Dashboard role the method computes statistics for
+
+    Returns:
+        Callable: Decorator for async methods
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(self, *args) -> Any:
+            return await dashboard_cache.get_or_compute((role, *args), lambda: func(self, *args))
+
+        return wrapper
+
+    return decorator
@@ -1,99 +1,131 @@
+from typing import ClassVar, NoReturn, Optional
+
+
 class AppError(Exception):
-    """Excepción base de la aplicación."""
-    def __init__(self, message: str, code: str = "app_error"):
-        super().__init__(message)
-        self.code = code
+    """Excepción base de la aplicación.
+
+    Las subclases solo declaran ``code`` y ``_DEFAULT``; el constructor es único
+    y ``code`` vive en la clase, no en cada instancia.
+    """
+    __slots__ = ("message",)
+    code: ClassVar[str] = "app_error"
+    _DEFAULT = "Application error"
+
+    def __init__(self, message: Optional[str] = None, *, code: Optional[str] = None):
+        message = message or self._DEFAULT
+        # Exception.__new__ ya guardó los argumentos; solo falta el mensaje por defecto
+        self.args = (message,)
         self.message = message
+        if code:
+            self.code = code
+
+    def __reduce__(self):
+        # Al serializar solo viaja el mensaje (y el código si se sobrescribió)
+        return (self.__class__, (self.message,), self.__dict__ or None)
 
 class NotFoundError(AppError):
     """Recurso no encontrado (404)."""
-    def __init__(self, message="Not found"):
-        super().__init__(message, code="not_found")
+    code = "not_found"
+    _DEFAULT = "Not found"
 
 class ConflictError(AppError):
     """Conflicto (409)."""
-    def __init__(self, message="Conflict"):
-        super().__init__(message, code="conflict")
+    code = "conflict"
+    _DEFAULT = "Conflict"
 
 class ValidationError(AppError):
     """Error de validación (400)."""
-    def __init__(self, message="Validation error"):
-        super().__init__(message, code="validation_error")
+    code = "validation_error"
+    _DEFAULT = "Validation error"
 
 class AuthenticationError(AppError):
     """Error de autenticación (401)."""
-    def __init__(self, message="Invalid credentials"):
-        super().__init__(message, code="auth_error")
+    code = "auth_error"
+    _DEFAULT = "Invalid credentials"
 
 class UserNotFoundError(NotFoundError):
     """Usuario no encontrado."""
-    def __init__(self, message="User not found"):
-        super().__init__(message)
+    _DEFAULT = "User not found"
 
 class PatientNotFoundError(NotFoundError):
     """Paciente no encontrado."""
-    def __init__(self, message="Patient not found"):
-        super().__init__(message)
+    _DEFAULT = "Patient not found"
 
 class ClinicalRecordNotFoundError(NotFoundError):
     """Registro clínico no encontrado."""
-    def __init__(self, message="Clinical record not found"):
-        super().__init__(message)
+    _DEFAULT = "Clinical record not found"
 
 class InterventionNotFoundError(NotFoundError):
     """Intervención no encontrada."""
-    def __init__(self, message="Intervention not found"):
-        super().__init__(message)
+    _DEFAULT = "Intervention not found"
 
 class RoleNotFoundError(NotFoundError):
     """Rol no encontrado."""
-    def __init__(self, message="Role not found"):
-        super().__init__(message)
+    _DEFAULT = "Role not found"
 
 class InvalidCredentialsError(AuthenticationError):
     """Credenciales inválidas."""
-    def __init__(self, message="Invalid credentials"):
-        super().__init__(message)
+    _DEFAULT = "Invalid credentials"
 
 class InactiveUserError(AuthenticationError):
     """Usuario inactivo."""
-    def __init__(self, message="User account is inactive"):
-        super().__init__(message)
+    _DEFAULT = "User account is inactive"
 
 class UserAlreadyExistsError(ConflictError):
     """Usuario ya existe."""
-    def __init__(self, message="User already exists"):
-        super().__init__(message)
+    _DEFAULT = "User already exists"
 
 class PatientAlreadyExistsError(ConflictError):
     """Paciente ya existe."""
-    def __init__(self, message="Patient already exists"):
-        super().__init__(message)
+    _DEFAULT = "Patient already exists"
 
 class AuthorizationError(AppError):
     """Error de autorización (403)."""
-    def __init__(self, message="Insufficient permissions"):
-        super().__init__(message, code="authorization_error")
+    code = "authorization_error"
+    _DEFAULT = "Insufficient permissions"
 
 class DatabaseError(AppError):
     """Error de base de datos."""
-    def __init__(self, message="Database error"):
-        super().__init__(message, code="database_error")
+    code = "database_error"
+    _DEFAULT = "Database error"
 
 class BusinessLogicError(AppError):
     """Error de lógica de negocio."""
-    def __init__(self, message="Business logic error"):
-        super().__init__(message, code="business_logic_error")
+    code = "business_logic_error"
+    _DEFAULT = "Business logic error"
 
 class AppointmentNotFoundError(NotFoundError):
     """Appointment not found."""
-    def __init__(self, message="Appointment not found"):
-        super().__init__(message)
+    _DEFAULT = "Appointment not found"
 
 class AppointmentConflictError(ConflictError):
     """Appointment scheduling conflict."""
-    def __init__(self, message="Appointment scheduling conflict"):
-        super().__init__(message)
+    _DEFAULT = "Appointment scheduling conflict"
+
+
+# Atajos para los fallos más frecuentes (login y búsquedas por ID); cada llamada
+# lanza una instancia nueva: una instancia compartida entre peticiones concurrentes
+# mezclaría sus tracebacks y mantendría vivos los frames de la última petición
+
+def raise_user_not_found() -> NoReturn:
+    """Lanza UserNotFoundError con el mensaje por defecto."""
+    raise UserNotFoundError()
+
+def raise_patient_not_found() -> NoReturn:
+    """Lanza PatientNotFoundError con el mensaje por defecto."""
+    raise PatientNotFoundError()
+
+def raise_invalid_credentials() -> NoReturn:
+    """Lanza InvalidCredentialsError para un email o contraseña incorrectos."""
+    raise InvalidCredentialsError("Invalid email or password")
+
+def raise_inactive_user() -> NoReturn:
+    """Lanza InactiveUserError con el mensaje por defecto."""
+    raise InactiveUserError()
 
 # Alias for compatibility
-PermissionError = AuthorizationError
+def __getattr__(name: str):
+    """Export perezoso del alias ``PermissionError`` (PEP 562) sin sombrear el builtin."""
+    if name == "PermissionError":
+        return AuthorizationError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
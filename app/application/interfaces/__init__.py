@@ -5,12 +5,16 @@ This package contains abstract interfaces for repository patterns and service co
 enabling clean architecture and dependency inversion principles.
 """
 
+from app.application.pagination import MAX_LEGACY_SKIP
+from .crud_repository import CrudRepository
 from .user_repository import IUserRepository, IRoleRepository
 from .clinical_repository import IPatientRepository, IClinicalInterventionRepository
 
 __all__ = [
+    "CrudRepository",
     "IUserRepository",
-    "IRoleRepository", 
+    "IRoleRepository",
     "IPatientRepository",
-    "IClinicalInterventionRepository"
-]
\ No newline at end of file
+    "IClinicalInterventionRepository",
+    "MAX_LEGACY_SKIP",
+]
@@ -1,38 +1,24 @@
 """
 Clinical repository interfaces for the odontology system.
 
-This module defines abstract interfaces for patient and clinical intervention
+This module defines protocols for patient and clinical intervention
 data access operations, following the repository pattern.
 """
 
-from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Protocol, Optional, List
 from uuid import UUID
+from app.application.interfaces.crud_repository import CrudRepository
 
 # TODO: These models will be implemented in future phases (MVP Phase 2-4)
 # from app.domain.models.clinical_models import Patient, ClinicalIntervention
 from app.domain.models import Patient
 
 
-class IPatientRepository(ABC):
+class IPatientRepository(CrudRepository[Patient, UUID], Protocol):
     """
-    Abstract interface for patient data access operations.
+    Protocol for patient data access operations.
     """
 
-    @abstractmethod
-    async def get_by_id(self, patient_id: UUID) -> Optional[Patient]:
-        """
-        Retrieve a patient by ID.
-        
-        Args:
-            patient_id (UUID): The patient ID to search for
-            
-        Returns:
-            Optional[Patient]: The patient if found, None otherwise
-        """
-        raise NotImplementedError
-
-    @abstractmethod
     async def get_by_patient_number(self, patient_number: str) -> Optional[Patient]:
         """
         Retrieve a patient by patient number.
@@ -43,75 +29,81 @@ class IPatientRepository(ABC):
         Returns:
             Optional[Patient]: The patient if found, None otherwise
         """
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
-    async def create(self, patient: Patient) -> Patient:
+    async def exists_by_patient_number(self, patient_number: str) -> bool:
         """
-        Create a new patient.
+        Check whether a patient number is taken, without loading the row.
         
         Args:
-            patient (Patient): The patient entity to create
+            patient_number (str): The patient number to check
             
         Returns:
-            Patient: The created patient with assigned ID
+            bool: True if a patient already has this number
         """
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
-    async def update(self, patient: Patient) -> Patient:
+    async def list_patients(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        *,
+        include_total: bool = False,
+        skip: Optional[int] = None
+    ) -> tuple[List[Patient], Optional[str], Optional[int]]:
         """
-        Update an existing patient.
+        List patients with keyset pagination ordered by ``(created_at, id)``.
         
-        Args:
-            patient (Patient): The patient entity to update
-            
-        Returns:
-            Patient: The updated patient
-        """
-        raise NotImplementedError
-
-    @abstractmethod
-    async def delete(self, patient_id: UUID) -> bool:
-        """
-        Delete a patient by ID.
+        Implementations must seek on the ``(created_at, id)`` composite index
+        instead of using OFFSET.
         
         Args:
-            patient_id (UUID): The ID of the patient to delete
+            cursor (Optional[str]): Opaque cursor returned by the previous page
+            limit (int): Maximum number of patients to return
+            include_total (bool): Whether to compute the total row count.
+                The COUNT(*) is skipped when False, or when the total can be
+                derived from a short first/last page
+            skip (Optional[int]): Deprecated offset pagination, rejected above
+                ``MAX_LEGACY_SKIP``
             
         Returns:
-            bool: True if deleted successfully, False otherwise
+            tuple[List[Patient], Optional[str], Optional[int]]: Patients, the
+                cursor of the next page (None on the last page) and the total
+                count (None unless requested)
         """
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
-    async def list_patients(self, skip: int = 0, limit: int = 100) -> List[Patient]:
+    async def search_patients(self, query: str) -> List[tuple[Patient, float]]:
         """
-        List patients with pagination.
+        Search patients by name, email, or patient number.
+        
+        Implementations must be backed by an index (pg_trgm GIN or tsvector)
+        over name, email and patient number; a plain ``ILIKE '%q%'`` scan is
+        not acceptable. Queries shaped like a patient number should be
+        resolved with an equality lookup on the unique index instead.
         
         Args:
-            skip (int): Number of patients to skip
-            limit (int): Maximum number of patients to return
+            query (str): Search query
             
         Returns:
-            List[Patient]: List of patients
+            List[tuple[Patient, float]]: Matching patients with their relevance
+                rank, best matches first
         """
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
-    async def search_patients(self, query: str) -> List[Patient]:
+    async def update_fields(self, patient_id: UUID, values: dict) -> Optional[Patient]:
         """
-        Search patients by name, email, or patient number.
+        Update the given columns of a patient in a single statement.
         
         Args:
-            query (str): Search query
+            patient_id (UUID): The ID of the patient to update
+            values (dict): Column values to set; unknown keys are ignored
             
         Returns:
-            List[Patient]: List of matching patients
+            Optional[Patient]: The updated patient, None if not found
         """
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
     async def generate_patient_number(self) -> str:
         """
         Generate a unique patient number.
@@ -119,102 +111,87 @@ class IPatientRepository(ABC):
         Returns:
             str: Unique patient number
         """
-        raise NotImplementedError
+        ...
 
 
-class IClinicalInterventionRepository(ABC):
+class IClinicalInterventionRepository(CrudRepository["ClinicalIntervention", UUID], Protocol):
     """
-    Abstract interface for clinical intervention data access operations.
+    Protocol for clinical intervention data access operations.
     """
 
-    @abstractmethod
-    async def get_by_id(self, intervention_id: UUID) -> Optional[ClinicalIntervention]:
+    async def get_by_patient_id(self, patient_id: UUID) -> List["ClinicalIntervention"]:
         """
-        Retrieve a clinical intervention by ID.
+        Get all interventions for a specific patient.
         
         Args:
-            intervention_id (UUID): The intervention ID to search for
+            patient_id (UUID): The patient ID
             
         Returns:
-            Optional[ClinicalIntervention]: The intervention if found, None otherwise
-        """
-        raise NotImplementedError
-
-    @abstractmethod
-    async def create(self, intervention: ClinicalIntervention) -> ClinicalIntervention:
-        """
-        Create a new clinical intervention.
+            List[ClinicalIntervention]: List of interventions for the patient,
+                newest first (``performed_at DESC, id DESC``)
         
-        Args:
-            intervention (ClinicalIntervention): The intervention entity to create
-            
-        Returns:
-            ClinicalIntervention: The created intervention with assigned ID
+        Implementations must order in SQL and be backed by a composite
+        ``(patient_id, performed_at DESC, id DESC)`` index, so the query is an
+        index range scan rather than a sort.
         """
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
-    async def update(self, intervention: ClinicalIntervention) -> ClinicalIntervention:
+    async def get_by_dentist_id(self, dentist_id: UUID) -> List["ClinicalIntervention"]:
         """
-        Update an existing clinical intervention.
+        Get all interventions performed by a specific dentist.
         
         Args:
-            intervention (ClinicalIntervention): The intervention entity to update
+            dentist_id (UUID): The dentist profile ID
             
         Returns:
-            ClinicalIntervention: The updated intervention
-        """
-        raise NotImplementedError
-
-    @abstractmethod
-    async def delete(self, intervention_id: UUID) -> bool:
-        """
-        Delete a clinical intervention by ID.
+            List[ClinicalIntervention]: List of interventions by the dentist,
+                newest first (``performed_at DESC, id DESC``)
         
-        Args:
-            intervention_id (UUID): The ID of the intervention to delete
-            
-        Returns:
-            bool: True if deleted successfully, False otherwise
-        """
-        raise NotImplementedError
-
-    @abstractmethod
-    async def get_by_patient_id(self, patient_id: UUID) -> List[ClinicalIntervention]:
-        """
-        Get all interventions for a specific patient.
+        Implementations must order in SQL and be backed by a composite
+        ``(dentist_id, performed_at DESC, id DESC)`` index, so the query is an
+        index range scan rather than a sort.
+        """
+        ...
+
+    async def list_interventions(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        *,
+        include_total: bool = False,
+        skip: Optional[int] = None
+    ) -> tuple[List["ClinicalIntervention"], Optional[str], Optional[int]]:
+        """
+        List interventions with keyset pagination ordered by ``(performed_at, id)``.
         
-        Args:
-            patient_id (UUID): The patient ID
-            
-        Returns:
-            List[ClinicalIntervention]: List of interventions for the patient
-        """
-        raise NotImplementedError
-
-    @abstractmethod
-    async def get_by_dentist_id(self, dentist_id: UUID) -> List[ClinicalIntervention]:
-        """
-        Get all interventions performed by a specific dentist.
+        Implementations must seek on the ``(performed_at, id)`` composite index
+        instead of using OFFSET.
         
         Args:
-            dentist_id (UUID): The dentist profile ID
+            cursor (Optional[str]): Opaque cursor returned by the previous page
+            limit (int): Maximum number of interventions to return
+            include_total (bool): Whether to compute the total row count.
+                The COUNT(*) is skipped when False, or when the total can be
+                derived from a short first/last page
+            skip (Optional[int]): Deprecated offset pagination, rejected above
+                ``MAX_LEGACY_SKIP``
             
         Returns:
-            List[ClinicalIntervention]: List of interventions by the dentist
+            tuple[List[ClinicalIntervention], Optional[str], Optional[int]]:
+                Interventions, the cursor of the next page (None on the last
+                page) and the total count (None unless requested)
         """
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
-    async def list_interventions(self, skip: int = 0, limit: int = 100) -> List[ClinicalIntervention]:
+    async def update_fields(self, intervention_id: UUID, values: dict) -> Optional["ClinicalIntervention"]:
         """
-        List interventions with pagination.
+        Update the given columns of a clinical intervention in a single statement.
         
         Args:
-            skip (int): Number of interventions to skip
-            limit (int): Maximum number of interventions to return
+            intervention_id (UUID): The ID of the clinical intervention to update
+            values (dict): Column values to set; unknown keys are ignored
             
         Returns:
-            List[ClinicalIntervention]: List of interventions
+            Optional[ClinicalIntervention]: The updated clinical intervention, None if not found
         """
-        raise NotImplementedError
\ No newline at end of file
+        ...
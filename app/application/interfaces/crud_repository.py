@@ -0,0 +1,68 @@
+"""
+Generic CRUD repository protocol for the odontology system.
+
+This module defines the point-lookup and write operations shared by every
+entity repository, parameterized by entity and identifier type.
+"""
+
+from typing import Protocol, TypeVar, Optional
+
+TEntity = TypeVar("TEntity")
+TId = TypeVar("TId")
+
+
+class CrudRepository(Protocol[TEntity, TId]):
+    """
+    Protocol for the CRUD operations common to all entity repositories.
+
+    Entity-specific protocols extend ``CrudRepository[Entity, UUID]`` and only
+    declare their own queries.
+    """
+
+    async def get_by_id(self, entity_id: TId) -> Optional[TEntity]:
+        """
+        Retrieve an entity by ID.
+        
+        Args:
+            entity_id (TId): The ID to search for
+        
+        Returns:
+            Optional[TEntity]: The entity if found, None otherwise
+        """
+        ...
+
+    async def create(self, entity: TEntity) -> TEntity:
+        """
+        Create a new entity.
+        
+        Args:
+            entity (TEntity): The entity to create
+        
+        Returns:
+            TEntity: The created entity with assigned ID
+        """
+        ...
+
+    async def update(self, entity: TEntity) -> TEntity:
+        """
+        Update an existing entity.
+        
+        Args:
+            entity (TEntity): The entity to update
+        
+        Returns:
+            TEntity: The updated entity
+        """
+        ...
+
+    async def delete(self, entity_id: TId) -> bool:
+        """
+        Delete an entity by ID.
+        
+        Args:
+            entity_id (TId): The ID of the entity to delete
+        
+        Returns:
+            bool: True if deleted, False if not found
+        """
+        ...
@@ -1,26 +1,25 @@
 """
 User repository interface for the odontology system.
 
-This module defines the abstract interface for user data access operations,
+This module defines the protocol for user data access operations,
 following the repository pattern for clean architecture.
 """
 
-from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Protocol, Optional, List
 from uuid import UUID
+from app.application.interfaces.crud_repository import CrudRepository
 from app.domain.models.user_model import User
 from app.domain.models.role_model import Role
 
 
-class IUserRepository(ABC):
+class IUserRepository(CrudRepository[User, UUID], Protocol):
     """
-    Abstract interface for user data access operations.
+    Protocol for user data access operations.
     
     This interface defines the contract for user repository implementations,
     enabling dependency inversion and testability.
     """
 
-    @abstractmethod
     async def get_by_username(self, username: str) -> Optional[User]:
         """
         Retrieve a user by username.
@@ -31,9 +30,8 @@ class IUserRepository(ABC):
         Returns:
             Optional[User]: The user if found, None otherwise
         """
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
     async def get_by_email(self, email: str) -> Optional[User]:
         """
         Retrieve a user by email address.
@@ -44,75 +42,66 @@ class IUserRepository(ABC):
         Returns:
             Optional[User]: The user if found, None otherwise
         """
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
-    async def get_by_id(self, user_id: UUID) -> Optional[User]:
+    async def exists_by_email(self, email: str) -> bool:
         """
-        Retrieve a user by ID.
+        Check whether a user with this email exists, without loading the row.
         
         Args:
-            user_id (UUID): The user ID to search for
+            email (str): The email address to check (case-insensitive)
             
         Returns:
-            Optional[User]: The user if found, None otherwise
+            bool: True if the email is already registered
         """
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
-    async def create(self, user: User) -> User:
+    async def get_by_identifier(self, identifier: str) -> Optional[User]:
         """
-        Create a new user.
+        Retrieve a user by username or email in a single query.
         
-        Args:
-            user (User): The user entity to create
-            
-        Returns:
-            User: The created user with assigned ID
-        """
-        raise NotImplementedError
-
-    @abstractmethod
-    async def update(self, user: User) -> User:
-        """
-        Update an existing user.
+        Both comparisons are case-insensitive and must be served by the
+        ``lower(...)`` functional indexes, so a login attempt costs one
+        round-trip whether or not it matches.
         
         Args:
-            user (User): The user entity to update
+            identifier (str): Username or email address
             
         Returns:
-            User: The updated user
+            Optional[User]: The user if found, None otherwise
         """
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
-    async def delete(self, user_id: UUID) -> bool:
+    async def list_users(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        *,
+        include_total: bool = False,
+        skip: Optional[int] = None
+    ) -> tuple[List[User], Optional[str], Optional[int]]:
         """
-        Delete a user by ID.
+        List users with keyset pagination ordered by ``(created_at, id)``.
         
-        Args:
-            user_id (UUID): The ID of the user to delete
-            
-        Returns:
-            bool: True if deleted successfully, False otherwise
-        """
-        raise NotImplementedError
-
-    @abstractmethod
-    async def list_users(self, skip: int = 0, limit: int = 100) -> List[User]:
-        """
-        List users with pagination.
+        Implementations must seek on the ``(created_at, id)`` composite index
+        instead of using OFFSET.
         
         Args:
-            skip (int): Number of users to skip
+            cursor (Optional[str]): Opaque cursor returned by the previous page
             limit (int): Maximum number of users to return
+            include_total (bool): Whether to compute the total row count.
+                The COUNT(*) is skipped when False, or when the total can be
+                derived from a short first/last page
+            skip (Optional[int]): Deprecated offset pagination, rejected above
+                ``MAX_LEGACY_SKIP``
             
         Returns:
-            List[User]: List of users
+            tuple[List[User], Optional[str], Optional[int]]: Users, the cursor
+                of the next page (None on the last page) and the total count
+                (None unless requested)
         """
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
     async def get_users_by_role(self, role_name: str) -> List[User]:
         """
         Get all users with a specific role.
@@ -123,15 +112,14 @@ class IUserRepository(ABC):
         Returns:
             List[User]: List of users with the specified role
         """
-        raise NotImplementedError
+        ...
 
 
-class IRoleRepository(ABC):
+class IRoleRepository(Protocol):
     """
-    Abstract interface for role data access operations.
+    Protocol for role data access operations.
     """
 
-    @abstractmethod
     async def get_by_name(self, name: str) -> Optional[Role]:
         """
         Retrieve a role by name.
@@ -142,9 +130,8 @@ class IRoleRepository(ABC):
         Returns:
             Optional[Role]: The role if found, None otherwise
         """
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
     async def get_by_id(self, role_id: UUID) -> Optional[Role]:
         """
         Retrieve a role by ID.
@@ -155,9 +142,8 @@ class IRoleRepository(ABC):
         Returns:
             Optional[Role]: The role if found, None otherwise
         """
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
     async def create(self, role: Role) -> Role:
         """
         Create a new role.
@@ -168,9 +154,8 @@ class IRoleRepository(ABC):
         Returns:
             Role: The created role with assigned ID
         """
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
     async def list_roles(self) -> List[Role]:
         """
         List all available roles.
@@ -178,4 +163,4 @@ class IRoleRepository(ABC):
         Returns:
             List[Role]: List of all roles
         """
-        raise NotImplementedError
\ No newline at end of file
+        ...
\ No newline at end of file
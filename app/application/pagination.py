@@ -0,0 +1,75 @@
+"""
+Keyset pagination helpers for the odontology system.
+
+Cursors are opaque, URL-safe tokens wrapping the ``(timestamp, id)`` of the
+last row of a page. This module has no model or interface imports so that
+repositories and services can share it freely.
+"""
+
+import base64
+import json
+import warnings
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+from app.application.exceptions import ValidationError
+
+# Deepest offset still accepted by the deprecated ``skip`` pagination shims
+MAX_LEGACY_SKIP = 10_000
+
+
+def encode_cursor(key: Tuple[datetime, UUID]) -> str:
+    """
+    Encode a keyset position as an opaque pagination cursor.
+
+    Args:
+        key (Tuple[datetime, UUID]): Last seen ``(timestamp, id)`` pair
+
+    Returns:
+        str: URL-safe cursor token
+    """
+    timestamp, entity_id = key
+    raw = json.dumps([timestamp.isoformat(), str(entity_id)])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor (str): Cursor token received from a client
+
+    Returns:
+        Tuple[datetime, UUID]: The ``(timestamp, id)`` keyset position
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        timestamp, entity_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(timestamp), UUID(entity_id)
+    except (ValueError, TypeError):
+        raise ValidationError("Invalid pagination cursor")
+
+
+def check_legacy_skip(skip: int) -> None:
+    """
+    Guard for the deprecated ``skip``/``limit`` offset pagination.
+
+    Args:
+        skip (int): Requested offset
+
+    Raises:
+        ValidationError: If the offset is deeper than ``MAX_LEGACY_SKIP``
+    """
+    warnings.warn(
+        "Offset pagination is deprecated, use cursor pagination instead",
+        DeprecationWarning,
+        stacklevel=3
+    )
+    if skip > MAX_LEGACY_SKIP:
+        raise ValidationError(
+            f"Offset pagination is limited to {MAX_LEGACY_SKIP} rows, use cursor pagination instead"
+        )
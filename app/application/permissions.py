@@ -0,0 +1,46 @@
+"""
+Role checks for application services.
+
+Service methods that only some roles may call declare it with
+``require_roles`` instead of repeating the check in their body, so the
+policy of each method is visible in its signature.
+"""
+
+import functools
+import inspect
+from typing import Any, Callable, Optional
+
+from app.application.exceptions import PermissionError
+
+
+def require_roles(*roles: Any, message: Optional[str] = None) -> Callable:
+    """
+    Reject calls to an async service method from users outside ``roles``.
+
+    The decorated method must take a ``current_user`` argument, passed either
+    by position or by keyword. The set of allowed roles and the position of
+    ``current_user`` are resolved once, when the method is decorated.
+
+    Args:
+        *roles: Roles allowed to call the method
+        message (Optional[str]): Message of the raised ``PermissionError``
+
+    Returns:
+        Callable: Decorator for async methods
+    """
+    allowed = frozenset(roles)
+
+    def decorator(func: Callable) -> Callable:
+        # Posición de current_user sin contar self
+        position = list(inspect.signature(func).parameters).index("current_user") - 1
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs) -> Any:
+            current_user = kwargs["current_user"] if "current_user" in kwargs else args[position]
+            if current_user.role not in allowed:
+                raise PermissionError(message)
+            return await func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -5,11 +5,14 @@ This module provides appointment services including scheduling,
 conflict detection, status management, and reminder creation.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
 from uuid import UUID
 from datetime import datetime, date, time, timedelta
-from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import TypeAdapter
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.core.database import AsyncSessionLocal
 from app.domain.models import Appointment, AppointmentReminder, Patient, User
 from app.domain.models.user_model import UserRole
 from app.domain.models.enums import AppointmentStatus, ReminderType
@@ -22,6 +25,8 @@ from app.domain.schemas.appointment_schemas import (
     AppointmentReminderCreate
 )
 from app.insfraestructure.repositories.appointment_repository import AppointmentRepository
+from app.insfraestructure.repositories.patient_repository import PatientRepository
+from app.insfraestructure.repositories.user_repository import UserRepository
 from app.application.exceptions import (
     AppointmentNotFoundError,
     AppointmentConflictError,
@@ -31,6 +36,55 @@ from app.application.exceptions import (
     UserNotFoundError
 )
 
+# Transiciones de estado permitidas
+_VALID_TRANSITIONS = {
+    AppointmentStatus.SCHEDULED: frozenset({
+        AppointmentStatus.CONFIRMED,
+        AppointmentStatus.CANCELLED,
+        AppointmentStatus.NO_SHOW
+    }),
+    AppointmentStatus.CONFIRMED: frozenset({
+        AppointmentStatus.IN_PROGRESS,
+        AppointmentStatus.CANCELLED,
+        AppointmentStatus.NO_SHOW
+    }),
+    AppointmentStatus.IN_PROGRESS: frozenset({
+        AppointmentStatus.COMPLETED
+    }),
+}
+
+# Estados desde los que se puede llegar a cada estado (índice inverso de _VALID_TRANSITIONS)
+_PREVIOUS_STATUSES = {
+    status: frozenset(
+        current for current, allowed in _VALID_TRANSITIONS.items() if status in allowed
+    )
+    for status in AppointmentStatus
+}
+
+# Estados que todavía se pueden cancelar
+_CANCELLABLE_STATUSES = frozenset(AppointmentStatus) - {
+    AppointmentStatus.COMPLETED,
+    AppointmentStatus.CANCELLED,
+    AppointmentStatus.NO_SHOW
+}
+
+# Horario de atención (apertura, cierre) por día de la semana; None = cerrado
+_BUSINESS_HOURS = (
+    (8, 18),  # Monday
+    (8, 18),  # Tuesday
+    (8, 18),  # Wednesday
+    (8, 18),  # Thursday
+    (8, 18),  # Friday
+    (8, 13),  # Saturday
+    None,     # Sunday
+)
+
+# Roles que ven y modifican todas las citas y sus estadísticas
+_STAFF_ROLES = frozenset({UserRole.ADMIN, UserRole.RECEPTIONIST})
+
+# Validador reutilizable para listas de citas con detalle
+_DETAILED_LIST_ADAPTER = TypeAdapter(List[AppointmentDetailResponse])
+
 
 class AppointmentService:
     """
@@ -40,10 +94,25 @@ class AppointmentService:
     status transitions, and reminder management.
     """
     
-    def __init__(self, session: AsyncSession):
-        """Initialize the appointment service with database session."""
+    def __init__(
+        self,
+        session: AsyncSession,
+        patient_repository: Optional[PatientRepository] = None,
+        session_factory: async_sessionmaker = AsyncSessionLocal
+    ):
+        """
+        Initialize the appointment service with database session.
+        
+        Args:
+            session: Request-scoped session that owns the writes
+            patient_repository: Optional patient repository; defaults to one on ``session``
+            session_factory: Factory for short-lived read sessions that run
+                alongside ``session``
+        """
         self.session = session
         self.repository = AppointmentRepository(session)
+        self.patient_repository = patient_repository or PatientRepository(session)
+        self.session_factory = session_factory
     
     async def create_appointment(
         self,
@@ -67,19 +136,16 @@ class AppointmentService:
             ValidationError: If validation fails
         """
         # Validate patient exists
-        from app.insfraestructure.repositories.patient_repository import PatientRepository
-        patient_repo = PatientRepository(self.session)
-        patient = await patient_repo.get_by_id(appointment_data.patient_id)
+        patient = await self.patient_repository.get_by_id(appointment_data.patient_id)
         if not patient:
             raise PatientNotFoundError(f"Patient with ID {appointment_data.patient_id} not found")
         
-        # Validate dentist exists and has DENTIST role
-        from app.insfraestructure.repositories.user_repository import UserRepository
-        user_repo = UserRepository(self.session)
-        dentist = await user_repo.get_by_id(appointment_data.dentist_id)
-        if not dentist:
+        # Validate dentist exists and has DENTIST role; sobre la misma sesión, así la
+        # petición nunca retiene una conexión mientras espera otra del pool
+        dentist_role = await UserRepository(self.session).get_role(appointment_data.dentist_id)
+        if dentist_role is None:
             raise UserNotFoundError(f"Dentist with ID {appointment_data.dentist_id} not found")
-        if dentist.role != UserRole.DENTIST and dentist.role != UserRole.ADMIN:
+        if dentist_role != UserRole.DENTIST and dentist_role != UserRole.ADMIN:
             raise ValidationError("Specified user is not a dentist")
         
         # Validate business hours (optional - can be configured)
@@ -93,10 +159,16 @@ class AppointmentService:
         appointment_dict['created_by'] = current_user.id
         appointment_dict['status'] = AppointmentStatus.SCHEDULED
         
-        appointment = await self.repository.create(appointment_dict)
+        appointment = await self.repository.create(appointment_dict, commit=False)
         
-        # Create automatic reminders
-        await self._create_automatic_reminders(appointment)
+        # Create automatic reminders; la cita y sus recordatorios van en una sola transacción
+        try:
+            await self._create_automatic_reminders(appointment)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        await self.session.refresh(appointment)
         
         return AppointmentResponse.model_validate(appointment)
     
@@ -193,22 +265,19 @@ class AppointmentService:
             AppointmentNotFoundError: If appointment doesn't exist
             ValidationError: If status transition is invalid
         """
-        appointment = await self.repository.get_by_id_or_raise(appointment_id)
-        
-        # Authorization check
-        self._check_appointment_modification_access(appointment, current_user)
-        
-        # Validate status transition
-        self._validate_status_transition(appointment, status_update.status)
-        
-        # Update status
-        update_dict = {
-            'status': status_update.status
-        }
-        if status_update.notes:
-            update_dict['notes'] = status_update.notes
-        
-        updated_appointment = await self.repository.update(appointment_id, update_dict)
+        # Permisos, transición y escritura en un solo UPDATE ... RETURNING
+        updated_appointment = await self.repository.update_status_conditional(
+            appointment_id,
+            status_update.status,
+            _PREVIOUS_STATUSES[status_update.status],
+            dentist_id=self._modification_scope(current_user),
+            notes=status_update.notes
+        )
+        if updated_appointment is None:
+            appointment = await self.repository.get_by_id_or_raise(appointment_id)
+            self._check_appointment_modification_access(appointment, current_user)
+            self._validate_status_transition(appointment, status_update.status)
+            raise ValidationError("Appointment was modified concurrently, please retry")
         
         return AppointmentResponse.model_validate(updated_appointment)
     
@@ -229,26 +298,22 @@ class AppointmentService:
         Returns:
             Updated appointment response
         """
-        appointment = await self.repository.get_by_id_or_raise(appointment_id)
-        
-        # Authorization check
-        self._check_appointment_modification_access(appointment, current_user)
-        
-        # Check if appointment can be cancelled
-        if not appointment.can_be_cancelled():
-            raise ValidationError(
-                f"Cannot cancel appointment with status {appointment.status.value}"
-            )
-        
-        # Cancel appointment
-        update_dict = {
-            'status': AppointmentStatus.CANCELLED
-        }
-        if reason:
-            current_notes = appointment.notes or ""
-            update_dict['notes'] = f"{current_notes}\n[CANCELLATION] {reason}".strip()
-        
-        updated_appointment = await self.repository.update(appointment_id, update_dict)
+        # Cancel appointment in a single conditional UPDATE
+        updated_appointment = await self.repository.update_status_conditional(
+            appointment_id,
+            AppointmentStatus.CANCELLED,
+            _CANCELLABLE_STATUSES,
+            dentist_id=self._modification_scope(current_user),
+            notes_suffix=f"\n[CANCELLATION] {reason}" if reason else None
+        )
+        if updated_appointment is None:
+            appointment = await self.repository.get_by_id_or_raise(appointment_id)
+            self._check_appointment_modification_access(appointment, current_user)
+            if not appointment.can_be_cancelled():
+                raise ValidationError(
+                    f"Cannot cancel appointment with status {appointment.status.value}"
+                )
+            raise ValidationError("Appointment was modified concurrently, please retry")
         
         return AppointmentResponse.model_validate(updated_appointment)
     
@@ -260,11 +325,12 @@ class AppointmentService:
         status: Optional[AppointmentStatus] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-        page: int = 1,
-        per_page: int = 50
-    ) -> tuple[List[AppointmentDetailResponse], int]:
+        cursor: Optional[str] = None,
+        per_page: int = 50,
+        page: Optional[int] = None
+    ) -> tuple[List[AppointmentDetailResponse], Optional[int], Optional[str]]:
         """
-        List appointments with filters and pagination.
+        List appointments with filters and cursor pagination.
         
         Args:
             current_user: User requesting the list
@@ -273,41 +339,96 @@ class AppointmentService:
             status: Filter by status
             start_date: Filter by start date
             end_date: Filter by end date
-            page: Page number (1-indexed)
+            cursor: Cursor returned by the previous page
             per_page: Items per page
+            page: Deprecated page number (1-indexed), translated to an offset
             
         Returns:
-            Tuple of (list of appointments, total count)
+            Tuple of (list of appointments, total count, next page cursor);
+            the total is only computed for the first page
         """
         # Apply role-based filters
-        if current_user.role == UserRole.DENTIST:
-            dentist_id = current_user.id
-        elif current_user.role == UserRole.RECEPTIONIST and not (dentist_id or patient_id):
-            # Receptionist can see all, but we might want to limit the date range
-            if not start_date:
-                start_date = date.today()
-            if not end_date:
-                end_date = start_date + timedelta(days=30)
-        
-        # Calculate pagination
-        skip = (page - 1) * per_page
+        dentist_id, start_date, end_date = self._scope_list_filters(
+            current_user, patient_id, dentist_id, start_date, end_date
+        )
         
         # Get appointments
-        appointments, total = await self.repository.list_appointments(
+        appointments, total, next_cursor = await self.repository.list_appointments(
             patient_id=patient_id,
             dentist_id=dentist_id,
             status=status,
             start_date=start_date,
             end_date=end_date,
-            skip=skip,
+            skip=(page - 1) * per_page if page is not None else None,
             limit=per_page,
-            load_relations=True
+            load_relations=True,
+            cursor=cursor,
+            include_total=cursor is None
         )
         
-        # Build detailed responses
-        detailed_responses = [self._build_detailed_response(apt) for apt in appointments]
+        # Build detailed responses in a single batch validation
+        detailed_responses = _DETAILED_LIST_ADAPTER.validate_python(appointments, from_attributes=True)
+        
+        return detailed_responses, total, next_cursor
+    
+    async def list_appointments_stream(
+        self,
+        current_user: User,
+        patient_id: Optional[UUID] = None,
+        dentist_id: Optional[UUID] = None,
+        status: Optional[AppointmentStatus] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> AsyncIterator[AppointmentDetailResponse]:
+        """
+        Stream every appointment matching the filters, one response at a time.
+        
+        Uses its own session so the stream can outlive the request-scoped one;
+        meant for exports, ``list_appointments`` remains the paginated API.
+        
+        Args:
+            current_user: User requesting the list
+            patient_id: Filter by patient
+            dentist_id: Filter by dentist
+            status: Filter by status
+            start_date: Filter by start date
+            end_date: Filter by end date
+            
+        Yields:
+            Detailed appointment responses in schedule order
+        """
+        dentist_id, start_date, end_date = self._scope_list_filters(
+            current_user, patient_id, dentist_id, start_date, end_date
+        )
         
-        return detailed_responses, total
+        async with self.session_factory() as session:
+            async for appointment in AppointmentRepository(session).stream_appointments(
+                patient_id=patient_id,
+                dentist_id=dentist_id,
+                status=status,
+                start_date=start_date,
+                end_date=end_date
+            ):
+                yield AppointmentDetailResponse.model_validate(appointment)
+    
+    @staticmethod
+    def _scope_list_filters(
+        current_user: User,
+        patient_id: Optional[UUID],
+        dentist_id: Optional[UUID],
+        start_date: Optional[date],
+        end_date: Optional[date]
+    ) -> tuple[Optional[UUID], Optional[date], Optional[date]]:
+        """Apply role-based restrictions to the listing filters."""
+        if current_user.role == UserRole.DENTIST:
+            dentist_id = current_user.id
+        elif current_user.role == UserRole.RECEPTIONIST and not (dentist_id or patient_id):
+            # Receptionist can see all, but we might want to limit the date range
+            if not start_date:
+                start_date = date.today()
+            if not end_date:
+                end_date = start_date + timedelta(days=30)
+        return dentist_id, start_date, end_date
     
     async def check_availability(
         self,
@@ -341,26 +462,39 @@ class AppointmentService:
     async def get_upcoming_appointments(
         self,
         current_user: User,
-        days_ahead: int = 7
+        dentist_id: Optional[UUID] = None,
+        days_ahead: int = 7,
+        limit: int = 50
     ) -> List[AppointmentDetailResponse]:
         """
-        Get upcoming appointments for current user.
+        Get upcoming appointments, optionally for a single dentist.
+        
+        Dentists only ever see their own agenda.
         
         Args:
             current_user: Current logged-in user
+            dentist_id: Filter by dentist
             days_ahead: Number of days to look ahead
+            limit: Maximum number of appointments to return
             
         Returns:
             List of upcoming appointments
+            
+        Raises:
+            AuthorizationError: If a dentist asks for another dentist's agenda
         """
-        dentist_id = current_user.id if current_user.role == UserRole.DENTIST else None
+        if current_user.role == UserRole.DENTIST:
+            if dentist_id and dentist_id != current_user.id:
+                raise AuthorizationError("Solo puede ver sus propias citas")
+            dentist_id = current_user.id
         
         appointments = await self.repository.get_upcoming_appointments(
             dentist_id=dentist_id,
-            days_ahead=days_ahead
+            days_ahead=days_ahead,
+            limit=limit
         )
         
-        return [self._build_detailed_response(apt) for apt in appointments]
+        return _DETAILED_LIST_ADAPTER.validate_python(appointments, from_attributes=True)
     
     async def _create_automatic_reminders(self, appointment: Appointment) -> None:
         """
@@ -369,32 +503,32 @@ class AppointmentService:
         Creates:
         - Email reminder 24 hours before
         - SMS reminder 2 hours before (if configured)
-        """
-        # Email reminder 24 hours before
-        email_reminder_time = appointment.scheduled_time - timedelta(hours=24)
-        if email_reminder_time > datetime.now(appointment.scheduled_time.tzinfo):
-            email_reminder = AppointmentReminder(
-                appointment_id=appointment.id,
-                reminder_type=ReminderType.EMAIL,
-                scheduled_for=email_reminder_time
-            )
-            self.session.add(email_reminder)
-        
-        # SMS reminder 2 hours before (optional)
-        sms_reminder_time = appointment.scheduled_time - timedelta(hours=2)
-        if sms_reminder_time > datetime.now(appointment.scheduled_time.tzinfo):
-            sms_reminder = AppointmentReminder(
-                appointment_id=appointment.id,
-                reminder_type=ReminderType.SMS,
-                scheduled_for=sms_reminder_time
-            )
-            self.session.add(sms_reminder)
         
-        await self.session.commit()
+        Reminders are written with a single multi-row INSERT and are not
+        committed here; the caller owns the transaction.
+        """
+        now = datetime.now(appointment.scheduled_time.tzinfo)
+        reminders = [
+            # Email reminder 24 hours before
+            (ReminderType.EMAIL, appointment.scheduled_time - timedelta(hours=24)),
+            # SMS reminder 2 hours before (optional)
+            (ReminderType.SMS, appointment.scheduled_time - timedelta(hours=2)),
+        ]
+        rows = [
+            {
+                "appointment_id": appointment.id,
+                "reminder_type": reminder_type,
+                "scheduled_for": scheduled_for
+            }
+            for reminder_type, scheduled_for in reminders
+            if scheduled_for > now
+        ]
+        if rows:
+            await self.session.execute(insert(AppointmentReminder), rows)
     
     def _check_appointment_access(self, appointment: Appointment, user: User) -> None:
         """Check if user has access to view appointment."""
-        if user.role == UserRole.ADMIN or user.role == UserRole.RECEPTIONIST:
+        if user.role in _STAFF_ROLES:
             return
         if user.role == UserRole.DENTIST and appointment.dentist_id == user.id:
             return
@@ -402,12 +536,25 @@ class AppointmentService:
     
     def _check_appointment_modification_access(self, appointment: Appointment, user: User) -> None:
         """Check if user has access to modify appointment."""
-        if user.role == UserRole.ADMIN or user.role == UserRole.RECEPTIONIST:
+        if user.role in _STAFF_ROLES:
             return
         if user.role == UserRole.DENTIST and appointment.dentist_id == user.id:
             return
         raise AuthorizationError("You don't have permission to modify this appointment")
     
+    def _modification_scope(self, user: User) -> Optional[UUID]:
+        """
+        Dentist filter to apply to conditional writes made by ``user``.
+        
+        Returns None for roles that may modify any appointment, the user's own
+        ID for dentists, and raises for everyone else.
+        """
+        if user.role in _STAFF_ROLES:
+            return None
+        if user.role == UserRole.DENTIST:
+            return user.id
+        raise AuthorizationError("You don't have permission to modify this appointment")
+    
     def _validate_status_transition(self, appointment: Appointment, new_status: AppointmentStatus) -> None:
         """
         Validate status transition according to business rules.
@@ -419,26 +566,8 @@ class AppointmentService:
         """
         current_status = appointment.status
         
-        # Define valid transitions
-        valid_transitions = {
-            AppointmentStatus.SCHEDULED: [
-                AppointmentStatus.CONFIRMED,
-                AppointmentStatus.CANCELLED,
-                AppointmentStatus.NO_SHOW
-            ],
-            AppointmentStatus.CONFIRMED: [
-                AppointmentStatus.IN_PROGRESS,
-                AppointmentStatus.CANCELLED,
-                AppointmentStatus.NO_SHOW
-            ],
-            AppointmentStatus.IN_PROGRESS: [
-                AppointmentStatus.COMPLETED
-            ]
-        }
-        
         # Check if transition is valid
-        allowed_statuses = valid_transitions.get(current_status, [])
-        if new_status not in allowed_statuses:
+        if new_status not in _VALID_TRANSITIONS.get(current_status, frozenset()):
             raise ValidationError(
                 f"Invalid status transition from {current_status.value} to {new_status.value}"
             )
@@ -452,33 +581,12 @@ class AppointmentService:
         - Saturday: 8:00-13:00
         - Sunday: Closed
         """
-        weekday = scheduled_time.weekday()
-        hour = scheduled_time.hour
-        
-        # Sunday (6) - Closed
-        if weekday == 6:
-            return False
-        
-        # Saturday (5) - 8:00-13:00
-        if weekday == 5:
-            return 8 <= hour < 13
-        
-        # Monday-Friday (0-4) - 8:00-18:00
-        return 8 <= hour < 18
+        hours = _BUSINESS_HOURS[scheduled_time.weekday()]
+        return hours is not None and hours[0] <= scheduled_time.hour < hours[1]
     
     def _build_detailed_response(self, appointment: Appointment) -> AppointmentDetailResponse:
         """Build detailed appointment response with related entity information."""
-        response_data = AppointmentResponse.model_validate(appointment).model_dump()
-        
-        # Add related entity information
-        if appointment.patient:
-            response_data['patient_name'] = appointment.patient.full_name
-            response_data['patient_phone'] = appointment.patient.phone
-        
-        if appointment.dentist:
-            response_data['dentist_name'] = appointment.dentist.full_name
-        
-        return AppointmentDetailResponse(**response_data)
+        return AppointmentDetailResponse.model_validate(appointment)
     
     async def get_appointment_stats(
         self,
@@ -501,85 +609,24 @@ class AppointmentService:
             AuthorizationError: If user doesn't have permission
         """
         # Only ADMIN and RECEPTIONIST can view stats
-        if current_user.role not in [UserRole.ADMIN, UserRole.RECEPTIONIST]:
+        if current_user.role not in _STAFF_ROLES:
             raise AuthorizationError("No tiene permiso para ver estadísticas")
         
-        # Get all appointments in date range
-        appointments, total = await self.repository.list_appointments(
-            start_date=start_date,
-            end_date=end_date,
-            skip=0,
-            limit=10000  # Get all for stats
-        )
-        
-        # Calculate stats
-        by_status = {}
-        unique_patients = set()
-        completed_count = 0
-        no_show_count = 0
-        upcoming_count = 0
-        now = datetime.now()
-        
-        for apt in appointments:
-            # Count by status
-            status_key = apt.status.value
-            by_status[status_key] = by_status.get(status_key, 0) + 1
-            
-            # Track unique patients
-            unique_patients.add(apt.patient_id)
-            
-            # Count completed and no-show
-            if apt.status == AppointmentStatus.COMPLETED:
-                completed_count += 1
-            elif apt.status == AppointmentStatus.NO_SHOW:
-                no_show_count += 1
-            
-            # Count upcoming (future appointments that aren't cancelled/completed/no_show)
-            if (apt.scheduled_time > now and 
-                apt.status not in [AppointmentStatus.COMPLETED, AppointmentStatus.CANCELLED, AppointmentStatus.NO_SHOW]):
-                upcoming_count += 1
+        stats = await self.repository.get_stats(start_date=start_date, end_date=end_date)
+        by_status = stats["by_status"]
         
         # Calculate rates
+        completed_count = by_status.get(AppointmentStatus.COMPLETED.value, 0)
+        no_show_count = by_status.get(AppointmentStatus.NO_SHOW.value, 0)
         total_finished = completed_count + no_show_count
         completion_rate = (completed_count / total_finished * 100) if total_finished > 0 else 0
         no_show_rate = (no_show_count / total_finished * 100) if total_finished > 0 else 0
         
         return {
-            "total_appointments": total,
+            "total_appointments": sum(by_status.values()),
             "by_status": by_status,
-            "upcoming_count": upcoming_count,
+            "upcoming_count": stats["upcoming_count"],
             "completion_rate": round(completion_rate, 2),
             "no_show_rate": round(no_show_rate, 2),
-            "total_patients": len(unique_patients)
+            "total_patients": stats["total_patients"]
         }
-    
-    async def get_upcoming_appointments(
-        self,
-        dentist_id: UUID,
-        limit: int,
-        current_user: User
-    ) -> List[Appointment]:
-        """
-        Get upcoming appointments for a specific dentist.
-        
-        Args:
-            dentist_id: ID of the dentist
-            limit: Maximum number of appointments to return
-            current_user: User making the request
-            
-        Returns:
-            List of upcoming appointments
-            
-        Raises:
-            AuthorizationError: If user doesn't have permission
-        """
-        # Only dentists can see their own upcoming appointments
-        if current_user.role == UserRole.DENTIST and current_user.id != dentist_id:
-            raise AuthorizationError("Solo puede ver sus propias citas")
-        
-        return await self.repository.get_upcoming_appointments(
-            dentist_id=dentist_id,
-            limit=limit
-        )
-
-
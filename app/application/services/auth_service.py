@@ -2,19 +2,34 @@
 Authentication service for the OdontoLab system.
 """
 
-from datetime import timedelta
 from typing import Optional
 from uuid import UUID
 
 from app.domain.models import User, UserRole
 from app.domain.schemas.auth_schemas import Token, LoginResponse, UserMeResponse
 from app.insfraestructure.repositories import UserRepository
-from app.application.exceptions import AuthenticationError, AuthorizationError
-from app.core.security import verify_password, create_access_token
+from app.application.exceptions import AuthorizationError, raise_invalid_credentials, raise_inactive_user
+from app.core.security import (
+    verify_password_async,
+    verify_dummy_password_async,
+    password_needs_rehash,
+    create_access_token,
+)
 from app.core.config import get_settings
 
 settings = get_settings()
 
+# Conjuntos de roles precalculados para las comprobaciones de permisos
+_ADMIN_ROLES = frozenset({UserRole.ADMIN})
+_DENTIST_ROLES = frozenset({UserRole.DENTIST})
+_RECEPTIONIST_ROLES = frozenset({UserRole.RECEPTIONIST})
+
+
+def _require(user: User, allowed: frozenset, message: str) -> None:
+    """Raise AuthorizationError unless the user's role is in ``allowed``."""
+    if user.role not in allowed:
+        raise AuthorizationError(message)
+
 
 class AuthService:
     """Authentication service for handling user authentication and authorization."""
@@ -25,45 +40,56 @@ class AuthService:
     
     async def authenticate_user(self, email: str, password: str) -> User:
         """Authenticate a user with email and password."""
-        user = await self.user_repository.get_by_email(email)
+        user = await self.user_repository.get_by_identifier(email)
         if not user:
-            raise AuthenticationError("Invalid email or password")
+            # Mismo coste que una contraseña incorrecta: no revela qué emails existen
+            await verify_dummy_password_async()
+            raise_invalid_credentials()
         
-        if not verify_password(password, user.hashed_password):
-            raise AuthenticationError("Invalid email or password")
+        if not await verify_password_async(password, user.hashed_password):
+            raise_invalid_credentials()
         
         if not user.is_active:
-            raise AuthenticationError("User account is inactive")
+            raise_inactive_user()
+        
+        # Actualiza de forma transparente los hashes creados con otro coste
+        if password_needs_rehash(user.hashed_password):
+            user = await self.user_repository.update(user.id, {"password": password}) or user
         
         return user
     
-    async def create_user_token(self, user: User) -> Token:
-        """Create a JWT access token for a user."""
-        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    def create_user_token(self, user: User) -> Token:
+        """Create a JWT access token for a user (CPU only, no I/O)."""
         access_token = create_access_token(
             data={
-                "sub": str(user.id),
+                "sub": user.sub,
                 "email": user.email,
                 "role": user.role.value
-            },
-            expires_delta=access_token_expires
+            }
         )
         
-        return Token(
+        # Valores ya tipados: no hace falta validarlos otra vez
+        return Token.model_construct(
             access_token=access_token,
             token_type="bearer"
         )
     
     async def login(self, email: str, password: str) -> LoginResponse:
-        """Login a user and return token with user information."""
+        """
+        Login a user and return token with user information.
+        
+        The response is built with ``model_construct``: every value comes from
+        the authenticated user row or the token just signed, so pydantic
+        validation would only repeat work.
+        """
         user = await self.authenticate_user(email, password)
-        token = await self.create_user_token(user)
+        token = self.create_user_token(user)
         
-        return LoginResponse(
+        return LoginResponse.model_construct(
             access_token=token.access_token,
             token_type=token.token_type,
             user={
-                "id": str(user.id),
+                "id": user.sub,
                 "email": user.email,
                 "first_name": user.first_name,
                 "last_name": user.last_name,
@@ -74,20 +100,14 @@ class AuthService:
             }
         )
     
-    async def require_admin(self, user: User) -> bool:
+    def require_admin(self, user: User) -> None:
         """Check if user has admin role."""
-        if user.role != UserRole.ADMIN:
-            raise AuthorizationError("Administrator privileges required")
-        return True
+        _require(user, _ADMIN_ROLES, "Administrator privileges required")
     
-    async def require_dentist(self, user: User) -> bool:
+    def require_dentist(self, user: User) -> None:
         """Check if user has dentist role."""
-        if user.role != UserRole.DENTIST:
-            raise AuthorizationError("Dentist privileges required")
-        return True
+        _require(user, _DENTIST_ROLES, "Dentist privileges required")
     
-    async def require_receptionist(self, user: User) -> bool:
+    def require_receptionist(self, user: User) -> None:
         """Check if user has receptionist role."""
-        if user.role != UserRole.RECEPTIONIST:
-            raise AuthorizationError("Receptionist privileges required")
-        return True
+        _require(user, _RECEPTIONIST_ROLES, "Receptionist privileges required")
@@ -11,6 +11,11 @@ from app.domain.models import ContactRequest, User, UserRole, ContactStatus
 from app.domain.schemas.contact_schemas import ContactRequestCreate
 from app.insfraestructure.repositories import ContactRequestRepository
 from app.application.exceptions import NotFoundError, PermissionError
+from app.application.dashboard_cache import dashboard_cache
+from app.application.permissions import require_roles
+
+# Roles que gestionan las solicitudes de contacto
+_STAFF_ROLES = frozenset({UserRole.ADMIN, UserRole.RECEPTIONIST})
 
 
 class ContactService:
@@ -25,19 +30,18 @@ class ContactService:
         contact_data: ContactRequestCreate
     ) -> ContactRequest:
         """Create a new contact request (Public endpoint - no auth required)."""
-        contact_dict = contact_data.model_dump()
+        contact_dict = contact_data.model_dump(exclude_unset=True)
         contact = await self.contact_repository.create(contact_dict)
+        dashboard_cache.invalidate(UserRole.ADMIN, UserRole.RECEPTIONIST)
         return contact
     
+    @require_roles(*_STAFF_ROLES, message="You don't have permission to view contact requests")
     async def get_contact_request_by_id(
         self,
         contact_id: UUID,
         current_user: User
     ) -> ContactRequest:
         """Get contact request by ID (Admin and Receptionist only)."""
-        if current_user.role not in [UserRole.ADMIN, UserRole.RECEPTIONIST]:
-            raise PermissionError("You don't have permission to view contact requests")
-        
         contact = await self.contact_repository.get_by_id(contact_id)
         if not contact:
             raise NotFoundError("Contact request not found")
@@ -45,34 +49,39 @@ class ContactService:
     
     async def get_all_contact_requests(
         self,
-        page: int = 1,
+        page: Optional[int] = None,
         per_page: int = 10,
         status: Optional[ContactStatus] = None,
-        current_user: User = None
-    ) -> tuple[list[ContactRequest], int]:
-        """Get all contact requests with pagination and filters."""
-        if current_user and current_user.role not in [UserRole.ADMIN, UserRole.RECEPTIONIST]:
+        current_user: User = None,
+        cursor: Optional[str] = None
+    ) -> tuple[list[ContactRequest], Optional[int], Optional[str]]:
+        """
+        Get contact requests with cursor pagination and filters.
+        
+        ``page`` is the deprecated offset pagination, limited to shallow pages;
+        the total is only computed for the first page.
+        """
+        if current_user and current_user.role not in _STAFF_ROLES:
             raise PermissionError("You don't have permission to view contact requests")
         
-        skip = (page - 1) * per_page
-        contacts, total = await self.contact_repository.get_all(
-            skip=skip,
+        return await self.contact_repository.get_all(
+            skip=(page - 1) * per_page if page is not None else None,
             limit=per_page,
-            status=status
+            status=status,
+            cursor=cursor,
+            include_total=cursor is None
         )
-        return contacts, total
     
+    @require_roles(*_STAFF_ROLES, message="You don't have permission to view contact requests")
     async def get_pending_contact_requests(
         self,
         current_user: User
     ) -> list[ContactRequest]:
         """Get all pending contact requests."""
-        if current_user.role not in [UserRole.ADMIN, UserRole.RECEPTIONIST]:
-            raise PermissionError("You don't have permission to view contact requests")
-        
         contacts = await self.contact_repository.get_pending()
         return contacts
     
+    @require_roles(*_STAFF_ROLES, message="You don't have permission to update contact requests")
     async def update_contact_status(
         self,
         contact_id: UUID,
@@ -80,30 +89,24 @@ class ContactService:
         current_user: User
     ) -> ContactRequest:
         """Update contact request status (Admin and Receptionist only)."""
-        if current_user.role not in [UserRole.ADMIN, UserRole.RECEPTIONIST]:
-            raise PermissionError("You don't have permission to update contact requests")
-        
-        # Check if contact exists
-        contact = await self.contact_repository.get_by_id(contact_id)
-        if not contact:
-            raise NotFoundError("Contact request not found")
-        
-        # Update status
+        # Existence is decided by the UPDATE itself
         updated_contact = await self.contact_repository.update_status(contact_id, status)
+        if not updated_contact:
+            raise NotFoundError("Contact request not found")
+        dashboard_cache.invalidate(UserRole.ADMIN, UserRole.RECEPTIONIST)
         return updated_contact
     
+    @require_roles(UserRole.ADMIN, message="Only administrators can delete contact requests")
     async def delete_contact_request(
         self,
         contact_id: UUID,
         current_user: User
     ) -> bool:
         """Delete a contact request (Admin only)."""
-        if current_user.role != UserRole.ADMIN:
-            raise PermissionError("Only administrators can delete contact requests")
-        
         success = await self.contact_repository.delete(contact_id)
         if not success:
             raise NotFoundError("Contact request not found")
+        dashboard_cache.invalidate(UserRole.ADMIN, UserRole.RECEPTIONIST)
         return success
     
     async def count_contact_requests_by_status(
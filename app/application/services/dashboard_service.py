@@ -4,137 +4,124 @@ Dashboard service for the OdontoLab system.
 This module provides business logic for dashboard statistics.
 """
 
+import asyncio
+from typing import Awaitable, Callable, TypeVar
 from uuid import UUID
-from datetime import datetime, timedelta
 
-from app.domain.models import User, UserRole
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.database import AsyncSessionLocal
+from app.domain.models import User, UserRole, ContactStatus
 from app.domain.schemas.dashboard_schemas import (
     AdminDashboardStats,
     DentistDashboardStats,
     ReceptionistDashboardStats
 )
 from app.insfraestructure.repositories import (
-    UserRepository,
     PatientRepository,
     MedicalRecordRepository,
-    ContactRequestRepository
+    ContactRequestRepository,
+    DashboardRepository
 )
 from app.application.exceptions import PermissionError
+from app.application.dashboard_cache import cached_stats, admin_metrics
+
+T = TypeVar("T")
+
+
+async def fetch_admin_counters(session_factory: async_sessionmaker = AsyncSessionLocal) -> dict:
+    """
+    Compute the admin dashboard counters on a short-lived session.
+    
+    Used as the refresh function of ``admin_metrics``.
+    """
+    async with session_factory() as session:
+        return await DashboardRepository(session).fetch_admin_counters(days=30)
 
 
 class DashboardService:
-    """Service for dashboard statistics operations."""
+    """
+    Service for dashboard statistics operations.
     
-    def __init__(
-        self,
-        user_repository: UserRepository,
-        patient_repository: PatientRepository,
-        medical_record_repository: MedicalRecordRepository,
-        contact_repository: ContactRequestRepository
-    ):
-        """Initialize the dashboard service."""
-        self.user_repository = user_repository
-        self.patient_repository = patient_repository
-        self.medical_record_repository = medical_record_repository
-        self.contact_repository = contact_repository
+    The service holds no session: every read builds its repository on a
+    short-lived pooled session, so one instance can serve every request.
+    """
     
-    async def get_admin_dashboard_stats(self) -> AdminDashboardStats:
-        """Get dashboard statistics for administrators."""
-        # Get user counts
-        total_users = await self.user_repository.count_active_users()
-        total_dentists = await self.user_repository.count_by_role(UserRole.DENTIST)
-        total_receptionists = await self.user_repository.count_by_role(UserRole.RECEPTIONIST)
+    def __init__(self, session_factory: async_sessionmaker = AsyncSessionLocal):
+        """
+        Initialize the dashboard service.
         
-        # Get patient counts
-        total_patients = await self.patient_repository.count()
-        recent_patients = await self.patient_repository.count_recent(days=30)
-        
-        # Get medical record counts
-        total_records = await self.medical_record_repository.count()
-        recent_records = await self.medical_record_repository.count_recent(days=30)
-        
-        # Get contact request counts
-        total_contacts = await self.contact_repository.count()
-        pending_contacts = await self.contact_repository.count_by_status("pending")
+        Args:
+            session_factory: Factory for the short-lived sessions the
+                statistics queries run on
+        """
+        self.session_factory = session_factory
+    
+    async def _read(self, query: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """
+        Run one repository read on its own pooled session.
         
-        # Get upcoming appointments
-        upcoming_appointments = await self.medical_record_repository.get_upcoming_appointments()
-        upcoming_appointments_count = len(upcoming_appointments)
+        AsyncSession does not support concurrent queries, so every read that
+        goes through ``asyncio.gather`` gets a session of its own.
         
-        return AdminDashboardStats(
-            total_users=total_users,
-            total_dentists=total_dentists,
-            total_receptionists=total_receptionists,
-            total_patients=total_patients,
-            recent_patients=recent_patients,
-            total_medical_records=total_records,
-            recent_medical_records=recent_records,
-            pending_contact_requests=pending_contacts,
-            total_contact_requests=total_contacts,
-            upcoming_appointments=upcoming_appointments_count
-        )
+        Args:
+            query: Builds the repository on the given session and runs the read,
+                e.g. ``lambda s: PatientRepository(s).count_recent(days=30)``
+        """
+        async with self.session_factory() as session:
+            return await query(session)
+    
+    async def get_admin_dashboard_stats(self) -> AdminDashboardStats:
+        """Get dashboard statistics for administrators."""
+        # Snapshot recalculado en segundo plano; sin él, una sola consulta con todos los contadores
+        counters = admin_metrics.snapshot
+        if counters is None:
+            counters = await fetch_admin_counters(self.session_factory)
+        return AdminDashboardStats(**counters)
     
+    @cached_stats(UserRole.DENTIST)
     async def get_dentist_dashboard_stats(self, dentist_id: UUID) -> DentistDashboardStats:
         """Get dashboard statistics for dentists."""
-        # Get patient count (unique patients treated)
-        total_patients = await self.medical_record_repository.count_unique_patients_by_dentist(dentist_id)
-        
-        # Get medical record counts
-        records, total_records = await self.medical_record_repository.get_by_dentist(
-            dentist_id=dentist_id,
-            skip=0,
-            limit=1000000  # Get all to count
-        )
-        
-        # Get recent records
-        recent_records = await self.medical_record_repository.count_recent_by_dentist(
-            dentist_id,
-            days=30
-        )
-        
-        # Get upcoming appointments for this dentist
-        upcoming_appointments = await self.medical_record_repository.get_upcoming_appointments(
-            dentist_id=dentist_id
-        )
-        upcoming_appointments_count = len(upcoming_appointments)
-        
-        # Calculate today's appointments
-        today = datetime.now().date()
-        today_appointments = sum(
-            1 for appt in upcoming_appointments 
-            if appt.next_appointment and appt.next_appointment.date() == today
+        (
+            total_patients,
+            total_records,
+            recent_records,
+            (upcoming_appointments, today_appointments),
+        ) = await asyncio.gather(
+            # Unique patients treated
+            self._read(lambda s: MedicalRecordRepository(s).count_unique_patients_by_dentist(dentist_id)),
+            self._read(lambda s: MedicalRecordRepository(s).count_by_dentist(dentist_id)),
+            self._read(lambda s: MedicalRecordRepository(s).count_recent_by_dentist(dentist_id, days=30)),
+            self._read(lambda s: MedicalRecordRepository(s).count_upcoming_and_today_appointments(dentist_id)),
         )
         
         return DentistDashboardStats(
             total_patients=total_patients,
             total_medical_records=total_records,
             recent_medical_records=recent_records,
-            upcoming_appointments=upcoming_appointments_count,
+            upcoming_appointments=upcoming_appointments,
             today_appointments=today_appointments
         )
     
+    @cached_stats(UserRole.RECEPTIONIST)
     async def get_receptionist_dashboard_stats(
         self,
         receptionist_id: UUID
     ) -> ReceptionistDashboardStats:
         """Get dashboard statistics for receptionists."""
-        # Get patient counts created by this receptionist
-        total_patients = await self.patient_repository.count_by_creator(receptionist_id)
-        recent_patients = await self.patient_repository.count_recent(days=30)
-        
-        # Get contact request counts (all, as they manage these)
-        total_contacts = await self.contact_repository.count()
-        pending_contacts = await self.contact_repository.count_by_status("pending")
-        
-        # Get upcoming appointments (all)
-        upcoming_appointments = await self.medical_record_repository.get_upcoming_appointments()
-        upcoming_appointments_count = len(upcoming_appointments)
-        
-        # Calculate today's appointments
-        today = datetime.now().date()
-        today_appointments = sum(
-            1 for appt in upcoming_appointments 
-            if appt.next_appointment and appt.next_appointment.date() == today
+        # Patients created by this receptionist; contacts and appointments are global
+        (
+            total_patients,
+            recent_patients,
+            total_contacts,
+            pending_contacts,
+            (upcoming_appointments, today_appointments),
+        ) = await asyncio.gather(
+            self._read(lambda s: PatientRepository(s).count_by_creator(receptionist_id)),
+            self._read(lambda s: PatientRepository(s).count_recent(days=30)),
+            self._read(lambda s: ContactRequestRepository(s).count_all()),
+            self._read(lambda s: ContactRequestRepository(s).count_by_status(ContactStatus.PENDING)),
+            self._read(lambda s: MedicalRecordRepository(s).count_upcoming_and_today_appointments()),
         )
         
         return ReceptionistDashboardStats(
@@ -142,7 +129,7 @@ class DashboardService:
             recent_patients=recent_patients,
             pending_contact_requests=pending_contacts,
             total_contact_requests=total_contacts,
-            upcoming_appointments=upcoming_appointments_count,
+            upcoming_appointments=upcoming_appointments,
             today_appointments=today_appointments
         )
     
@@ -11,7 +11,9 @@ from datetime import datetime
 from app.domain.models import MedicalRecord, User, UserRole
 from app.domain.schemas.medical_record_schemas import MedicalRecordCreate, MedicalRecordUpdate
 from app.insfraestructure.repositories import MedicalRecordRepository, PatientRepository
-from app.application.exceptions import NotFoundError, ValidationError, PermissionError
+from app.application.exceptions import NotFoundError, ValidationError, PermissionError, raise_patient_not_found
+from app.application.dashboard_cache import dashboard_cache
+from app.application.permissions import require_roles
 
 
 class MedicalRecordService:
@@ -36,14 +38,15 @@ class MedicalRecordService:
             raise PermissionError("Only dentists can create medical records")
         
         # Verify patient exists
-        patient = await self.patient_repository.get_by_id(record_data.patient_id)
-        if not patient:
-            raise NotFoundError("Patient not found")
+        if not await self.patient_repository.exists(record_data.patient_id):
+            raise_patient_not_found()
         
         # Create medical record
-        record_dict = record_data.model_dump()
-        record_dict['dentist_id'] = current_user.id
-        record = await self.medical_record_repository.create(record_dict)
+        record = await self.medical_record_repository.create_from_schema(
+            record_data,
+            dentist_id=current_user.id
+        )
+        dashboard_cache.invalidate()
         return record
     
     async def get_medical_record_by_id(
@@ -52,41 +55,48 @@ class MedicalRecordService:
         current_user: User
     ) -> MedicalRecord:
         """Get medical record by ID."""
-        record = await self.medical_record_repository.get_by_id(record_id)
-        if not record:
-            raise NotFoundError("Medical record not found")
+        # Dentists can only view their own records
+        dentist_id = current_user.id if current_user.role == UserRole.DENTIST else None
         
-        # Dentists can only view their own records (unless admin)
-        if (current_user.role == UserRole.DENTIST and 
-            record.dentist_id != current_user.id and
-            current_user.role != UserRole.ADMIN):
+        record = await self.medical_record_repository.get_by_id_for_user(record_id, dentist_id=dentist_id)
+        if record is None:
+            # Sin filas: distinguir historia inexistente de falta de permisos
+            if dentist_id is None or not await self.medical_record_repository.exists(record_id):
+                raise NotFoundError("Medical record not found")
             raise PermissionError("You don't have permission to view this medical record")
         
         return record
     
     async def get_all_medical_records(
         self,
-        page: int = 1,
+        page: Optional[int] = None,
         per_page: int = 10,
-        current_user: User = None
-    ) -> tuple[list[MedicalRecord], int]:
-        """Get all medical records with pagination."""
-        skip = (page - 1) * per_page
+        current_user: User = None,
+        cursor: Optional[str] = None
+    ) -> tuple[list[MedicalRecord], Optional[int], Optional[str]]:
+        """
+        Get medical records with cursor pagination.
+        
+        ``page`` is the deprecated offset pagination, limited to shallow pages;
+        the total is only computed for the first page.
+        """
+        skip = (page - 1) * per_page if page is not None else None
         
         # Dentists can only see their own records
         if current_user and current_user.role == UserRole.DENTIST:
-            records, total = await self.medical_record_repository.get_by_dentist(
+            return await self.medical_record_repository.get_by_dentist(
                 dentist_id=current_user.id,
                 skip=skip,
-                limit=per_page
+                limit=per_page,
+                cursor=cursor,
+                include_total=cursor is None
             )
-        else:
-            records, total = await self.medical_record_repository.get_all(
-                skip=skip,
-                limit=per_page
-            )
-        
-        return records, total
+        return await self.medical_record_repository.get_all(
+            skip=skip,
+            limit=per_page,
+            cursor=cursor,
+            include_total=cursor is None
+        )
     
     async def get_records_by_patient(
         self,
@@ -97,7 +107,7 @@ class MedicalRecordService:
         # Verify patient exists
         patient = await self.patient_repository.get_by_id(patient_id)
         if not patient:
-            raise NotFoundError("Patient not found")
+            raise_patient_not_found()
         
         # Receptionists can only view records for patients they created
         if current_user.role == UserRole.RECEPTIONIST and patient.created_by != current_user.id:
@@ -113,36 +123,34 @@ class MedicalRecordService:
         current_user: User
     ) -> MedicalRecord:
         """Update medical record (Only by the dentist who created it or admin)."""
-        # Check if record exists
-        record = await self.medical_record_repository.get_by_id(record_id)
-        if not record:
-            raise NotFoundError("Medical record not found")
-        
-        # Only the dentist who created it or admin can update
-        if (current_user.role == UserRole.DENTIST and 
-            record.dentist_id != current_user.id):
-            raise PermissionError("You can only update your own medical records")
-        
         if current_user.role == UserRole.RECEPTIONIST:
             raise PermissionError("Receptionists cannot update medical records")
         
-        # Update record
+        # Dentists can only update their own records
+        dentist_id = current_user.id if current_user.role == UserRole.DENTIST else None
+        
         record_dict = record_data.model_dump(exclude_unset=True)
-        updated_record = await self.medical_record_repository.update(record_id, record_dict)
+        updated_record = await self.medical_record_repository.update(record_id, record_dict, dentist_id=dentist_id)
+        if updated_record is None:
+            # Sin filas: distinguir historia inexistente de falta de permisos
+            if dentist_id is None or not await self.medical_record_repository.exists(record_id):
+                raise NotFoundError("Medical record not found")
+            raise PermissionError("You can only update your own medical records")
+        # next_appointment feeds the upcoming-appointment counts
+        dashboard_cache.invalidate()
         return updated_record
     
+    @require_roles(UserRole.ADMIN, message="Only administrators can delete medical records")
     async def delete_medical_record(
         self,
         record_id: UUID,
         current_user: User
     ) -> bool:
         """Delete a medical record (Admin only)."""
-        if current_user.role != UserRole.ADMIN:
-            raise PermissionError("Only administrators can delete medical records")
-        
         success = await self.medical_record_repository.delete(record_id)
         if not success:
             raise NotFoundError("Medical record not found")
+        dashboard_cache.invalidate()
         return success
     
     async def get_upcoming_appointments(
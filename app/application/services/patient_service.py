@@ -11,7 +11,14 @@ from datetime import datetime
 from app.domain.models import Patient, User, UserRole
 from app.domain.schemas.patient_schemas import PatientCreate, PatientUpdate
 from app.insfraestructure.repositories import PatientRepository
-from app.application.exceptions import NotFoundError, ValidationError, PermissionError
+from app.application.exceptions import (
+    ValidationError,
+    PermissionError,
+    PatientAlreadyExistsError,
+    raise_patient_not_found,
+)
+from app.application.dashboard_cache import dashboard_cache
+from app.application.permissions import require_roles
 
 
 class PatientService:
@@ -23,46 +30,53 @@ class PatientService:
     
     async def create_patient(self, patient_data: PatientCreate, current_user: User) -> Patient:
         """Create a new patient."""
-        patient_dict = patient_data.model_dump()
-        patient_dict['created_by'] = current_user.id
-        patient = await self.patient_repository.create(patient_dict)
+        patient_dict = patient_data.model_dump(exclude_unset=True)
+        patient = await self.patient_repository.create_if_not_exists(patient_dict, created_by=current_user.id)
+        if patient is None:
+            raise PatientAlreadyExistsError(
+                f"Patient with number {patient_dict.get('patient_number')} already exists"
+            )
+        dashboard_cache.invalidate(UserRole.ADMIN, UserRole.RECEPTIONIST)
         return patient
     
     async def get_patient_by_id(self, patient_id: UUID, current_user: User) -> Patient:
         """Get patient by ID."""
-        patient = await self.patient_repository.get_by_id(patient_id)
-        if not patient:
-            raise NotFoundError("Patient not found")
-        
         # Receptionists can only view patients they created
-        if current_user.role == UserRole.RECEPTIONIST and patient.created_by != current_user.id:
+        created_by = current_user.id if current_user.role == UserRole.RECEPTIONIST else None
+        
+        patient = await self.patient_repository.get_by_id_for_user(patient_id, created_by=created_by)
+        if patient is None:
+            # Sin filas: distinguir paciente inexistente de falta de permisos
+            if created_by is None or not await self.patient_repository.exists(patient_id):
+                raise_patient_not_found()
             raise PermissionError("You don't have permission to view this patient")
         
         return patient
     
     async def get_all_patients(
         self,
-        page: int = 1,
+        page: Optional[int] = None,
         per_page: int = 10,
-        current_user: User = None
-    ) -> tuple[list[Patient], int]:
-        """Get all patients with pagination."""
-        skip = (page - 1) * per_page
+        current_user: User = None,
+        include_total: bool = True,
+        cursor: Optional[str] = None
+    ) -> tuple[list[Patient], Optional[int], Optional[str]]:
+        """
+        Get patients with cursor pagination.
         
+        ``page`` is the deprecated offset pagination, limited to shallow pages;
+        the total is only computed for the first page.
+        """
         # Receptionists can only see patients they created
-        if current_user and current_user.role == UserRole.RECEPTIONIST:
-            patients, total = await self.patient_repository.get_by_creator(
-                creator_id=current_user.id,
-                skip=skip,
-                limit=per_page
-            )
-        else:
-            patients, total = await self.patient_repository.get_all(
-                skip=skip,
-                limit=per_page
-            )
+        creator_id = current_user.id if current_user and current_user.role == UserRole.RECEPTIONIST else None
         
-        return patients, total
+        return await self.patient_repository.get_all(
+            skip=(page - 1) * per_page if page is not None else None,
+            limit=per_page,
+            include_total=include_total and cursor is None,
+            cursor=cursor,
+            creator_id=creator_id
+        )
     
     async def search_patients(
         self,
@@ -92,28 +106,26 @@ class PatientService:
         current_user: User
     ) -> Patient:
         """Update patient information."""
-        # Check if patient exists
-        patient = await self.patient_repository.get_by_id(patient_id)
-        if not patient:
-            raise NotFoundError("Patient not found")
-        
         # Receptionists can only update patients they created
-        if current_user.role == UserRole.RECEPTIONIST and patient.created_by != current_user.id:
-            raise PermissionError("You don't have permission to update this patient")
+        created_by = current_user.id if current_user.role == UserRole.RECEPTIONIST else None
         
-        # Update patient
         patient_dict = patient_data.model_dump(exclude_unset=True)
-        updated_patient = await self.patient_repository.update(patient_id, patient_dict)
+        updated_patient = await self.patient_repository.update(patient_id, patient_dict, created_by=created_by)
+        if updated_patient is None:
+            # Sin filas: distinguir paciente inexistente de falta de permisos
+            if created_by is None or not await self.patient_repository.exists(patient_id):
+                raise_patient_not_found()
+            raise PermissionError("You don't have permission to update this patient")
         return updated_patient
     
+    @require_roles(UserRole.ADMIN, message="Only administrators can delete patients")
     async def delete_patient(self, patient_id: UUID, current_user: User) -> bool:
         """Delete a patient (Admin only)."""
-        if current_user.role != UserRole.ADMIN:
-            raise PermissionError("Only administrators can delete patients")
-        
         success = await self.patient_repository.delete(patient_id)
         if not success:
-            raise NotFoundError("Patient not found")
+            raise_patient_not_found()
+        # Cascades to medical records, which every dashboard counts
+        dashboard_cache.invalidate()
         return success
     
     async def count_recent_patients(self, days: int = 30) -> int:
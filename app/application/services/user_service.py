@@ -10,7 +10,8 @@ from uuid import UUID
 from app.domain.models import User, UserRole
 from app.domain.schemas.user_schemas import UserCreate, UserUpdate
 from app.insfraestructure.repositories import UserRepository
-from app.application.exceptions import NotFoundError, ValidationError
+from app.application.exceptions import NotFoundError, ValidationError, raise_user_not_found
+from app.application.dashboard_cache import dashboard_cache
 
 
 class UserService:
@@ -22,19 +23,18 @@ class UserService:
     
     async def create_user(self, user_data: UserCreate) -> User:
         """Create a new user (Admin only)."""
-        existing_user = await self.user_repository.get_by_email(user_data.email)
-        if existing_user:
+        # Email check and insert in a single statement
+        user = await self.user_repository.create_if_email_free(user_data.model_dump())
+        if user is None:
             raise ValidationError("Email already registered")
-        
-        user_dict = user_data.model_dump()
-        user = await self.user_repository.create(user_dict)
+        dashboard_cache.invalidate(UserRole.ADMIN)
         return user
     
     async def get_user_by_id(self, user_id: UUID) -> User:
         """Get user by ID."""
         user = await self.user_repository.get_by_id(user_id)
         if not user:
-            raise NotFoundError("User not found")
+            raise_user_not_found()
         return user
     
     async def get_all_users(
@@ -42,15 +42,17 @@ class UserService:
         page: int = 1,
         per_page: int = 10,
         role: Optional[UserRole] = None,
-        is_active: Optional[bool] = None
-    ) -> tuple[list[User], int]:
+        is_active: Optional[bool] = None,
+        include_total: bool = True
+    ) -> tuple[list[User], Optional[int]]:
         """Get all users with pagination and filters."""
         skip = (page - 1) * per_page
         users, total = await self.user_repository.get_all(
             skip=skip,
             limit=per_page,
             role=role,
-            is_active=is_active
+            is_active=is_active,
+            include_total=include_total
         )
         return users, total
     
@@ -62,60 +64,83 @@ class UserService:
         """Update user information."""
         user = await self.user_repository.get_by_id(user_id)
         if not user:
-            raise NotFoundError("User not found")
+            raise_user_not_found()
         
-        if user_data.email and user_data.email != user.email:
-            existing_user = await self.user_repository.get_by_email(user_data.email)
-            if existing_user:
+        if user_data.email and user_data.email.lower() != user.email.lower():
+            if await self.user_repository.exists_by_email(user_data.email):
                 raise ValidationError("Email already registered")
         
         user_dict = user_data.model_dump(exclude_unset=True)
+        # The RETURNING row is the response: no refetch after the UPDATE
         updated_user = await self.user_repository.update(user_id, user_dict)
+        if updated_user is None:
+            raise_user_not_found()
+        dashboard_cache.invalidate(UserRole.ADMIN)
         return updated_user
     
-    async def deactivate_user(self, user_id: UUID, current_user: Optional[User] = None) -> User:
+    async def _get_removable_user(self, user_id: UUID, current_user: Optional[User], action: str) -> User:
         """
-        Deactivate a user (soft delete).
+        Load a user that is about to be deactivated or deleted and check it may be.
         
         Args:
-            user_id: ID of user to deactivate
+            user_id: ID of the user to remove
             current_user: Current authenticated user
+            action: Verb used in the error messages ("deactivate" or "delete")
             
         Returns:
-            Deactivated user
+            User to remove
             
         Raises:
             NotFoundError: User not found
-            ValidationError: Cannot deactivate (last admin, self-deactivation)
+            ValidationError: Removing own account, or the last active administrator
         """
         # 1. Verificar que el usuario exista
-        user_to_deactivate = await self.user_repository.get_by_id(user_id)
-        if not user_to_deactivate:
+        user = await self.user_repository.get_by_id(user_id)
+        if not user:
             raise NotFoundError(f"User with ID {user_id} not found")
         
-        # 2. VALIDACIÓN: No permitir auto-desactivación
+        # 2. VALIDACIÓN: No permitir que un usuario se elimine o desactive a sí mismo
         if current_user and current_user.id == user_id:
             raise ValidationError(
-                "Cannot deactivate your own account. "
-                "Ask another administrator to deactivate your account if needed."
+                f"Cannot {action} your own account. "
+                f"Ask another administrator to {action} your account if needed."
             )
         
-        # 3. VALIDACIÓN: Si es admin, verificar que no sea el último activo
-        if user_to_deactivate.role == UserRole.ADMIN and user_to_deactivate.is_active:
-            active_admins = await self.user_repository.get_by_role(UserRole.ADMIN)
-            active_count = sum(1 for admin in active_admins if admin.is_active)
+        # 3. VALIDACIÓN: Si es admin activo, verificar que no sea el último
+        if user.role == UserRole.ADMIN and user.is_active:
+            active_count = await self.user_repository.count_by_role(UserRole.ADMIN, is_active=True)
             
             if active_count <= 1:
                 raise ValidationError(
-                    "Cannot deactivate the last active administrator. "
+                    f"Cannot {action} the last active administrator. "
                     "The system must have at least one active admin. "
-                    "Create another administrator first, then deactivate this one."
+                    f"Create another administrator first, then {action} this one."
                 )
         
-        # 4. Desactivar el usuario
+        return user
+    
+    async def deactivate_user(self, user_id: UUID, current_user: Optional[User] = None) -> User:
+        """
+        Deactivate a user (soft delete).
+        
+        Args:
+            user_id: ID of user to deactivate
+            current_user: Current authenticated user
+            
+        Returns:
+            Deactivated user
+            
+        Raises:
+            NotFoundError: User not found
+            ValidationError: Cannot deactivate (last admin, self-deactivation)
+        """
+        await self._get_removable_user(user_id, current_user, "deactivate")
+        
+        # Desactivar el usuario
         user = await self.user_repository.deactivate(user_id)
         if not user:
-            raise NotFoundError("User not found")
+            raise_user_not_found()
+        dashboard_cache.invalidate(UserRole.ADMIN)
         return user
     
     async def delete_user(self, user_id: UUID, current_user: Optional[User] = None) -> dict:
@@ -133,40 +158,16 @@ class UserService:
             NotFoundError: User not found
             ValidationError: Cannot delete (last admin, self-deletion, etc.)
         """
-        # 1. Verificar que el usuario a eliminar exista
-        user_to_delete = await self.user_repository.get_by_id(user_id)
-        if not user_to_delete:
-            raise NotFoundError(f"User with ID {user_id} not found")
-        
-        # 2. VALIDACIÓN: No permitir auto-eliminación
-        if current_user and current_user.id == user_id:
-            raise ValidationError(
-                "Cannot delete your own account. "
-                "Ask another administrator to delete your account if needed."
-            )
-        
-        # 3. VALIDACIÓN: Si es admin, verificar que no sea el último
-        if user_to_delete.role == UserRole.ADMIN:
-            active_admins_count = await self.user_repository.count_by_role(UserRole.ADMIN)
-            
-            # Contar solo los activos
-            active_admins = await self.user_repository.get_by_role(UserRole.ADMIN)
-            active_count = sum(1 for admin in active_admins if admin.is_active)
-            
-            if active_count <= 1:
-                raise ValidationError(
-                    "Cannot delete the last active administrator. "
-                    "The system must have at least one active admin. "
-                    "Create another administrator first, then delete this one."
-                )
+        user_to_delete = await self._get_removable_user(user_id, current_user, "delete")
         
-        # 4. Eliminar el usuario
+        # Eliminar el usuario
         success = await self.user_repository.delete(user_id)
         
         if not success:
             raise NotFoundError("User not found or already deleted")
+        dashboard_cache.invalidate(UserRole.ADMIN)
         
-        # 5. Retornar detalles de la eliminación
+        # Retornar detalles de la eliminación
         return {
             "success": True,
             "deleted_user": {
@@ -1,3 +1,4 @@
+from functools import cached_property, lru_cache
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 
@@ -9,20 +10,23 @@ class Settings(BaseSettings):
 
     #Database configuration
     DATABASE_URL: str = Field(..., description="Database connection URL")
+    DB_POOL_SIZE: int = Field(default=2, ge=1, description="Persistent connections kept in the pool")
+    DB_MAX_OVERFLOW: int = Field(default=0, ge=0, description="Extra connections opened under load")
 
     # JWT configuration
     SECRET_KEY: str = Field(..., min_length=32, description="JWT secret key")
     ALGORITHM: str = Field(default="HS256", description="JWT algorithm")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=60, description="JWT expiration time in minutes")
+    BCRYPT_ROUNDS: int = Field(default=12, ge=4, le=31, description="bcrypt cost factor for password hashes")
 
 
     #API configuration
     API_V1_STR: str = "/api/v1"
     CORS_ORIGINS: str = Field(default="http://localhost:3000,http://localhost:8000", description="Allowed CORS origins (comma separated)")
     
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
-        """Return CORS origins as a list."""
+        """Return CORS origins as a list (split once per settings instance)."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
     #Environment 
@@ -56,8 +60,10 @@ class Settings(BaseSettings):
             raise ValueError("SECRET_KEY must be at least 32 characters long")
         return v
     
+@lru_cache
 def get_settings() -> Settings:
     """Get application settings."""
     return Settings()
 
-settings = Settings()
+# Misma instancia que get_settings(): el .env se lee y valida una sola vez
+settings = get_settings()
@@ -1,5 +1,7 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncConnection, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
 
 DATABASE_URL = settings.DATABASE_URL
@@ -15,21 +17,33 @@ def get_database_url():
 DATABASE_URL = get_database_url()
 
 # Configuración optimizada para Render free tier
-# - pool_size: Número de conexiones permanentes (2 para free tier)
-# - max_overflow: Conexiones adicionales permitidas (0 para free tier)
+# - AsyncAdaptedQueuePool: pool de SQLAlchemy apto para asyncio (QueuePool se bloquea con asyncpg)
+# - pool_size: Número de conexiones permanentes (2 para free tier, DB_POOL_SIZE para más)
+# - max_overflow: Conexiones adicionales permitidas (0 para free tier, DB_MAX_OVERFLOW para más)
+#   Basta con 1: ninguna petición retiene una conexión mientras espera otra. La
+#   dependencia de autenticación devuelve la suya tras leer el usuario, las lecturas
+#   paralelas del dashboard usan una conexión cada una y esperan turno en el pool, y
+#   la exportación NDJSON de citas ocupa una conexión durante todo el stream, así que
+#   cada exportación en curso resta una a las peticiones concurrentes
 # - pool_pre_ping: Verifica conexiones antes de usar
-# - pool_recycle: Recicla conexiones cada hora para evitar timeouts
+# - pool_recycle: Recicla conexiones cada 30 minutos para evitar timeouts
+# - prepared_statement_cache_size / statement_cache_size: sentencias preparadas
+#   por conexión (SQLAlchemy y asyncpg), así los contadores del dashboard no se
+#   vuelven a analizar ni planificar en cada llamada
 engine = create_async_engine(
     DATABASE_URL,
     echo=False,
     future=True,
-    pool_size=2,
-    max_overflow=0,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
     pool_pre_ping=True,
-    pool_recycle=3600,
+    pool_recycle=1800,
     connect_args={
         "timeout": 30,
         "command_timeout": 30,
+        "prepared_statement_cache_size": 256,
+        "statement_cache_size": 256,
     }
 )
 
@@ -44,4 +58,45 @@ Base = declarative_base()
 # Dependency to get DB session
 async def get_db():
     async with AsyncSessionLocal() as session:
-        yield session
\ No newline at end of file
+        yield session
+
+
+async def find_missing_indexes(
+    conn: AsyncConnection,
+    required_indexes: tuple[tuple[str, str, bool], ...]
+) -> list[tuple[str, str, bool]]:
+    """
+    Check which of the required ``(table, key, unique)`` indexes are missing.
+    
+    ``key`` must match the index's leading key exactly as PostgreSQL renders
+    it, so an expression index such as ``lower((email)::text)`` is not
+    satisfied by a plain index on ``email``, and vice versa.
+    
+    Tables that do not exist yet are skipped: ``Base.metadata.create_all``
+    creates them together with the indexes declared on the models.
+    
+    Args:
+        conn (AsyncConnection): Open database connection
+        required_indexes (tuple): ``(table, key, unique)`` entries to check
+        
+    Returns:
+        list[tuple[str, str, bool]]: The entries with no matching index
+    """
+    missing = []
+    for table, key, unique in required_indexes:
+        if await conn.scalar(text("SELECT to_regclass(:table)"), {"table": table}) is None:
+            continue
+        
+        result = await conn.execute(
+            text(
+                "SELECT pg_get_indexdef(indexrelid, 1, false), indisunique "
+                "FROM pg_index WHERE indrelid = to_regclass(:table)"
+            ),
+            {"table": table}
+        )
+        if not any(
+            leading_key == key and (is_unique or not unique)
+            for leading_key, is_unique in result.all()
+        ):
+            missing.append((table, key, unique))
+    return missing
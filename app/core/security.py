@@ -1,15 +1,131 @@
-from passlib.context import CryptContext
-from datetime import datetime, timedelta, timezone
-from jose import jwt
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+import bcrypt
+from datetime import timedelta
+import jwt
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Parámetros JWT fijados al importar: la configuración no cambia en tiempo de ejecución
+_JWT_SECRET = settings.SECRET_KEY
+_JWT_ALGORITHM = settings.ALGORITHM
+_JWT_ALGORITHMS = [settings.ALGORITHM]
+_ACCESS_TOKEN_TTL = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+# bcrypt libera el GIL: un hilo por núcleo permite hashear en paralelo sin bloquear el event loop
+_password_executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="bcrypt")
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("ascii")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    # Compatible con los hashes $2b$ generados antes por passlib
+    try:
+        return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("ascii"))
+    except ValueError:
+        # Hash almacenado con formato inválido
+        return False
+
+def secrets_match(provided: Optional[str], expected: str) -> bool:
+    """
+    Compare a client-supplied secret with the expected one in constant time.
+    
+    Args:
+        provided (Optional[str]): Secret received in the request
+        expected (str): Configured secret
+        
+    Returns:
+        bool: True if both are equal
+    """
+    if provided is None:
+        return False
+    return hmac.compare_digest(provided.encode("utf-8"), expected.encode("utf-8"))
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash was made with a different cost than ``BCRYPT_ROUNDS``.
+    
+    Args:
+        hashed_password (str): Stored bcrypt hash (``$2b$<cost>$...``)
+        
+    Returns:
+        bool: True if the hash should be recomputed with the current cost
+    """
+    try:
+        return int(hashed_password.split("$")[2]) != settings.BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+def benchmark_password_hash() -> float:
+    """
+    Time one password hash at the configured cost.
+    
+    Returns:
+        float: Elapsed time in milliseconds
+    """
+    start = time.perf_counter()
+    hash_password("benchmark-password")
+    return (time.perf_counter() - start) * 1000
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password on the bcrypt thread pool.
+    
+    Args:
+        password (str): Plain text password
+        
+    Returns:
+        str: bcrypt hash
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, hash_password, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password on the bcrypt thread pool.
+    
+    Args:
+        plain_password (str): Password to check
+        hashed_password (str): Stored bcrypt hash
+        
+    Returns:
+        bool: True if the password matches
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor, verify_password, plain_password, hashed_password
+    )
+
+@lru_cache(maxsize=1)
+def dummy_password_hash() -> str:
+    """
+    Throwaway bcrypt hash at the configured cost, computed once per process.
+    
+    Returns:
+        str: bcrypt hash of a random password nobody knows
+    """
+    return hash_password(secrets.token_urlsafe(16))
+
+async def verify_dummy_password_async() -> None:
+    """
+    Spend one bcrypt verification on the throwaway hash.
+    
+    Called when a login names an unknown user, so that path costs the same
+    as a wrong password and response times do not reveal which emails exist.
+    """
+    loop = asyncio.get_running_loop()
+    dummy_hash = await loop.run_in_executor(_password_executor, dummy_password_hash)
+    await verify_password_async("invalid-password", dummy_hash)
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """
@@ -22,15 +138,10 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     Returns:
         str: Encoded JWT token
     """
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+    ttl = _ACCESS_TOKEN_TTL if expires_delta is None else int(expires_delta.total_seconds())
+    # exp como epoch entero: PyJWT lo serializa tal cual, sin construir datetimes
+    to_encode = {**data, "exp": int(time.time()) + ttl}
+    return jwt.encode(to_encode, _JWT_SECRET, algorithm=_JWT_ALGORITHM)
 
 def verify_access_token(token: str) -> dict:
     """
@@ -43,19 +154,88 @@ def verify_access_token(token: str) -> dict:
         dict: Decoded token data
         
     Raises:
-        JWTError: If token is invalid or expired
+        jwt.PyJWTError: If token is invalid or expired
+    """
+    return jwt.decode(token, _JWT_SECRET, algorithms=_JWT_ALGORITHMS)
+
+
+# Tokens ya verificados: blake2b(token) -> (caduca_en, payload); evita re-verificar la firma en cada request
+_TOKEN_CACHE_TTL = 60
+_TOKEN_CACHE_MAXSIZE = 10_000
+_token_cache: "OrderedDict[bytes, tuple[float, dict]]" = OrderedDict()
+
+def verify_access_token_cached(token: str) -> dict:
+    """
+    Verify and decode a JWT access token, reusing recent verifications.
+    
+    Entries live at most ``_TOKEN_CACHE_TTL`` seconds and never past the
+    token's own ``exp``, so expiry is still enforced. The cache is keyed by a
+    digest of the token, not the token itself.
+    
+    Args:
+        token (str): JWT token to verify
+        
+    Returns:
+        dict: Decoded token data
+        
+    Raises:
+        jwt.PyJWTError: If token is invalid or expired
     """
-    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    now = time.time()
+    
+    entry = _token_cache.get(key)
+    if entry is not None:
+        if entry[0] > now:
+            _token_cache.move_to_end(key)
+            return entry[1]
+        del _token_cache[key]
+    
+    payload = verify_access_token(token)
+    expires_at = min(now + _TOKEN_CACHE_TTL, payload.get("exp", now))
+    if expires_at > now:
+        _token_cache[key] = (expires_at, payload)
+        if len(_token_cache) > _TOKEN_CACHE_MAXSIZE:
+            _token_cache.popitem(last=False)
+    return payload
 
 
 def decode_token(token: str) -> dict:
     """
-    Decode JWT token without verification.
+    Decode JWT token, verifying its signature and expiry.
     
     Args:
         token (str): JWT token to decode
         
     Returns:
         dict: Decoded token data
+        
+    Raises:
+        jwt.PyJWTError: If token is invalid or expired
+    """
+    return verify_access_token(token)
+
+
+def peek_claims(token: str) -> dict:
+    """
+    Read the claims of a JWT token without verifying it.
+    
+    Only splits the token and base64url-decodes its payload, which is much
+    cheaper than checking the signature. The claims are untrusted: use them
+    for logging or rate-limit keys, never for authorization, which must go
+    through ``decode_token`` or ``verify_access_token``.
+    
+    Args:
+        token (str): JWT token to read
+        
+    Returns:
+        dict: Unverified token claims
+        
+    Raises:
+        jwt.DecodeError: If the token is malformed
     """
-    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    try:
+        payload = token.split(".", 2)[1]
+        return json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError) as e:
+        raise jwt.DecodeError("Invalid token payload") from e
@@ -6,7 +6,7 @@ odontolab_database.sql schema.
 """
 
 from .user_model import User, UserRole
-from .patient import Patient
+from .patient import Patient, PATIENT_NUMBER_PATTERN, PATIENT_SEARCH_TEXT
 from .medical_record import MedicalRecord
 from .contact_request import ContactRequest, ContactStatus
 from .appointment import Appointment, AppointmentReminder
@@ -16,6 +16,8 @@ __all__ = [
     "User",
     "UserRole",
     "Patient",
+    "PATIENT_NUMBER_PATTERN",
+    "PATIENT_SEARCH_TEXT",
     "MedicalRecord",
     "ContactRequest",
     "ContactStatus",
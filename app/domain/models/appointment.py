@@ -7,13 +7,24 @@ for managing dental clinic appointments and automated reminders.
 
 import uuid
 from datetime import datetime, timedelta
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, ForeignKey, Enum as SQLAEnum
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, ForeignKey, Index, Enum as SQLAEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from app.core.database import Base
 from app.domain.models.enums import AppointmentStatus, ReminderType
 
 
+# Citas que ocupan la agenda del dentista
+ACTIVE_APPOINTMENT_STATUSES = (
+    AppointmentStatus.SCHEDULED,
+    AppointmentStatus.CONFIRMED,
+    AppointmentStatus.IN_PROGRESS,
+)
+
+# Duración máxima de una cita (minutos); coincide con la validación de los schemas
+MAX_DURATION_MINUTES = 480
+
+
 class Appointment(Base):
     """
     Appointment model for managing dental clinic appointments.
@@ -49,10 +60,11 @@ class Appointment(Base):
     __tablename__ = "appointments"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Sin índice propio: los índices compuestos (…, scheduled_time) de abajo los cubren
     patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id", ondelete="CASCADE"), 
-                       nullable=False, index=True)
+                       nullable=False)
     dentist_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="RESTRICT"), 
-                       nullable=False, index=True)
+                       nullable=False)
     scheduled_time = Column(DateTime(timezone=True), nullable=False, index=True)
     duration_minutes = Column(Integer, nullable=False, default=30)
     status = Column(SQLAEnum(AppointmentStatus), nullable=False, 
@@ -117,6 +129,20 @@ class Appointment(Base):
         return self.status == AppointmentStatus.IN_PROGRESS
 
 
+# Listados por dentista o por paciente, ya ordenados por fecha
+Index("ix_appointments_dentist_id_scheduled_time", Appointment.dentist_id, Appointment.scheduled_time)
+Index("ix_appointments_patient_id_scheduled_time", Appointment.patient_id, Appointment.scheduled_time)
+
+# Agenda activa por dentista: índice parcial que sirve get_upcoming_appointments sin ordenar
+# y las comprobaciones de solapamiento de check_availability
+Index(
+    "ix_appointments_dentist_id_scheduled_time_pending",
+    Appointment.dentist_id,
+    Appointment.scheduled_time,
+    postgresql_where=Appointment.status.in_(ACTIVE_APPOINTMENT_STATUSES)
+)
+
+
 class AppointmentReminder(Base):
     """
     Appointment reminder model for automated notifications.
@@ -6,7 +6,7 @@ This module defines the ContactRequest entity for public contact form submission
 
 import uuid
 import enum
-from sqlalchemy import Column, String, DateTime, func, Text, Boolean, Enum
+from sqlalchemy import Column, String, DateTime, func, Text, Boolean, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from app.core.database import Base
 
@@ -45,6 +45,10 @@ class ContactRequest(Base):
         created_at (datetime): Submission timestamp
     """
     __tablename__ = "contact_requests"
+    __table_args__ = (
+        # Keyset pagination seeks on (created_at, id)
+        Index("ix_contact_requests_created_at_id", "created_at", "id"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     nombre = Column(String(100), nullable=False)
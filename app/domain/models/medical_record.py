@@ -5,7 +5,7 @@ This module defines the MedicalRecord entity following the odontolab_database.sq
 """
 
 import uuid
-from sqlalchemy import Column, String, DateTime, func, ForeignKey, Text
+from sqlalchemy import Column, String, DateTime, func, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from app.core.database import Base
@@ -55,3 +55,23 @@ class MedicalRecord(Base):
     
     def __repr__(self) -> str:
         return f"<MedicalRecord(id='{self.id}', patient_id='{self.patient_id}')>"
+
+
+# Historial general, por paciente y por dentista, del más reciente al más antiguo
+Index(
+    "ix_medical_records_visit_date_id",
+    MedicalRecord.visit_date.desc(),
+    MedicalRecord.id.desc(),
+)
+Index(
+    "ix_medical_records_patient_id_visit_date",
+    MedicalRecord.patient_id,
+    MedicalRecord.visit_date.desc(),
+    MedicalRecord.id.desc(),
+)
+Index(
+    "ix_medical_records_dentist_id_visit_date",
+    MedicalRecord.dentist_id,
+    MedicalRecord.visit_date.desc(),
+    MedicalRecord.id.desc(),
+)
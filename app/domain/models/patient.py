@@ -4,9 +4,10 @@ Patient model for the OdontoLab system.
 This module defines the Patient entity following the odontolab_database.sql schema.
 """
 
+import re
 import uuid
 from datetime import date
-from sqlalchemy import Column, String, DateTime, func, ForeignKey, Text, Date, Enum as SQLAEnum
+from sqlalchemy import Column, String, DateTime, func, ForeignKey, Text, Date, Index, DDL, event, Enum as SQLAEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from app.core.database import Base
@@ -43,6 +44,11 @@ class Patient(Base):
         medical_records: One-to-many relationship with MedicalRecord
     """
     __tablename__ = "patients"
+    __table_args__ = (
+        # Keyset pagination seeks on (created_at, id)
+        Index("ix_patients_created_at_id", "created_at", "id"),
+        Index("ix_patients_created_by_created_at_id", "created_by", "created_at", "id"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     patient_number = Column(String(20), unique=True, nullable=True, index=True, 
@@ -82,3 +88,29 @@ class Patient(Base):
         return today.year - self.date_of_birth.year - (
             (today.month, today.day) < (self.date_of_birth.month, self.date_of_birth.day)
         )
+
+
+# Formato de patient_number (p. ej. PAT-2025-0001); permite resolver la búsqueda
+# con el índice único en lugar del índice de trigramas
+PATIENT_NUMBER_PATTERN = re.compile(r"^PAT-\d{4}-\d+$")
+
+# Texto indexado para la búsqueda libre; las consultas deben usar esta misma
+# expresión para que PostgreSQL pueda aprovechar ix_patients_search_trgm
+PATIENT_SEARCH_TEXT = (
+    Patient.first_name + " " + Patient.last_name + " " + Patient.email + " "
+    + Patient.phone + " " + func.coalesce(Patient.patient_number, "")
+)
+
+Index(
+    "ix_patients_search_trgm",
+    PATIENT_SEARCH_TEXT.label("search_text"),
+    postgresql_using="gin",
+    postgresql_ops={"search_text": "gin_trgm_ops"},
+)
+
+# gin_trgm_ops requires the pg_trgm extension
+event.listen(
+    Patient.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -7,7 +7,8 @@ and authorization in the dental clinic management system.
 
 import uuid
 import enum
-from sqlalchemy import Column, String, DateTime, func, Boolean, Enum
+from functools import cached_property
+from sqlalchemy import Column, String, DateTime, func, Boolean, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from app.core.database import Base
@@ -50,6 +51,10 @@ class User(Base):
         medical_records: One-to-many relationship with MedicalRecord (dentist_id)
     """
     __tablename__ = "users"
+    __table_args__ = (
+        # Keyset pagination seeks on (created_at, id)
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email = Column(String(255), unique=True, nullable=False, index=True)
@@ -76,5 +81,12 @@ class User(Base):
     def full_name(self) -> str:
         """Returns the user's full name."""
         return f"{self.first_name} {self.last_name}"
+    
+    @cached_property
+    def sub(self) -> str:
+        """Returns the user ID as a string (JWT ``sub`` claim), computed once per loaded user."""
+        return str(self.id)
+
 
-    
\ No newline at end of file
+# Unique on lower(email) so the case-insensitive get_by_email stays an index lookup
+Index("ux_users_email", func.lower(User.email), unique=True)
@@ -5,7 +5,7 @@ This module defines Pydantic schemas for Appointment-related operations
 following RESTful API best practices.
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, validator, model_validator
 from typing import Optional, List
 from datetime import datetime, date as date_type, time as time_type
 from uuid import UUID
@@ -144,6 +144,24 @@ class AppointmentDetailResponse(AppointmentResponse):
     patient_phone: Optional[str] = Field(None, description="Patient's phone number")
     dentist_name: Optional[str] = Field(None, description="Dentist's full name")
     
+    @model_validator(mode="before")
+    @classmethod
+    def _pull_related(cls, data):
+        """Read patient/dentist details straight from an ORM appointment."""
+        if isinstance(data, dict):
+            return data
+        # Un solo paso de validación: se leen los atributos y las relaciones ya cargadas
+        values = {name: getattr(data, name) for name in AppointmentResponse.model_fields}
+        # Un AppointmentResponse ya validado no trae relaciones: sólo se leen de un ORM Appointment
+        patient = getattr(data, "patient", None)
+        if patient is not None:
+            values["patient_name"] = patient.full_name
+            values["patient_phone"] = patient.phone
+        dentist = getattr(data, "dentist", None)
+        if dentist is not None:
+            values["dentist_name"] = dentist.full_name
+        return values
+    
     model_config = {
         "from_attributes": True,
         "json_schema_extra": {
@@ -171,10 +189,11 @@ class AppointmentListResponse(BaseModel):
     """Schema for paginated appointment list response."""
     success: bool = Field(True, description="Request success status")
     data: List[AppointmentDetailResponse] = Field(..., description="List of appointments")
-    total: int = Field(..., description="Total number of appointments")
-    page: int = Field(..., description="Current page number")
+    total: Optional[int] = Field(None, description="Total number of appointments (first page only)")
+    page: Optional[int] = Field(None, description="Current page number (deprecated offset pagination)")
     per_page: int = Field(..., description="Items per page")
-    total_pages: int = Field(..., description="Total number of pages")
+    total_pages: Optional[int] = Field(None, description="Total number of pages, when the total is known")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, None on the last page")
 
 
 class AppointmentReminderCreate(BaseModel):
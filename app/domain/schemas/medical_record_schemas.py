@@ -108,10 +108,11 @@ class MedicalRecordListResponse(BaseModel):
     """Schema for paginated medical record list response."""
     success: bool = Field(True, description="Request success status")
     data: list[MedicalRecordResponse] = Field(..., description="List of medical records")
-    total: int = Field(..., description="Total number of medical records")
-    page: int = Field(..., description="Current page number")
+    total: Optional[int] = Field(None, description="Total number of medical records (first page only)")
+    page: Optional[int] = Field(None, description="Current page number (deprecated offset pagination)")
     per_page: int = Field(..., description="Items per page")
-    total_pages: int = Field(..., description="Total number of pages")
+    total_pages: Optional[int] = Field(None, description="Total number of pages, when the total is known")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, None on the last page")
     
     model_config = {
         "json_schema_extra": {
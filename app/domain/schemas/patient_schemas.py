@@ -125,10 +125,11 @@ class PatientListResponse(BaseModel):
     """Schema for paginated patient list response."""
     success: bool = Field(True, description="Request success status")
     data: list[PatientResponse] = Field(..., description="List of patients")
-    total: int = Field(..., description="Total number of patients")
-    page: int = Field(..., description="Current page number")
+    total: Optional[int] = Field(None, description="Total number of patients (first page only)")
+    page: Optional[int] = Field(None, description="Current page number (deprecated offset pagination)")
     per_page: int = Field(..., description="Items per page")
-    total_pages: int = Field(..., description="Total number of pages")
+    total_pages: Optional[int] = Field(None, description="Total number of pages, when the total is known")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, None on the last page")
     
     model_config = {
         "json_schema_extra": {
@@ -8,10 +8,12 @@ from .user_repository import UserRepository
 from .patient_repository import PatientRepository
 from .medical_record_repository import MedicalRecordRepository
 from .contact_repository import ContactRequestRepository
+from .dashboard_repository import DashboardRepository
 
 __all__ = [
     "UserRepository",
     "PatientRepository",
     "MedicalRecordRepository",
     "ContactRequestRepository",
+    "DashboardRepository",
 ]
\ No newline at end of file
@@ -5,17 +5,20 @@ This module provides the concrete implementation of appointment repository
 using SQLAlchemy for database operations with PostgreSQL.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Collection, AsyncIterator
 from uuid import UUID
 from datetime import datetime, date, time, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, raiseload
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import and_, or_, func, String
+from sqlalchemy import and_, or_, func, String, DateTime, update, exists
 
 from app.domain.models import Appointment, AppointmentReminder, Patient, User
+from app.domain.models.appointment import ACTIVE_APPOINTMENT_STATUSES, MAX_DURATION_MINUTES
 from app.domain.models.enums import AppointmentStatus, ReminderType
+from app.application.pagination import check_legacy_skip
+from app.insfraestructure.repositories.pagination import paginate
 from app.application.exceptions import (
     AppointmentNotFoundError,
     AppointmentConflictError,
@@ -35,12 +38,14 @@ class AppointmentRepository:
         """Initialize the appointment repository with database session."""
         self.session = session
     
-    async def create(self, appointment_data: Dict[str, Any]) -> Appointment:
+    async def create(self, appointment_data: Dict[str, Any], commit: bool = True) -> Appointment:
         """
         Create a new appointment.
         
         Args:
             appointment_data: Dictionary containing appointment data
+            commit: If False, only flush so the caller can add related rows
+                and commit them in the same transaction
             
         Returns:
             Created Appointment instance
@@ -60,6 +65,9 @@ class AppointmentRepository:
         self.session.add(appointment)
         
         try:
+            if not commit:
+                await self.session.flush()
+                return appointment
             await self.session.commit()
             await self.session.refresh(appointment)
             return appointment
@@ -144,6 +152,60 @@ class AppointmentRepository:
             await self.session.rollback()
             raise ValidationError(f"Database integrity error: {str(e)}")
     
+    async def update_status_conditional(
+        self,
+        appointment_id: UUID,
+        new_status: AppointmentStatus,
+        allowed_current_statuses: Collection[AppointmentStatus],
+        dentist_id: Optional[UUID] = None,
+        notes: Optional[str] = None,
+        notes_suffix: Optional[str] = None
+    ) -> Optional[Appointment]:
+        """
+        Change an appointment's status in a single UPDATE ... RETURNING.
+        
+        The row is only updated if its current status is one of
+        ``allowed_current_statuses`` (and, if given, it belongs to ``dentist_id``).
+        
+        Args:
+            appointment_id: UUID of the appointment
+            new_status: Status to set
+            allowed_current_statuses: Statuses the appointment may currently have
+            dentist_id: Restrict the update to this dentist's appointments
+            notes: Replace the notes with this text
+            notes_suffix: Append this text to the existing notes
+            
+        Returns:
+            Updated Appointment instance, or None if no row matched
+        """
+        if not allowed_current_statuses:
+            return None
+        
+        values: Dict[str, Any] = {"status": new_status, "updated_at": func.now()}
+        if notes_suffix:
+            # Misma semántica que el .strip() de Python sobre las notas concatenadas
+            values["notes"] = func.btrim(func.coalesce(Appointment.notes, "") + notes_suffix, " \t\r\n")
+        elif notes:
+            values["notes"] = notes
+        
+        stmt = (
+            update(Appointment)
+            .where(
+                Appointment.id == appointment_id,
+                Appointment.status.in_(list(allowed_current_statuses))
+            )
+            .values(**values)
+            .returning(Appointment)
+            .execution_options(populate_existing=True)
+        )
+        if dentist_id:
+            stmt = stmt.where(Appointment.dentist_id == dentist_id)
+        
+        result = await self.session.execute(stmt)
+        appointment = result.scalar_one_or_none()
+        await self.session.commit()
+        return appointment
+    
     async def delete(self, appointment_id: UUID) -> bool:
         """
         Delete an appointment.
@@ -169,12 +231,14 @@ class AppointmentRepository:
         status: Optional[AppointmentStatus] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-        skip: int = 0,
+        skip: Optional[int] = None,
         limit: int = 100,
-        load_relations: bool = True
-    ) -> tuple[List[Appointment], int]:
+        load_relations: bool = True,
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> tuple[List[Appointment], Optional[int], Optional[str]]:
         """
-        List appointments with optional filters and pagination.
+        List appointments with optional filters and keyset pagination.
         
         Args:
             patient_id: Filter by patient
@@ -182,18 +246,84 @@ class AppointmentRepository:
             status: Filter by status
             start_date: Filter by start date (inclusive)
             end_date: Filter by end date (inclusive)
-            skip: Number of records to skip (pagination)
+            skip: Deprecated offset pagination, limited to ``MAX_LEGACY_SKIP``
             limit: Maximum number of records to return
-            load_relations: Whether to eager load relationships
+            load_relations: Whether to eager load patient and dentist; any
+                other relationship access raises instead of lazy loading
+            cursor: Opaque cursor returned by the previous page
+            include_total: Whether to compute the total count
             
         Returns:
-            Tuple of (list of appointments, total count)
+            Tuple of (list of appointments, total count or None, next page cursor)
         """
-        # Build base query
-        query = select(Appointment)
-        count_query = select(func.count(Appointment.id))
-        
         # Apply filters
+        filters = self._build_filters(patient_id, dentist_id, status, start_date, end_date)
+        
+        options = ()
+        if load_relations:
+            # Una consulta IN por relación; cualquier otro acceso perezoso falla en vez de hacer N+1
+            options = (
+                selectinload(Appointment.patient),
+                selectinload(Appointment.dentist),
+                raiseload("*")
+            )
+        
+        if skip is not None:
+            check_legacy_skip(skip)
+        return await paginate(
+            self.session, Appointment, (Appointment.scheduled_time, Appointment.id),
+            filters, skip, limit, cursor, include_total, descending=False, options=options
+        )
+    
+    async def stream_appointments(
+        self,
+        patient_id: Optional[UUID] = None,
+        dentist_id: Optional[UUID] = None,
+        status: Optional[AppointmentStatus] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        batch_size: int = 500
+    ) -> AsyncIterator[Appointment]:
+        """
+        Stream appointments matching the filters, ``batch_size`` rows at a time.
+        
+        Args:
+            patient_id: Filter by patient
+            dentist_id: Filter by dentist
+            status: Filter by status
+            start_date: Filter by start date (inclusive)
+            end_date: Filter by end date (inclusive)
+            batch_size: Rows fetched from the server-side cursor per round-trip
+            
+        Yields:
+            Appointment instances with patient and dentist loaded, in schedule order
+        """
+        filters = self._build_filters(patient_id, dentist_id, status, start_date, end_date)
+        query = (
+            select(Appointment)
+            .where(*filters)
+            .order_by(Appointment.scheduled_time.asc(), Appointment.id.asc())
+            .options(
+                selectinload(Appointment.patient),
+                selectinload(Appointment.dentist),
+                raiseload("*")
+            )
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream_scalars(query)
+        async for batch in result.partitions():
+            for appointment in batch:
+                yield appointment
+    
+    @staticmethod
+    def _build_filters(
+        patient_id: Optional[UUID],
+        dentist_id: Optional[UUID],
+        status: Optional[AppointmentStatus],
+        start_date: Optional[date],
+        end_date: Optional[date]
+    ) -> list:
+        """Build the WHERE clauses shared by the appointment listing queries."""
         filters = []
         if patient_id:
             filters.append(Appointment.patient_id == patient_id)
@@ -205,30 +335,7 @@ class AppointmentRepository:
             filters.append(Appointment.scheduled_time >= datetime.combine(start_date, time.min))
         if end_date:
             filters.append(Appointment.scheduled_time <= datetime.combine(end_date, time.max))
-        
-        if filters:
-            query = query.where(and_(*filters))
-            count_query = count_query.where(and_(*filters))
-        
-        # Get total count
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar()
-        
-        # Apply ordering, pagination, and eager loading
-        query = query.order_by(Appointment.scheduled_time.asc())
-        query = query.offset(skip).limit(limit)
-        
-        if load_relations:
-            query = query.options(
-                selectinload(Appointment.patient),
-                selectinload(Appointment.dentist),
-                selectinload(Appointment.creator)
-            )
-        
-        result = await self.session.execute(query)
-        appointments = result.scalars().all()
-        
-        return list(appointments), total
+        return filters
     
     async def _check_conflicts(
         self,
@@ -314,52 +421,38 @@ class AppointmentRepository:
         Returns:
             List of time slots with availability status
         """
-        # Get all appointments for the dentist on the specified date
         start_datetime = datetime.combine(check_date, start_time)
         end_datetime = datetime.combine(check_date, end_time)
+        step = timedelta(minutes=slot_duration)
+        
+        # Franjas generadas en la base de datos; cada una se marca ocupada si se solapa con una cita activa
+        slots = select(
+            func.generate_series(
+                start_datetime, end_datetime - step, step, type_=DateTime(timezone=True)
+            ).label("slot_start")
+        ).subquery("slots")
+        slot_start = slots.c.slot_start
+        
+        busy = exists().where(
+            Appointment.dentist_id == dentist_id,
+            Appointment.status.in_(ACTIVE_APPOINTMENT_STATUSES),
+            # Acota el rango del índice: ninguna cita dura más de MAX_DURATION_MINUTES
+            Appointment.scheduled_time >= start_datetime - timedelta(minutes=MAX_DURATION_MINUTES),
+            Appointment.scheduled_time < slot_start + step,
+            Appointment.scheduled_time + func.make_interval(0, 0, 0, 0, 0, Appointment.duration_minutes) > slot_start
+        )
         
-        query = select(Appointment).where(
-            and_(
-                Appointment.dentist_id == dentist_id,
-                Appointment.scheduled_time >= start_datetime,
-                Appointment.scheduled_time < end_datetime,
-                Appointment.status.in_([
-                    AppointmentStatus.SCHEDULED,
-                    AppointmentStatus.CONFIRMED,
-                    AppointmentStatus.IN_PROGRESS
-                ])
-            )
-        ).order_by(Appointment.scheduled_time)
-        
+        query = select(slot_start, (~busy).label("available")).order_by(slot_start)
         result = await self.session.execute(query)
-        existing_appointments = result.scalars().all()
-        
-        # Generate time slots
-        slots = []
-        current_time = start_datetime
         
-        while current_time < end_datetime:
-            slot_end = current_time + timedelta(minutes=slot_duration)
-            if slot_end > end_datetime:
-                break
-            
-            # Check if slot overlaps with any existing appointment
-            is_available = True
-            for apt in existing_appointments:
-                apt_end = apt.end_time
-                if not (slot_end <= apt.scheduled_time or current_time >= apt_end):
-                    is_available = False
-                    break
-            
-            slots.append({
-                "start_time": current_time,
-                "end_time": slot_end,
-                "available": is_available
-            })
-            
-            current_time = slot_end
-        
-        return slots
+        return [
+            {
+                "start_time": start,
+                "end_time": start + step,
+                "available": available
+            }
+            for start, available in result.all()
+        ]
     
     async def get_upcoming_appointments(
         self,
@@ -383,6 +476,7 @@ class AppointmentRepository:
         now = datetime.now()
         future_date = now + timedelta(days=days_ahead)
         
+        # Subconjunto del predicado de ix_appointments_dentist_id_scheduled_time_pending
         query = select(Appointment).where(
             and_(
                 Appointment.scheduled_time >= now,
@@ -406,4 +500,57 @@ class AppointmentRepository:
         )
         
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
+    
+    async def get_stats(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        Aggregate appointment statistics in the database.
+        
+        Args:
+            start_date: Filter by start date (inclusive)
+            end_date: Filter by end date (inclusive)
+            
+        Returns:
+            Dictionary with ``by_status`` counts, ``total_patients`` and
+            ``upcoming_count``
+        """
+        filters = []
+        if start_date:
+            filters.append(Appointment.scheduled_time >= datetime.combine(start_date, time.min))
+        if end_date:
+            filters.append(Appointment.scheduled_time <= datetime.combine(end_date, time.max))
+        
+        # Conteo por estado
+        status_query = (
+            select(Appointment.status, func.count(Appointment.id))
+            .where(*filters)
+            .group_by(Appointment.status)
+        )
+        status_result = await self.session.execute(status_query)
+        by_status = {status.value: count for status, count in status_result.all()}
+        
+        # Pacientes únicos y citas pendientes en una sola pasada
+        upcoming_filter = and_(
+            Appointment.scheduled_time > func.now(),
+            Appointment.status.notin_([
+                AppointmentStatus.COMPLETED,
+                AppointmentStatus.CANCELLED,
+                AppointmentStatus.NO_SHOW
+            ])
+        )
+        totals_query = select(
+            func.count(func.distinct(Appointment.patient_id)),
+            func.count(Appointment.id).filter(upcoming_filter)
+        ).where(*filters)
+        totals_result = await self.session.execute(totals_query)
+        total_patients, upcoming_count = totals_result.one()
+        
+        return {
+            "by_status": by_status,
+            "total_patients": total_patients,
+            "upcoming_count": upcoming_count
+        }
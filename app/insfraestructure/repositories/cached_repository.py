@@ -0,0 +1,98 @@
+"""
+Read-through caching for repository point lookups.
+
+This module provides a mixin that wraps selected async repository methods in
+an in-process TTL cache, for lookups that run on every request but whose rows
+rarely change.
+"""
+
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+def _ttl_cache(ttl: float, maxsize: int = 1024) -> Callable:
+    """
+    Cache the results of an async method for ``ttl`` seconds.
+
+    The cache is shared by every instance of the class, is keyed by the call
+    arguments (excluding ``self``) and evicts the least recently used entry
+    once ``maxsize`` is reached. ``None`` results are not cached.
+
+    Args:
+        ttl (float): Seconds an entry stays valid
+        maxsize (int): Maximum number of cached entries
+
+    Returns:
+        Callable: Decorator for async methods
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: OrderedDict = OrderedDict()
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs) -> Any:
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            entry = cache.get(key)
+            if entry is not None and entry[0] > now:
+                cache.move_to_end(key)
+                return entry[1]
+
+            value = await func(self, *args, **kwargs)
+            if value is not None:
+                cache[key] = (now + ttl, value)
+                cache.move_to_end(key)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return value
+
+        wrapper.cache_clear = cache.clear
+        wrapper.cache_pop = lambda *args, **kwargs: cache.pop(
+            (args, tuple(sorted(kwargs.items()))), None
+        )
+        return wrapper
+
+    return decorator
+
+
+class CachedRepositoryMixin:
+    """
+    Mixin that caches the methods listed in ``_cached_methods``.
+
+    Subclasses opt in by naming the methods and a TTL, and call
+    ``self._invalidate(...)`` from every method that writes the cached rows.
+
+    The cache lives in each worker process and its entries are shared by every
+    session and coroutine, so only methods returning immutable values (counts,
+    enums, tuples) may be cached, never ORM instances. ``_invalidate`` only
+    reaches the current process: other workers serve their entries until the
+    TTL expires, which rules out lookups used for authentication or
+    authorization.
+    """
+
+    _cached_methods: tuple[str, ...] = ()
+    _ttl: float = 300
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in cls._cached_methods:
+            if name in cls.__dict__:
+                setattr(cls, name, _ttl_cache(ttl=cls._ttl)(cls.__dict__[name]))
+
+    def _invalidate(self, *args) -> None:
+        """
+        Drop cached entries of this repository class.
+
+        Args:
+            *args: Call arguments whose entries should be dropped from every
+                cached method (e.g. the ID of the row just written); with no
+                arguments the whole cache is cleared
+        """
+        for name in self._cached_methods:
+            method = getattr(type(self), name)
+            if args:
+                method.cache_pop(*args)
+            else:
+                method.cache_clear()
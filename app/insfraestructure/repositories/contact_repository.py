@@ -11,11 +11,20 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from app.domain.models import ContactRequest, ContactStatus
+from app.insfraestructure.repositories.cached_repository import CachedRepositoryMixin
+from app.application.pagination import check_legacy_skip
+from app.insfraestructure.repositories.pagination import paginate
 
 
-class ContactRequestRepository:
+class ContactRequestRepository(CachedRepositoryMixin):
     """Repository class for ContactRequest CRUD operations."""
     
+    # Los contadores se leen en cada carga del dashboard y solo cambian con las
+    # escrituras de abajo; ContactStatus es un str enum, así que "pending" y
+    # ContactStatus.PENDING comparten la misma entrada
+    _cached_methods = ("count_by_status", "count_all")
+    _ttl = 15
+    
     def __init__(self, db: AsyncSession):
         """
         Initialize ContactRequestRepository with database session.
@@ -45,6 +54,7 @@ class ContactRequestRepository:
         contact = ContactRequest(**contact_data)
         self.db.add(contact)
         await self.db.commit()
+        self._invalidate()
         await self.db.refresh(contact)
         return contact
     
@@ -65,39 +75,36 @@ class ContactRequestRepository:
     
     async def get_all(
         self,
-        skip: int = 0,
+        skip: Optional[int] = None,
         limit: int = 10,
-        status: Optional[ContactStatus] = None
-    ) -> tuple[List[ContactRequest], int]:
+        status: Optional[ContactStatus] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> tuple[List[ContactRequest], Optional[int], Optional[str]]:
         """
-        Get all contact requests with pagination and optional status filter.
+        Get contact requests with keyset pagination and optional status filter.
         
         Args:
-            skip (int): Number of records to skip
+            skip (Optional[int]): Deprecated offset pagination, limited to ``MAX_LEGACY_SKIP``
             limit (int): Maximum number of records to return
             status (Optional[ContactStatus]): Filter by status
+            cursor (Optional[str]): Opaque cursor returned by the previous page
+            include_total (bool): Whether to compute the total count
             
         Returns:
-            tuple[List[ContactRequest], int]: List of contact requests and total count
+            tuple[List[ContactRequest], Optional[int], Optional[str]]: List of contact
+                requests, total count (None when not requested) and next page cursor
         """
-        # Build query
-        query = select(ContactRequest)
-        count_query = select(func.count(ContactRequest.id))
-        
+        filters = []
         if status is not None:
-            query = query.where(ContactRequest.status == status)
-            count_query = count_query.where(ContactRequest.status == status)
-        
-        # Get total count
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar()
-        
-        # Get contact requests
-        query = query.offset(skip).limit(limit).order_by(ContactRequest.created_at.desc())
-        result = await self.db.execute(query)
-        contacts = result.scalars().all()
+            filters.append(ContactRequest.status == status)
         
-        return contacts, total
+        if skip is not None:
+            check_legacy_skip(skip)
+        return await paginate(
+            self.db, ContactRequest, (ContactRequest.created_at, ContactRequest.id),
+            filters, skip, limit, cursor, include_total
+        )
     
     async def update_status(
         self,
@@ -105,7 +112,7 @@ class ContactRequestRepository:
         status: ContactStatus
     ) -> Optional[ContactRequest]:
         """
-        Update contact request status.
+        Update contact request status with a single UPDATE ... RETURNING.
         
         Args:
             contact_id (UUID): Contact request's unique identifier
@@ -114,14 +121,18 @@ class ContactRequestRepository:
         Returns:
             Optional[ContactRequest]: Updated contact request if found, None otherwise
         """
-        await self.db.execute(
+        result = await self.db.execute(
             update(ContactRequest)
             .where(ContactRequest.id == contact_id)
             .values(status=status)
+            .returning(ContactRequest)
+            .execution_options(populate_existing=True)
         )
+        contact = result.scalar_one_or_none()
         await self.db.commit()
+        self._invalidate()
         
-        return await self.get_by_id(contact_id)
+        return contact
     
     async def delete(self, contact_id: UUID) -> bool:
         """
@@ -137,6 +148,7 @@ class ContactRequestRepository:
             delete(ContactRequest).where(ContactRequest.id == contact_id)
         )
         await self.db.commit()
+        self._invalidate()
         return result.rowcount > 0
     
     async def count_by_status(self, status: ContactStatus) -> int:
@@ -0,0 +1,69 @@
+"""
+Dashboard repository for database operations.
+
+This module implements read-only aggregate queries that collect the counters of
+the dashboard statistics in a single round-trip.
+"""
+
+from typing import Dict
+from sqlalchemy import select, func, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta, timezone
+
+from app.domain.models import User, UserRole, Patient, MedicalRecord
+
+
+class DashboardRepository:
+    """Repository class for dashboard aggregate queries."""
+    
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize DashboardRepository with database session.
+        
+        Args:
+            db (AsyncSession): Database session
+        """
+        self.db = db
+    
+    async def fetch_admin_counters(self, days: int = 30) -> Dict[str, int]:
+        """
+        Count every admin dashboard statistic with a single query.
+        
+        Each table is scanned once with ``COUNT(*) FILTER (WHERE ...)``
+        aggregates, and the single-row results are cross joined.
+        
+        Args:
+            days (int): Number of days that count as recent
+        
+        Returns:
+            Dict[str, int]: Counters keyed by ``AdminDashboardStats`` field name
+        """
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+        
+        users = select(
+            func.count().filter(User.is_active == True).label("total_users"),
+            func.count().filter(User.role == UserRole.DENTIST).label("total_dentists"),
+            func.count().filter(User.role == UserRole.RECEPTIONIST).label("total_receptionists"),
+        ).select_from(User).subquery("user_counts")
+        patients = select(
+            func.count().label("total_patients"),
+            func.count().filter(Patient.created_at >= cutoff_date).label("recent_patients"),
+        ).select_from(Patient).subquery("patient_counts")
+        records = select(
+            func.count().label("total_medical_records"),
+            func.count().filter(MedicalRecord.created_at >= cutoff_date).label("recent_records"),
+        ).select_from(MedicalRecord).subquery("record_counts")
+        
+        query = select(
+            users.c.total_users,
+            (users.c.total_dentists + users.c.total_receptionists).label("total_staff"),
+            users.c.total_dentists,
+            users.c.total_receptionists,
+            patients.c.total_patients,
+            patients.c.recent_patients,
+            records.c.total_medical_records,
+            records.c.recent_records,
+        ).select_from(users.join(patients, true()).join(records, true()))
+        
+        result = await self.db.execute(query)
+        return dict(result.one()._mapping)
@@ -0,0 +1,41 @@
+"""
+Startup validation of the indexes repositories rely on.
+
+This module provides a mixin that checks, against a live database, that the
+indexes backing a repository's point lookups exist.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.database import find_missing_indexes
+from app.application.exceptions import DatabaseError
+
+
+class IndexedRepositoryMixin:
+    """
+    Mixin that validates the indexes listed in ``__required_indexes__``.
+
+    Each entry is a ``(table, key, unique)`` tuple, where ``key`` is the
+    leading index key as PostgreSQL renders it: a column name such as
+    ``"id"`` or an expression such as ``"lower((email)::text)"``.
+    """
+
+    __required_indexes__: tuple[tuple[str, str, bool], ...] = ()
+
+    @classmethod
+    async def validate_schema(cls, conn: AsyncConnection) -> None:
+        """
+        Verify that the indexes required by this repository exist.
+
+        Args:
+            conn (AsyncConnection): Open database connection
+
+        Raises:
+            DatabaseError: If a required index is missing
+        """
+        missing = await find_missing_indexes(conn, cls.__required_indexes__)
+        if missing:
+            raise DatabaseError(
+                "Missing required indexes: "
+                + ", ".join(f"{table}({key})" for table, key, _ in missing)
+            )
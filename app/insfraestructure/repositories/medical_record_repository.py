@@ -6,12 +6,15 @@ the API_SUMMARY specifications.
 """
 
 from typing import Optional, List
-from sqlalchemy import select, update, delete, and_, func
+from sqlalchemy import select, update, delete, and_, func, exists
 from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel
 from uuid import UUID
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta, timezone
 
 from app.domain.models import MedicalRecord
+from app.application.pagination import check_legacy_skip
+from app.insfraestructure.repositories.pagination import paginate
 
 
 class MedicalRecordRepository:
@@ -44,6 +47,30 @@ class MedicalRecordRepository:
         await self.db.refresh(record)
         return record
     
+    async def create_from_schema(self, schema: BaseModel, **overrides) -> MedicalRecord:
+        """
+        Create a new medical record straight from a validated schema.
+        
+        Only the fields the client set are copied, by attribute access, so no
+        intermediate dict is dumped (nested values like ``teeth_chart`` are not
+        copied either).
+        
+        Args:
+            schema (BaseModel): Validated creation schema
+            **overrides: Extra column values, e.g. ``dentist_id``
+            
+        Returns:
+            MedicalRecord: Created medical record instance
+        """
+        record = MedicalRecord(
+            **{name: getattr(schema, name) for name in schema.model_fields_set},
+            **overrides
+        )
+        self.db.add(record)
+        await self.db.commit()
+        await self.db.refresh(record)
+        return record
+    
     async def get_by_id(self, record_id: UUID) -> Optional[MedicalRecord]:
         """
         Get medical record by ID.
@@ -59,6 +86,40 @@ class MedicalRecordRepository:
         )
         return result.scalar_one_or_none()
     
+    async def get_by_id_for_user(
+        self,
+        record_id: UUID,
+        dentist_id: Optional[UUID] = None
+    ) -> Optional[MedicalRecord]:
+        """
+        Get a medical record by ID only if the caller may see it.
+        
+        Args:
+            record_id (UUID): Medical record's unique identifier
+            dentist_id (Optional[UUID]): Only return the record if it was created by this dentist
+            
+        Returns:
+            Optional[MedicalRecord]: Medical record instance, None if not found or not visible
+        """
+        conditions = [MedicalRecord.id == record_id]
+        if dentist_id is not None:
+            conditions.append(MedicalRecord.dentist_id == dentist_id)
+        result = await self.db.execute(select(MedicalRecord).where(*conditions))
+        return result.scalar_one_or_none()
+    
+    async def exists(self, record_id: UUID) -> bool:
+        """
+        Check if a medical record exists (primary key probe, no row is loaded).
+        
+        Args:
+            record_id (UUID): Medical record's unique identifier
+            
+        Returns:
+            bool: True if the medical record exists
+        """
+        result = await self.db.execute(select(exists().where(MedicalRecord.id == record_id)))
+        return result.scalar()
+    
     async def get_by_patient(
         self,
         patient_id: UUID,
@@ -87,9 +148,9 @@ class MedicalRecordRepository:
         query = (
             select(MedicalRecord)
             .where(MedicalRecord.patient_id == patient_id)
+            .order_by(MedicalRecord.visit_date.desc(), MedicalRecord.id.desc())
             .offset(skip)
             .limit(limit)
-            .order_by(MedicalRecord.visit_date.desc())
         )
         result = await self.db.execute(query)
         records = result.scalars().all()
@@ -99,96 +160,118 @@ class MedicalRecordRepository:
     async def get_by_dentist(
         self,
         dentist_id: UUID,
-        skip: int = 0,
-        limit: int = 10
-    ) -> tuple[List[MedicalRecord], int]:
+        skip: Optional[int] = None,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> tuple[List[MedicalRecord], Optional[int], Optional[str]]:
         """
-        Get all medical records created by a specific dentist.
+        Get the medical records created by a specific dentist, newest visit first.
         
         Args:
             dentist_id (UUID): Dentist's unique identifier
-            skip (int): Number of records to skip
+            skip (Optional[int]): Deprecated offset pagination, limited to ``MAX_LEGACY_SKIP``
             limit (int): Maximum number of records to return
+            cursor (Optional[str]): Opaque cursor returned by the previous page
+            include_total (bool): Whether to compute the total count
             
         Returns:
-            tuple[List[MedicalRecord], int]: List of medical records and total count
+            tuple[List[MedicalRecord], Optional[int], Optional[str]]: List of medical
+                records, total count (None when not requested) and next page cursor
         """
-        # Get total count
-        count_result = await self.db.execute(
-            select(func.count(MedicalRecord.id))
-            .where(MedicalRecord.dentist_id == dentist_id)
-        )
-        total = count_result.scalar()
-        
-        # Get medical records
-        query = (
-            select(MedicalRecord)
-            .where(MedicalRecord.dentist_id == dentist_id)
-            .offset(skip)
-            .limit(limit)
-            .order_by(MedicalRecord.visit_date.desc())
+        return await self._get_page(
+            [MedicalRecord.dentist_id == dentist_id], skip, limit, cursor, include_total
         )
-        result = await self.db.execute(query)
-        records = result.scalars().all()
-        
-        return records, total
     
     async def get_all(
         self,
-        skip: int = 0,
-        limit: int = 10
-    ) -> tuple[List[MedicalRecord], int]:
+        skip: Optional[int] = None,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> tuple[List[MedicalRecord], Optional[int], Optional[str]]:
         """
-        Get all medical records with pagination.
+        Get all medical records with keyset pagination, newest visit first.
         
         Args:
-            skip (int): Number of records to skip
+            skip (Optional[int]): Deprecated offset pagination, limited to ``MAX_LEGACY_SKIP``
             limit (int): Maximum number of records to return
+            cursor (Optional[str]): Opaque cursor returned by the previous page
+            include_total (bool): Whether to compute the total count
             
         Returns:
-            tuple[List[MedicalRecord], int]: List of medical records and total count
+            tuple[List[MedicalRecord], Optional[int], Optional[str]]: List of medical
+                records, total count (None when not requested) and next page cursor
         """
-        # Get total count
-        count_result = await self.db.execute(select(func.count(MedicalRecord.id)))
-        total = count_result.scalar()
+        return await self._get_page([], skip, limit, cursor, include_total)
+    
+    async def _get_page(
+        self,
+        filters: list,
+        skip: Optional[int],
+        limit: int,
+        cursor: Optional[str],
+        include_total: bool
+    ) -> tuple[List[MedicalRecord], Optional[int], Optional[str]]:
+        """
+        Fetch one page of medical records ordered by ``(visit_date, id)`` descending.
         
-        # Get medical records
-        query = (
-            select(MedicalRecord)
-            .offset(skip)
-            .limit(limit)
-            .order_by(MedicalRecord.visit_date.desc())
+        Args:
+            filters (list): WHERE clauses shared by the page and count queries
+            skip (Optional[int]): Deprecated offset, used instead of the cursor when given
+            limit (int): Maximum number of records to return
+            cursor (Optional[str]): Opaque cursor returned by the previous page
+            include_total (bool): Whether to compute the total count
+            
+        Returns:
+            tuple[List[MedicalRecord], Optional[int], Optional[str]]: Records, total and next cursor
+        """
+        if skip is not None:
+            check_legacy_skip(skip)
+        return await paginate(
+            self.db, MedicalRecord, (MedicalRecord.visit_date, MedicalRecord.id),
+            filters, skip, limit, cursor, include_total
         )
-        result = await self.db.execute(query)
-        records = result.scalars().all()
-        
-        return records, total
     
-    async def update(self, record_id: UUID, record_data: dict) -> Optional[MedicalRecord]:
+    async def update(
+        self,
+        record_id: UUID,
+        record_data: dict,
+        dentist_id: Optional[UUID] = None
+    ) -> Optional[MedicalRecord]:
         """
-        Update medical record information.
+        Update medical record information with a single UPDATE ... RETURNING.
         
         Args:
             record_id (UUID): Medical record's unique identifier
             record_data (dict): Medical record data to update
+            dentist_id (Optional[UUID]): Only update the record if it was created by this dentist
             
         Returns:
-            Optional[MedicalRecord]: Updated medical record instance if found, None otherwise
+            Optional[MedicalRecord]: Updated medical record instance, None if no record matched
         """
         # Remove None values
         record_data = {k: v for k, v in record_data.items() if v is not None}
         
+        conditions = [MedicalRecord.id == record_id]
+        if dentist_id is not None:
+            conditions.append(MedicalRecord.dentist_id == dentist_id)
+        
         if not record_data:
-            return await self.get_by_id(record_id)
+            result = await self.db.execute(select(MedicalRecord).where(*conditions))
+            return result.scalar_one_or_none()
         
-        await self.db.execute(
+        result = await self.db.execute(
             update(MedicalRecord)
-            .where(MedicalRecord.id == record_id)
+            .where(*conditions)
             .values(**record_data)
+            .returning(MedicalRecord)
+            .execution_options(populate_existing=True)
         )
+        record = result.scalar_one_or_none()
         await self.db.commit()
         
-        return await self.get_by_id(record_id)
+        return record
     
     async def delete(self, record_id: UUID) -> bool:
         """
@@ -226,7 +309,7 @@ class MedicalRecordRepository:
         Returns:
             int: Number of recent medical records
         """
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
         result = await self.db.execute(
             select(func.count(MedicalRecord.id))
             .where(MedicalRecord.created_at >= cutoff_date)
@@ -243,8 +326,10 @@ class MedicalRecordRepository:
         Returns:
             int: Number of medical records created by the dentist
         """
+        # COUNT(*) sobre el índice (dentist_id, visit_date, id): no materializa filas
         result = await self.db.execute(
-            select(func.count(MedicalRecord.id))
+            select(func.count())
+            .select_from(MedicalRecord)
             .where(MedicalRecord.dentist_id == dentist_id)
         )
         return result.scalar()
@@ -260,9 +345,10 @@ class MedicalRecordRepository:
         Returns:
             int: Number of recent medical records by the dentist
         """
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
         result = await self.db.execute(
-            select(func.count(MedicalRecord.id))
+            select(func.count())
+            .select_from(MedicalRecord)
             .where(MedicalRecord.dentist_id == dentist_id)
             .where(MedicalRecord.created_at >= cutoff_date)
         )
@@ -286,37 +372,79 @@ class MedicalRecordRepository:
     
     async def get_upcoming_appointments(
         self,
+        dentist_id: Optional[UUID] = None,
         limit: int = 10
     ) -> List[MedicalRecord]:
         """
         Get upcoming appointments (medical records with future next_appointment).
         
         Args:
+            dentist_id (Optional[UUID]): Only return this dentist's records
             limit (int): Maximum number of records to return
             
         Returns:
             List[MedicalRecord]: List of medical records with upcoming appointments
         """
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         query = (
             select(MedicalRecord)
             .where(MedicalRecord.next_appointment >= now)
             .order_by(MedicalRecord.next_appointment)
             .limit(limit)
         )
+        if dentist_id is not None:
+            query = query.where(MedicalRecord.dentist_id == dentist_id)
         result = await self.db.execute(query)
         return result.scalars().all()
     
-    async def count_upcoming_appointments(self) -> int:
+    async def count_upcoming_appointments(self, dentist_id: Optional[UUID] = None) -> int:
         """
         Count upcoming appointments.
         
+        Args:
+            dentist_id (Optional[UUID]): Only count this dentist's appointments
+            
         Returns:
             int: Number of upcoming appointments
         """
-        now = datetime.utcnow()
-        result = await self.db.execute(
+        now = datetime.now(timezone.utc)
+        query = (
             select(func.count(MedicalRecord.id))
             .where(MedicalRecord.next_appointment >= now)
         )
+        if dentist_id is not None:
+            query = query.where(MedicalRecord.dentist_id == dentist_id)
+        result = await self.db.execute(query)
         return result.scalar()
+    
+    async def count_upcoming_and_today_appointments(
+        self,
+        dentist_id: Optional[UUID] = None
+    ) -> tuple[int, int]:
+        """
+        Count upcoming appointments and today's appointments in a single scan.
+        
+        Args:
+            dentist_id (Optional[UUID]): Only count this dentist's appointments
+            
+        Returns:
+            tuple[int, int]: Number of upcoming appointments and number of
+                appointments whose next_appointment falls on the current date
+        """
+        # Límites del día (UTC) calculados una vez; el rango [hoy, mañana) sigue siendo indexable
+        now = datetime.now(timezone.utc)
+        today_start = datetime.combine(now.date(), time.min, tzinfo=timezone.utc)
+        today_end = today_start + timedelta(days=1)
+        query = (
+            select(
+                func.count().filter(MedicalRecord.next_appointment >= now),
+                func.count().filter(MedicalRecord.next_appointment < today_end)
+            )
+            .select_from(MedicalRecord)
+            .where(MedicalRecord.next_appointment >= today_start)
+        )
+        if dentist_id is not None:
+            query = query.where(MedicalRecord.dentist_id == dentist_id)
+        result = await self.db.execute(query)
+        upcoming, today = result.one()
+        return upcoming, today
@@ -0,0 +1,88 @@
+"""
+Shared page query for the repositories' list endpoints.
+
+This module runs one page of a keyset-ordered listing and computes its total
+the same way for every repository: ``COUNT(*) OVER ()`` on first and offset
+pages, and a separate ``COUNT(*)`` only when the page carries no window total.
+"""
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.pagination import encode_cursor, decode_cursor
+
+
+async def paginate(
+    db: AsyncSession,
+    model: Any,
+    keyset: Tuple[Any, Any],
+    filters: Sequence[Any] = (),
+    skip: Optional[int] = None,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    descending: bool = True,
+    options: Sequence[Any] = ()
+) -> Tuple[List[Any], Optional[int], Optional[str]]:
+    """
+    Fetch one page of ``model`` rows ordered by ``keyset``.
+
+    ``skip`` takes precedence over ``cursor``; callers validate it with
+    ``check_legacy_skip`` where offset pagination is deprecated.
+
+    Args:
+        db (AsyncSession): Database session
+        model (Any): Mapped class to list
+        keyset (Tuple[Any, Any]): ``(timestamp column, id column)`` total order
+        filters (Sequence[Any]): WHERE clauses shared by the page and count queries
+        skip (Optional[int]): Offset, used instead of the cursor when given
+        limit (int): Maximum number of rows to return
+        cursor (Optional[str]): Opaque cursor returned by the previous page
+        include_total (bool): Whether to compute the total count
+        descending (bool): Whether to list newest first
+        options (Sequence[Any]): Loader options applied to the page query
+
+    Returns:
+        Tuple[List[Any], Optional[int], Optional[str]]: Rows, total count (None
+            when not requested) and next page cursor
+    """
+    sort_column, id_column = keyset
+    order = (sort_column.desc(), id_column.desc()) if descending else (sort_column.asc(), id_column.asc())
+
+    # (timestamp, id) es un orden total: el cursor nunca salta ni repite filas
+    query = select(model).where(*filters).order_by(*order).options(*options)
+    if skip is not None:
+        query = query.offset(skip)
+    elif cursor:
+        position = tuple_(sort_column, id_column)
+        key = decode_cursor(cursor)
+        query = query.where(position < key if descending else position > key)
+    with_total = include_total and not cursor
+    if with_total:
+        # COUNT(*) OVER () se evalúa antes del LIMIT: el total sale del mismo recorrido
+        query = query.add_columns(func.count().over().label("total"))
+    result = await db.execute(query.limit(limit))
+    if with_total:
+        rows = result.all()
+        items = [row[0] for row in rows]
+    else:
+        items = result.scalars().all()
+
+    next_cursor = None
+    if len(items) == limit:
+        last = items[-1]
+        next_cursor = encode_cursor((getattr(last, sort_column.key), getattr(last, id_column.key)))
+
+    if not include_total:
+        return items, None, next_cursor
+
+    if with_total and rows:
+        return items, rows[0].total, next_cursor
+    if with_total and not skip:
+        return items, 0, next_cursor
+
+    # Cursor pages and offsets past the end carry no window total
+    count_result = await db.execute(select(func.count()).select_from(model).where(*filters))
+    return items, count_result.scalar(), next_cursor
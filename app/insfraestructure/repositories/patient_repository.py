@@ -6,17 +6,27 @@ the API_SUMMARY specifications.
 """
 
 from typing import Optional, List
-from sqlalchemy import select, update, delete, and_, or_, func
+from sqlalchemy import select, update, delete, and_, or_, func, exists
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-from app.domain.models import Patient
+from app.domain.models import Patient, PATIENT_SEARCH_TEXT
+from app.application.pagination import check_legacy_skip
+from app.insfraestructure.repositories.pagination import paginate
+from app.insfraestructure.repositories.indexed_repository import IndexedRepositoryMixin
 
 
-class PatientRepository:
+class PatientRepository(IndexedRepositoryMixin):
     """Repository class for Patient CRUD operations."""
     
+    # (table, leading key, unique) indexes backing the point lookups of this repository
+    __required_indexes__ = (
+        ("patients", "id", True),
+        ("patients", "patient_number", True),
+    )
+    
     def __init__(self, db: AsyncSession):
         """
         Initialize PatientRepository with database session.
@@ -44,6 +54,30 @@ class PatientRepository:
         await self.db.refresh(patient)
         return patient
     
+    async def create_if_not_exists(self, patient_data: dict, created_by: UUID) -> Optional[Patient]:
+        """
+        Create a patient unless its patient number is already taken.
+        
+        The duplicate check and the insert are a single atomic
+        INSERT ... ON CONFLICT DO NOTHING RETURNING statement.
+        
+        Args:
+            patient_data (dict): Patient data
+            created_by (UUID): User ID who created the patient
+            
+        Returns:
+            Optional[Patient]: Created patient instance, None if the patient number already exists
+        """
+        result = await self.db.scalars(
+            pg_insert(Patient)
+            .values(**patient_data, created_by=created_by)
+            .on_conflict_do_nothing(index_elements=[Patient.patient_number])
+            .returning(Patient)
+        )
+        patient = result.one_or_none()
+        await self.db.commit()
+        return patient
+    
     async def get_by_id(self, patient_id: UUID) -> Optional[Patient]:
         """
         Get patient by ID.
@@ -59,6 +93,40 @@ class PatientRepository:
         )
         return result.scalar_one_or_none()
     
+    async def get_by_id_for_user(
+        self,
+        patient_id: UUID,
+        created_by: Optional[UUID] = None
+    ) -> Optional[Patient]:
+        """
+        Get a patient by ID only if the caller may see it.
+        
+        Args:
+            patient_id (UUID): Patient's unique identifier
+            created_by (Optional[UUID]): Only return the patient if it was created by this user
+            
+        Returns:
+            Optional[Patient]: Patient instance, None if not found or not visible
+        """
+        conditions = [Patient.id == patient_id]
+        if created_by is not None:
+            conditions.append(Patient.created_by == created_by)
+        result = await self.db.execute(select(Patient).where(*conditions))
+        return result.scalar_one_or_none()
+    
+    async def exists(self, patient_id: UUID) -> bool:
+        """
+        Check if a patient exists (primary key probe, no row is loaded).
+        
+        Args:
+            patient_id (UUID): Patient's unique identifier
+            
+        Returns:
+            bool: True if the patient exists
+        """
+        result = await self.db.execute(select(exists().where(Patient.id == patient_id)))
+        return result.scalar()
+    
     async def get_by_email(self, email: str) -> Optional[Patient]:
         """
         Get patient by email.
@@ -76,101 +144,134 @@ class PatientRepository:
     
     async def get_all(
         self,
-        skip: int = 0,
-        limit: int = 10
-    ) -> tuple[List[Patient], int]:
+        skip: Optional[int] = None,
+        limit: int = 10,
+        include_total: bool = True,
+        cursor: Optional[str] = None,
+        creator_id: Optional[UUID] = None
+    ) -> tuple[List[Patient], Optional[int], Optional[str]]:
         """
-        Get all patients with pagination.
+        Get patients with keyset pagination, newest first.
         
         Args:
-            skip (int): Number of records to skip
+            skip (Optional[int]): Deprecated offset pagination, limited to ``MAX_LEGACY_SKIP``
             limit (int): Maximum number of records to return
+            include_total (bool): Whether to compute the total count
+            cursor (Optional[str]): Opaque cursor returned by the previous page
+            creator_id (Optional[UUID]): Only list patients created by this user
             
         Returns:
-            tuple[List[Patient], int]: List of patients and total count
+            tuple[List[Patient], Optional[int], Optional[str]]: List of patients, total
+                count (None when not requested) and next page cursor
         """
-        # Get total count
-        count_result = await self.db.execute(select(func.count(Patient.id)))
-        total = count_result.scalar()
-        
-        # Get patients
-        query = select(Patient).offset(skip).limit(limit).order_by(Patient.created_at.desc())
-        result = await self.db.execute(query)
-        patients = result.scalars().all()
+        filters = []
+        if creator_id is not None:
+            filters.append(Patient.created_by == creator_id)
         
-        return patients, total
+        if skip is not None:
+            check_legacy_skip(skip)
+        return await paginate(
+            self.db, Patient, (Patient.created_at, Patient.id),
+            filters, skip, limit, cursor, include_total
+        )
     
     async def search(
         self,
-        query: str,
+        search_term: str,
         skip: int = 0,
-        limit: int = 10
+        limit: int = 10,
+        creator_id: Optional[UUID] = None
     ) -> tuple[List[Patient], int]:
         """
-        Search patients by name, email, or phone.
+        Search patients by name, email, phone, or patient number.
         
         Args:
-            query (str): Search query
+            search_term (str): Search query
             skip (int): Number of records to skip
             limit (int): Maximum number of records to return
+            creator_id (Optional[UUID]): Restrict the search to patients created by this user
             
         Returns:
-            tuple[List[Patient], int]: List of matching patients and total count
+            tuple[List[Patient], int]: List of matching patients (best matches first) and total count
         """
-        search_pattern = f"%{query}%"
+        search_term = search_term.strip()
         
-        # Build search filter
-        search_filter = or_(
-            Patient.first_name.ilike(search_pattern),
-            Patient.last_name.ilike(search_pattern),
-            Patient.email.ilike(search_pattern),
-            Patient.phone.ilike(search_pattern)
-        )
+        # Coincidencia por subcadena (también fragmentos de 1-2 caracteres); el índice
+        # GIN de trigramas sirve ILIKE '%...%' sobre PATIENT_SEARCH_TEXT
+        escaped = search_term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        search_filter = PATIENT_SEARCH_TEXT.ilike(f"%{escaped}%", escape="\\")
+        # Las coincidencias más parecidas primero; el nombre desempata como antes
+        ordering = [
+            func.word_similarity(search_term, PATIENT_SEARCH_TEXT).desc(),
+            Patient.first_name,
+            Patient.last_name,
+            Patient.id,
+        ]
         
-        # Get total count
-        count_result = await self.db.execute(
-            select(func.count(Patient.id)).where(search_filter)
-        )
-        total = count_result.scalar()
+        if creator_id is not None:
+            search_filter = and_(search_filter, Patient.created_by == creator_id)
         
         # Get patients
         query_stmt = (
             select(Patient)
             .where(search_filter)
+            .order_by(*ordering)
             .offset(skip)
             .limit(limit)
-            .order_by(Patient.first_name, Patient.last_name)
         )
         result = await self.db.execute(query_stmt)
         patients = result.scalars().all()
         
+        # A short page already tells us the total, no COUNT(*) needed
+        if len(patients) < limit and (patients or skip == 0):
+            return patients, skip + len(patients)
+        
+        count_result = await self.db.execute(
+            select(func.count(Patient.id)).where(search_filter)
+        )
+        total = count_result.scalar()
+        
         return patients, total
     
-    async def update(self, patient_id: UUID, patient_data: dict) -> Optional[Patient]:
+    async def update(
+        self,
+        patient_id: UUID,
+        patient_data: dict,
+        created_by: Optional[UUID] = None
+    ) -> Optional[Patient]:
         """
-        Update patient information.
+        Update patient information with a single UPDATE ... RETURNING.
         
         Args:
             patient_id (UUID): Patient's unique identifier
             patient_data (dict): Patient data to update
+            created_by (Optional[UUID]): Only update the patient if it was created by this user
             
         Returns:
-            Optional[Patient]: Updated patient instance if found, None otherwise
+            Optional[Patient]: Updated patient instance, None if no patient matched
         """
         # Remove None values
         patient_data = {k: v for k, v in patient_data.items() if v is not None}
         
+        conditions = [Patient.id == patient_id]
+        if created_by is not None:
+            conditions.append(Patient.created_by == created_by)
+        
         if not patient_data:
-            return await self.get_by_id(patient_id)
+            result = await self.db.execute(select(Patient).where(*conditions))
+            return result.scalar_one_or_none()
         
-        await self.db.execute(
+        result = await self.db.execute(
             update(Patient)
-            .where(Patient.id == patient_id)
+            .where(*conditions)
             .values(**patient_data)
+            .returning(Patient)
+            .execution_options(populate_existing=True)
         )
+        patient = result.scalar_one_or_none()
         await self.db.commit()
         
-        return await self.get_by_id(patient_id)
+        return patient
     
     async def delete(self, patient_id: UUID) -> bool:
         """
@@ -208,7 +309,7 @@ class PatientRepository:
         Returns:
             int: Number of recent patients
         """
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
         result = await self.db.execute(
             select(func.count(Patient.id))
             .where(Patient.created_at >= cutoff_date)
@@ -5,32 +5,72 @@ This module implements the data access layer for User entity operations.
 """
 
 from typing import Optional, List
-from sqlalchemy import select, update, delete, and_, func
+from sqlalchemy import select, insert, update, delete, and_, func, exists
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from app.domain.models import User, UserRole
-from app.core.security import hash_password
+from app.core.security import hash_password_async
+from app.insfraestructure.repositories.cached_repository import CachedRepositoryMixin
+from app.insfraestructure.repositories.indexed_repository import IndexedRepositoryMixin
+from app.insfraestructure.repositories.pagination import paginate
 
 
-class UserRepository:
+class UserRepository(IndexedRepositoryMixin, CachedRepositoryMixin):
     """Repository for User entity database operations."""
     
+    # Only get_role is cached: it returns an immutable UserRole, not a User instance,
+    # and it only validates the dentist of a booking, never the caller's access.
+    # Writes in this process drop the written user's entry; other workers see the
+    # change once the TTL expires.
+    # get_by_id (every authenticated request) and get_by_identifier (login) always
+    # read the row, so deactivations, role changes and deletions made by any worker
+    # apply on the very next request.
+    _cached_methods = ("get_role",)
+    _ttl = 60
+    
+    # (table, leading key, unique) indexes backing the point lookups of this repository
+    __required_indexes__ = (
+        ("users", "lower((email)::text)", True),
+        ("users", "id", True),
+    )
+    
     def __init__(self, db: AsyncSession):
         """Initialize the user repository."""
         self.db = db
     
     async def create(self, user_data: dict) -> User:
-        """Create a new user."""
+        """Create a new user (INSERT ... RETURNING, no follow-up SELECT)."""
         if "password" in user_data:
-            user_data["hashed_password"] = hash_password(user_data.pop("password"))
+            user_data["hashed_password"] = await hash_password_async(user_data.pop("password"))
         
-        user = User(**user_data)
-        self.db.add(user)
+        result = await self.db.scalars(insert(User).values(**user_data).returning(User))
+        user = result.one()
         await self.db.commit()
-        await self.db.refresh(user)
         return user
     
+    async def create_if_email_free(self, user_data: dict) -> Optional[User]:
+        """
+        Create a user unless the email is already registered.
+        
+        The duplicate check is the unique constraint on users.email itself, so
+        it costs no extra round-trip and has no race with the insert. Where
+        ux_users_email exists, the check is also case-insensitive.
+        
+        Args:
+            user_data (dict): User data, with the plain ``password``
+            
+        Returns:
+            Optional[User]: Created user instance, None if the email already exists
+        """
+        try:
+            return await self.create(user_data)
+        except IntegrityError:
+            # Las únicas restricciones únicas de users son el id generado y el email
+            await self.db.rollback()
+            return None
+    
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
         """Get user by ID."""
         result = await self.db.execute(
@@ -38,10 +78,29 @@ class UserRepository:
         )
         return result.scalar_one_or_none()
     
+    async def get_role(self, user_id: UUID) -> Optional[UserRole]:
+        """Get only a user's role, or None if the user doesn't exist."""
+        result = await self.db.execute(select(User.role).where(User.id == user_id))
+        return result.scalar_one_or_none()
+    
     async def get_by_email(self, email: str) -> Optional[User]:
-        """Get user by email."""
+        """Get user by email (case-insensitive, served by ux_users_email)."""
+        result = await self.db.execute(
+            select(User).where(func.lower(User.email) == email.lower())
+        )
+        return result.scalar_one_or_none()
+    
+    async def exists_by_email(self, email: str) -> bool:
+        """Check if an email is registered (index-only probe on ux_users_email)."""
+        result = await self.db.execute(
+            select(exists().where(func.lower(User.email) == email.lower()))
+        )
+        return result.scalar()
+    
+    async def get_by_identifier(self, identifier: str) -> Optional[User]:
+        """Get user by login identifier in one query (users log in with their email)."""
         result = await self.db.execute(
-            select(User).where(User.email == email)
+            select(User).where(func.lower(User.email) == identifier.lower()).limit(1)
         )
         return result.scalar_one_or_none()
     
@@ -50,52 +109,45 @@ class UserRepository:
         skip: int = 0,
         limit: int = 10,
         role: Optional[UserRole] = None,
-        is_active: Optional[bool] = None
-    ) -> tuple[List[User], int]:
-        """Get all users with pagination and filters."""
-        query = select(User)
-        
-        if role is not None:
-            query = query.where(User.role == role)
-        
-        if is_active is not None:
-            query = query.where(User.is_active == is_active)
-        
-        count_query = select(func.count()).select_from(User)
+        is_active: Optional[bool] = None,
+        include_total: bool = True
+    ) -> tuple[List[User], Optional[int]]:
+        """Get all users with pagination and filters (total is None unless requested)."""
+        filters = []
         if role is not None:
-            count_query = count_query.where(User.role == role)
+            filters.append(User.role == role)
         if is_active is not None:
-            count_query = count_query.where(User.is_active == is_active)
+            filters.append(User.is_active == is_active)
         
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
-        
-        query = query.offset(skip).limit(limit)
-        result = await self.db.execute(query)
-        users = result.scalars().all()
-        
-        return list(users), total
+        users, total, _ = await paginate(
+            self.db, User, (User.created_at, User.id), filters, skip, limit,
+            include_total=include_total
+        )
+        return users, total
     
     async def get_by_role(self, role: UserRole) -> List[User]:
         """Get all users with a specific role."""
         result = await self.db.execute(
             select(User).where(User.role == role)
         )
-        return list(result.scalars().all())
+        return result.scalars().all()
     
     async def update(self, user_id: UUID, user_data: dict) -> Optional[User]:
         """Update user information."""
         if "password" in user_data:
-            user_data["hashed_password"] = hash_password(user_data.pop("password"))
+            user_data["hashed_password"] = await hash_password_async(user_data.pop("password"))
         
         stmt = (
             update(User)
             .where(User.id == user_id)
             .values(**user_data)
             .returning(User)
+            # The caller may already hold this user in the session: refresh it from the returned row
+            .execution_options(populate_existing=True)
         )
         result = await self.db.execute(stmt)
         await self.db.commit()
+        self._invalidate(user_id)
         return result.scalar_one_or_none()
     
     async def deactivate(self, user_id: UUID) -> Optional[User]:
@@ -107,13 +159,15 @@ class UserRepository:
         stmt = delete(User).where(User.id == user_id)
         result = await self.db.execute(stmt)
         await self.db.commit()
+        self._invalidate(user_id)
         return result.rowcount > 0
     
-    async def count_by_role(self, role: UserRole) -> int:
-        """Count users by role."""
-        result = await self.db.execute(
-            select(func.count()).select_from(User).where(User.role == role)
-        )
+    async def count_by_role(self, role: UserRole, is_active: Optional[bool] = None) -> int:
+        """Count users by role, optionally only active or inactive ones."""
+        query = select(func.count()).select_from(User).where(User.role == role)
+        if is_active is not None:
+            query = query.where(User.is_active == is_active)
+        result = await self.db.execute(query)
         return result.scalar()
     
     async def count_active_users(self) -> int:
@@ -5,6 +5,10 @@ This module configures and creates the FastAPI application with all necessary
 middleware, routes, and dependencies for the dental clinic management system.
 """
 
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -26,6 +30,8 @@ from app.presentation.api.v1.router import api_router
 
 # Settings are imported directly from app.core.config
 
+logger = logging.getLogger(__name__)
+
 def create_application() -> FastAPI:
     """
     Create and configure the FastAPI application.
@@ -39,7 +45,8 @@ def create_application() -> FastAPI:
         description="API REST para la gestión de clínicas odontológicas",
         docs_url="/docs",  # Siempre habilitado para Render
         redoc_url="/redoc",  # Siempre habilitado para Render
-        openapi_url="/openapi.json"  # Siempre habilitado para Render
+        openapi_url="/openapi.json",  # Siempre habilitado para Render
+        lifespan=lifespan
     )
     
     # Configure CORS
@@ -137,6 +144,65 @@ def setup_exception_handlers(app: FastAPI) -> None:
         )
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Run the startup checks and keep the background tasks alive while the app serves.
+    
+    Args:
+        app (FastAPI): FastAPI application instance
+    """
+    from app.domain.models import UserRole
+    from app.application.dashboard_cache import dashboard_cache, admin_metrics
+    from app.application.services.dashboard_service import fetch_admin_counters
+    
+    await validate_database_schema()
+    await check_password_hash_cost()
+    
+    # Las escrituras que invalidan el dashboard de admin fuerzan un recálculo inmediato
+    dashboard_cache.on_invalidate(UserRole.ADMIN, admin_metrics.mark_dirty)
+    admin_metrics.start(fetch_admin_counters)
+    try:
+        yield
+    finally:
+        await admin_metrics.stop()
+
+
+async def validate_database_schema() -> None:
+    """Fail fast if an index the repositories rely on is missing."""
+    from sqlalchemy.exc import SQLAlchemyError
+    from app.core.database import engine
+    from app.insfraestructure.repositories import UserRepository, PatientRepository
+    
+    logger.info(
+        "Database pool: %s (size=%d, max_overflow=%d)",
+        type(engine.pool).__name__, settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+    )
+    try:
+        async with engine.connect() as conn:
+            for repository in (UserRepository, PatientRepository):
+                await repository.validate_schema(conn)
+    except (SQLAlchemyError, OSError):
+        # Sin validar el esquema no se arranca: el proceso se reinicia y lo vuelve a intentar
+        logger.exception("Database schema validation failed")
+        raise
+
+
+async def check_password_hash_cost() -> None:
+    """Warn if BCRYPT_ROUNDS makes logins too slow or hashes too cheap, and warm the dummy hash."""
+    from app.core.security import benchmark_password_hash, dummy_password_hash
+    
+    loop = asyncio.get_running_loop()
+    elapsed = await loop.run_in_executor(None, benchmark_password_hash)
+    # Precalcula el hash de relleno para que el primer login fallido no pague dos hashes
+    await loop.run_in_executor(None, dummy_password_hash)
+    if not 150 <= elapsed <= 400:
+        logger.warning(
+            "bcrypt cost %d takes %.0f ms per hash (target 150-400 ms), consider tuning BCRYPT_ROUNDS",
+            settings.BCRYPT_ROUNDS, elapsed
+        )
+
+
 def setup_routes(app: FastAPI) -> None:
     """
     Setup API routes for the application.
@@ -4,15 +4,16 @@ API dependencies for authentication and authorization.
 This module provides dependency functions for FastAPI endpoints.
 """
 
-from typing import Optional
+from typing import Optional, Callable, Awaitable
 from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jwt import PyJWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.core.database import get_db
+from app.core.security import verify_access_token_cached
 from app.domain.models import User, UserRole
 from app.insfraestructure.repositories import UserRepository
 
@@ -47,11 +48,7 @@ async def get_current_user(
     
     try:
         # Decode JWT token
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
-        )
+        payload = verify_access_token_cached(token)
         user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
@@ -62,7 +59,7 @@ async def get_current_user(
         except ValueError:
             raise credentials_exception
             
-    except JWTError:
+    except PyJWTError:
         raise credentials_exception
     
     # Get user from database
@@ -78,142 +75,54 @@ async def get_current_user(
             detail="Inactive user"
         )
     
-    return user
-
-
-async def get_current_active_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
-    """
-    Get current active user.
+    # Devuelve la conexión al pool: con un pool pequeño, retenerla durante toda la
+    # petición deja sin conexiones a las consultas paralelas del dashboard. La
+    # sesión sigue siendo usable y pide otra conexión si el endpoint la necesita.
+    await db.close()
     
-    Args:
-        current_user: User from get_current_user dependency
-        
-    Returns:
-        User object
-        
-    Raises:
-        HTTPException: If user is inactive
-    """
-    if not current_user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Inactive user"
-        )
-    return current_user
+    return user
 
 
-async def require_admin(
-    current_user: User = Depends(get_current_user)
-) -> User:
-    """
-    Require admin role.
-    
-    Args:
-        current_user: User from get_current_user dependency
-        
-    Returns:
-        User object
-        
-    Raises:
-        HTTPException: If user is not admin
-    """
-    if current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Administrator privileges required"
-        )
-    return current_user
+# get_current_user ya rechaza usuarios inactivos: un alias evita otra capa de dependencia
+get_current_active_user = get_current_user
 
 
-async def require_dentist(
-    current_user: User = Depends(get_current_user)
-) -> User:
+def requires(*roles: UserRole, detail: str) -> Callable[..., Awaitable[User]]:
     """
-    Require dentist role.
+    Build a dependency that only lets users with one of ``roles`` through.
     
-    Args:
-        current_user: User from get_current_user dependency
-        
-    Returns:
-        User object
-        
-    Raises:
-        HTTPException: If user is not dentist
-    """
-    if current_user.role != UserRole.DENTIST:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Dentist privileges required"
-        )
-    return current_user
-
-
-async def require_receptionist(
-    current_user: User = Depends(get_current_user)
-) -> User:
-    """
-    Require receptionist role.
+    The dependency stays ``async`` on purpose: it does no I/O, and FastAPI
+    runs sync dependencies in the threadpool, which costs more than an await.
     
     Args:
-        current_user: User from get_current_user dependency
+        *roles: Roles allowed to access the endpoint
+        detail: Error message returned when access is denied
         
     Returns:
-        User object
-        
-    Raises:
-        HTTPException: If user is not receptionist
-    """
-    if current_user.role != UserRole.RECEPTIONIST:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Receptionist privileges required"
-        )
-    return current_user
-
-
-async def require_admin_or_dentist(
-    current_user: User = Depends(get_current_user)
-) -> User:
+        FastAPI dependency returning the current user
     """
-    Require admin or dentist role.
+    allowed = frozenset(roles)
     
-    Args:
-        current_user: User from get_current_user dependency
-        
-    Returns:
-        User object
-        
-    Raises:
-        HTTPException: If user is not admin or dentist
-    """
-    if current_user.role not in [UserRole.ADMIN, UserRole.DENTIST]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Administrator or Dentist privileges required"
-        )
-    return current_user
-
-
-async def require_admin_or_receptionist(
-    current_user: User = Depends(get_current_user)
-) -> User:
-    """
-    Require admin or receptionist role.
+    async def dependency(current_user: User = Depends(get_current_user)) -> User:
+        if current_user.role not in allowed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=detail
+            )
+        return current_user
     
-    Args:
-        current_user: User from get_current_user dependency
-        
-    Returns:
-        User object
-        
-    Raises:
-        HTTPException: If user is not admin or receptionist
-    """
-    if current_user.role not in [UserRole.ADMIN, UserRole.RECEPTIONIST]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Administrator or Receptionist privileges required"
-        )
-    return current_user
+    return dependency
+
+
+# Role guards
+require_admin = requires(UserRole.ADMIN, detail="Administrator privileges required")
+require_dentist = requires(UserRole.DENTIST, detail="Dentist privileges required")
+require_receptionist = requires(UserRole.RECEPTIONIST, detail="Receptionist privileges required")
+require_admin_or_dentist = requires(
+    UserRole.ADMIN, UserRole.DENTIST,
+    detail="Administrator or Dentist privileges required"
+)
+require_admin_or_receptionist = requires(
+    UserRole.ADMIN, UserRole.RECEPTIONIST,
+    detail="Administrator or Receptionist privileges required"
+)
@@ -7,6 +7,7 @@ from uuid import UUID
 from datetime import date as date_type, datetime
 
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -74,8 +75,9 @@ async def list_appointments(
     status: Optional[AppointmentStatus] = Query(None, description="Filter by appointment status"),
     start_date: Optional[date_type] = Query(None, description="Filter appointments from this date"),
     end_date: Optional[date_type] = Query(None, description="Filter appointments until this date"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(20, ge=1, le=100, description="Maximum number of records to return"),
+    after: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
+    per_page: int = Query(20, ge=1, le=100, description="Maximum number of records to return"),
+    page: Optional[int] = Query(None, ge=1, deprecated=True, description="Page number (use 'after' instead)"),
     current_user: User = Depends(get_current_user),
     service: AppointmentService = Depends(get_appointment_service)
 ) -> AppointmentListResponse:
@@ -84,24 +86,64 @@ async def list_appointments(
     - ADMIN/RECEPTIONIST: Can see all appointments
     - DENTIST: Can only see their own appointments
     - Other roles: Access denied
+    
+    Pages are walked with the opaque ``next_cursor``; ``page`` is kept for
+    older clients and is limited to shallow offsets.
     """
-    appointments, total = await service.list_appointments(
+    appointments, total, next_cursor = await service.list_appointments(
         current_user=current_user,
         patient_id=patient_id,
         dentist_id=dentist_id,
         status=status,
         start_date=start_date,
         end_date=end_date,
-        skip=skip,
-        limit=limit
+        cursor=after,
+        per_page=per_page,
+        page=page
     )
     
     return AppointmentListResponse(
-        appointments=[AppointmentResponse.model_validate(apt) for apt in appointments],
+        data=appointments,
         total=total,
-        skip=skip,
-        limit=limit
+        page=page,
+        per_page=per_page,
+        total_pages=(total + per_page - 1) // per_page if total is not None else None,
+        next_cursor=next_cursor
+    )
+
+
+@router.get(
+    "/export",
+    summary="Export appointments",
+    description="Stream every matching appointment as newline-delimited JSON. Results depend on user role."
+)
+async def export_appointments(
+    patient_id: Optional[UUID] = Query(None, description="Filter by patient ID"),
+    dentist_id: Optional[UUID] = Query(None, description="Filter by dentist ID"),
+    status: Optional[AppointmentStatus] = Query(None, description="Filter by appointment status"),
+    start_date: Optional[date_type] = Query(None, description="Filter appointments from this date"),
+    end_date: Optional[date_type] = Query(None, description="Filter appointments until this date"),
+    current_user: User = Depends(get_current_user),
+    service: AppointmentService = Depends(get_appointment_service)
+) -> StreamingResponse:
+    """
+    Export appointments without holding the whole result set in memory.
+    One JSON object per line, in schedule order.
+    """
+    appointments = service.list_appointments_stream(
+        current_user=current_user,
+        patient_id=patient_id,
+        dentist_id=dentist_id,
+        status=status,
+        start_date=start_date,
+        end_date=end_date
     )
+    
+    async def ndjson():
+        async for appointment in appointments:
+            yield appointment.model_dump_json() + "\n"
+    
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
 
 
 @router.get(
@@ -116,11 +158,11 @@ async def get_appointment(
     service: AppointmentService = Depends(get_appointment_service)
 ) -> AppointmentDetailResponse:
     """Get detailed information about an appointment including patient and dentist details."""
-    appointment = await service.get_appointment(
+    return await service.get_appointment(
         appointment_id=appointment_id,
-        current_user=current_user
+        current_user=current_user,
+        detailed=True
     )
-    return AppointmentDetailResponse.model_validate(appointment)
 
 
 @router.put(
@@ -300,9 +342,8 @@ async def get_my_upcoming_appointments(
     Get upcoming appointments for the current dentist.
     Only available for users with DENTIST role.
     """
-    appointments = await service.get_upcoming_appointments(
+    return await service.get_upcoming_appointments(
+        current_user=current_user,
         dentist_id=current_user.id,
-        limit=limit,
-        current_user=current_user
+        limit=limit
     )
-    return [AppointmentResponse.model_validate(apt) for apt in appointments]
@@ -50,8 +50,8 @@ async def login(
 @router.get("/me", response_model=UserMeResponse, summary="Get current user")
 async def get_me(current_user: User = Depends(get_current_user)):
     """Get current user information."""
-    return UserMeResponse(
-        id=str(current_user.id),
+    return UserMeResponse.model_construct(
+        id=current_user.sub,
         email=current_user.email,
         first_name=current_user.first_name,
         last_name=current_user.last_name,
@@ -68,7 +68,7 @@ async def refresh_token(
 ):
     """Refresh the access token for current user."""
     try:
-        token = await auth_service.create_user_token(current_user)
+        token = auth_service.create_user_token(current_user)
         return token
     except Exception as e:
         raise HTTPException(
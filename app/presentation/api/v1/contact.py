@@ -4,9 +4,10 @@ Contact request endpoints for the OdontoLab system.
 This module provides endpoints for managing contact requests from the public form.
 """
 
-from typing import Optional
+from typing import Optional, List
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -19,10 +20,13 @@ from app.domain.models import User, ContactStatus
 from app.application.services import ContactService
 from app.insfraestructure.repositories import ContactRequestRepository
 from app.presentation.api.dependencies import get_current_user, require_admin_or_receptionist
-from app.application.exceptions import NotFoundError, PermissionError
+from app.application.exceptions import NotFoundError, PermissionError, ValidationError
 
 router = APIRouter()
 
+# Validación por lotes de las listas de respuesta
+_CONTACT_LIST_ADAPTER = TypeAdapter(List[ContactRequestResponse])
+
 
 async def get_contact_service(db: AsyncSession = Depends(get_db)) -> ContactService:
     """Dependency to get contact service."""
@@ -68,8 +72,9 @@ async def create_contact_request(
     summary="Get all contact requests"
 )
 async def get_contact_requests(
-    page: int = Query(1, ge=1, description="Page number"),
+    after: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
     per_page: int = Query(10, ge=1, le=100, description="Items per page"),
+    page: Optional[int] = Query(None, ge=1, deprecated=True, description="Page number (use 'after' instead)"),
     status: Optional[ContactStatus] = Query(None, description="Filter by status"),
     contact_service: ContactService = Depends(get_contact_service),
     current_user: User = Depends(require_admin_or_receptionist)
@@ -77,34 +82,45 @@ async def get_contact_requests(
     """
     Get all contact requests with pagination (Admin and Receptionist only).
     
+    Pages are walked with the opaque ``next_cursor``; ``page`` is kept for
+    older clients and is limited to shallow offsets.
+    
     Args:
-        page: Page number
+        after: Cursor of the previous page
         per_page: Items per page
+        page: Deprecated page number
         status: Optional status filter (pending, contacted, resolved)
         
     Returns:
         Paginated list of contact requests
     """
     try:
-        contacts, total = await contact_service.get_all_contact_requests(
+        contacts, total, next_cursor = await contact_service.get_all_contact_requests(
             page=page,
             per_page=per_page,
             status=status,
-            current_user=current_user
+            current_user=current_user,
+            cursor=after
         )
         
         # Calculate total pages
-        total_pages = (total + per_page - 1) // per_page
+        total_pages = (total + per_page - 1) // per_page if total is not None else None
         
         return ContactRequestListResponse(
             success=True,
-            data=[ContactRequestResponse.model_validate(contact) for contact in contacts],
+            data=_CONTACT_LIST_ADAPTER.validate_python(contacts, from_attributes=True),
             total=total,
             page=page,
             per_page=per_page,
-            total_pages=total_pages
+            total_pages=total_pages,
+            next_cursor=next_cursor
         )
         
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except PermissionError as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -134,7 +150,7 @@ async def get_pending_contact_requests(
     """
     try:
         contacts = await contact_service.get_pending_contact_requests(current_user)
-        return [ContactRequestResponse.model_validate(contact) for contact in contacts]
+        return _CONTACT_LIST_ADAPTER.validate_python(contacts, from_attributes=True)
         
     except PermissionError as e:
         raise HTTPException(
@@ -4,11 +4,10 @@ Dashboard endpoints for the OdontoLab system.
 This module provides dashboard statistics based on user role.
 """
 
+from functools import lru_cache
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Union
 
-from app.core.database import get_db
 from app.domain.schemas.dashboard_schemas import (
     AdminDashboardStats,
     DentistDashboardStats,
@@ -16,31 +15,15 @@ from app.domain.schemas.dashboard_schemas import (
 )
 from app.domain.models import User, UserRole
 from app.application.services import DashboardService
-from app.insfraestructure.repositories import (
-    UserRepository,
-    PatientRepository,
-    MedicalRecordRepository,
-    ContactRequestRepository
-)
 from app.presentation.api.dependencies import get_current_user
 
 router = APIRouter()
 
 
-async def get_dashboard_service(
-    db: AsyncSession = Depends(get_db)
-) -> DashboardService:
-    """Dependency to get dashboard service."""
-    user_repository = UserRepository(db)
-    patient_repository = PatientRepository(db)
-    medical_record_repository = MedicalRecordRepository(db)
-    contact_repository = ContactRequestRepository(db)
-    return DashboardService(
-        user_repository,
-        patient_repository,
-        medical_record_repository,
-        contact_repository
-    )
+@lru_cache(maxsize=1)
+def get_dashboard_service() -> DashboardService:
+    """Dependency to get the dashboard service (one instance per process)."""
+    return DashboardService()
 
 
 @router.get(
@@ -11,7 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.core.database import get_db, Base, engine
-from app.core.security import hash_password
+from app.core.security import hash_password_async, secrets_match
 from app.domain.models import User, UserRole, Patient, ContactRequest
 
 router = APIRouter(tags=["Database Init"])
@@ -28,7 +28,7 @@ async def verify_init_token(x_init_token: Optional[str] = Header(None)):
             detail="INIT_DB_TOKEN not configured"
         )
     
-    if x_init_token != expected_token:
+    if not secrets_match(x_init_token, expected_token):
         raise HTTPException(
             status_code=403,
             detail="Invalid initialization token"
@@ -65,12 +65,19 @@ async def initialize_database_endpoint(
                 "timestamp": datetime.utcnow().isoformat()
             }
         
+        # Los tres hashes se calculan en paralelo en el pool de bcrypt, fuera del event loop
+        admin_hash, dentist_hash, receptionist_hash = await asyncio.gather(
+            hash_password_async('admin123'),
+            hash_password_async('dentista123'),
+            hash_password_async('recepcion123'),
+        )
+        
         # Crear usuarios por defecto
         users = [
             User(
                 email='admin@odontolab.com',
                 full_name='Administrador Principal',
-                hashed_password=hash_password('admin123'),
+                hashed_password=admin_hash,
                 role=UserRole.ADMIN,
                 phone='0999999999',
                 is_active=True
@@ -78,7 +85,7 @@ async def initialize_database_endpoint(
             User(
                 email='dentista@odontolab.com',
                 full_name='Dr. Juan Pérez',
-                hashed_password=hash_password('dentista123'),
+                hashed_password=dentist_hash,
                 role=UserRole.DENTIST,
                 phone='0988888888',
                 is_active=True
@@ -86,7 +93,7 @@ async def initialize_database_endpoint(
             User(
                 email='recepcion@odontolab.com',
                 full_name='María González',
-                hashed_password=hash_password('recepcion123'),
+                hashed_password=receptionist_hash,
                 role=UserRole.RECEPTIONIST,
                 phone='0977777777',
                 is_active=True
@@ -4,9 +4,10 @@ Medical records management endpoints for the OdontoLab system.
 This module provides CRUD operations for medical records management.
 """
 
-from typing import Optional
+from typing import Optional, List
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -24,6 +25,9 @@ from app.application.exceptions import NotFoundError, ValidationError, Permissio
 
 router = APIRouter()
 
+# Validación por lotes de las listas de respuesta
+_MEDICAL_RECORD_LIST_ADAPTER = TypeAdapter(List[MedicalRecordResponse])
+
 
 async def get_medical_record_service(
     db: AsyncSession = Depends(get_db)
@@ -89,8 +93,9 @@ async def create_medical_record(
     summary="Get all medical records"
 )
 async def get_medical_records(
-    page: int = Query(1, ge=1, description="Page number"),
+    after: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
     per_page: int = Query(10, ge=1, le=100, description="Items per page"),
+    page: Optional[int] = Query(None, ge=1, deprecated=True, description="Page number (use 'after' instead)"),
     medical_record_service: MedicalRecordService = Depends(get_medical_record_service),
     current_user: User = Depends(get_current_user)
 ):
@@ -100,32 +105,43 @@ async def get_medical_records(
     Dentists can only see their own records.
     Admins and receptionists can see all records.
     
+    Pages are walked with the opaque ``next_cursor``; ``page`` is kept for
+    older clients and is limited to shallow offsets.
+    
     Args:
-        page: Page number
+        after: Cursor of the previous page
         per_page: Items per page
+        page: Deprecated page number
         
     Returns:
         Paginated list of medical records
     """
     try:
-        records, total = await medical_record_service.get_all_medical_records(
+        records, total, next_cursor = await medical_record_service.get_all_medical_records(
             page=page,
             per_page=per_page,
-            current_user=current_user
+            current_user=current_user,
+            cursor=after
         )
         
         # Calculate total pages
-        total_pages = (total + per_page - 1) // per_page
+        total_pages = (total + per_page - 1) // per_page if total is not None else None
         
         return MedicalRecordListResponse(
             success=True,
-            data=[MedicalRecordResponse.model_validate(record) for record in records],
+            data=_MEDICAL_RECORD_LIST_ADAPTER.validate_python(records, from_attributes=True),
             total=total,
             page=page,
             per_page=per_page,
-            total_pages=total_pages
+            total_pages=total_pages,
+            next_cursor=next_cursor
         )
         
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -160,7 +176,7 @@ async def get_records_by_patient(
             patient_id,
             current_user
         )
-        return [MedicalRecordResponse.model_validate(record) for record in records]
+        return _MEDICAL_RECORD_LIST_ADAPTER.validate_python(records, from_attributes=True)
         
     except NotFoundError as e:
         raise HTTPException(
@@ -198,7 +214,7 @@ async def get_upcoming_appointments(
     """
     try:
         records = await medical_record_service.get_upcoming_appointments()
-        return [MedicalRecordResponse.model_validate(record) for record in records]
+        return _MEDICAL_RECORD_LIST_ADAPTER.validate_python(records, from_attributes=True)
         
     except Exception as e:
         raise HTTPException(
@@ -4,9 +4,10 @@ Patient management endpoints for the OdontoLab system.
 This module provides CRUD operations for patient management.
 """
 
-from typing import Optional
+from typing import Optional, List
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -20,10 +21,13 @@ from app.domain.models import User
 from app.application.services import PatientService
 from app.insfraestructure.repositories import PatientRepository
 from app.presentation.api.dependencies import get_current_user, require_admin
-from app.application.exceptions import NotFoundError, ValidationError, PermissionError
+from app.application.exceptions import NotFoundError, ValidationError, PermissionError, ConflictError
 
 router = APIRouter()
 
+# Validación por lotes de las listas de respuesta
+_PATIENT_LIST_ADAPTER = TypeAdapter(List[PatientResponse])
+
 
 async def get_patient_service(db: AsyncSession = Depends(get_db)) -> PatientService:
     """Dependency to get patient service."""
@@ -57,6 +61,11 @@ async def create_patient(
         patient = await patient_service.create_patient(patient_data, current_user)
         return PatientResponse.model_validate(patient)
         
+    except ConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
     except ValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -75,8 +84,9 @@ async def create_patient(
     summary="Get all patients"
 )
 async def get_patients(
-    page: int = Query(1, ge=1, description="Page number"),
+    after: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
     per_page: int = Query(10, ge=1, le=100, description="Items per page"),
+    page: Optional[int] = Query(None, ge=1, deprecated=True, description="Page number (use 'after' instead)"),
     patient_service: PatientService = Depends(get_patient_service),
     current_user: User = Depends(get_current_user)
 ):
@@ -86,32 +96,43 @@ async def get_patients(
     Receptionists can only see patients they created.
     Admins and dentists can see all patients.
     
+    Pages are walked with the opaque ``next_cursor``; ``page`` is kept for
+    older clients and is limited to shallow offsets.
+    
     Args:
-        page: Page number
+        after: Cursor of the previous page
         per_page: Items per page
+        page: Deprecated page number
         
     Returns:
         Paginated list of patients
     """
     try:
-        patients, total = await patient_service.get_all_patients(
+        patients, total, next_cursor = await patient_service.get_all_patients(
             page=page,
             per_page=per_page,
-            current_user=current_user
+            current_user=current_user,
+            cursor=after
         )
         
         # Calculate total pages
-        total_pages = (total + per_page - 1) // per_page
+        total_pages = (total + per_page - 1) // per_page if total is not None else None
         
         return PatientListResponse(
             success=True,
-            data=[PatientResponse.model_validate(patient) for patient in patients],
+            data=_PATIENT_LIST_ADAPTER.validate_python(patients, from_attributes=True),
             total=total,
             page=page,
             per_page=per_page,
-            total_pages=total_pages
+            total_pages=total_pages,
+            next_cursor=next_cursor
         )
         
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -158,7 +179,7 @@ async def search_patients(
         
         return PatientListResponse(
             success=True,
-            data=[PatientResponse.model_validate(patient) for patient in patients],
+            data=_PATIENT_LIST_ADAPTER.validate_python(patients, from_attributes=True),
             total=total,
             page=page,
             per_page=per_page,
@@ -8,7 +8,7 @@ from sqlalchemy.future import select
 from pydantic import BaseModel, EmailStr, Field
 
 from app.core.database import get_db, engine, Base
-from app.core.security import hash_password
+from app.core.security import hash_password_async
 from app.domain.models import User, UserRole
 
 router = APIRouter(tags=["Setup"])
@@ -105,7 +105,7 @@ async def register_first_admin(
             email=data.email,
             first_name=data.first_name,
             last_name=data.last_name,
-            hashed_password=hash_password(data.password),
+            hashed_password=await hash_password_async(data.password),
             role=UserRole.ADMIN,
             is_active=True
         )
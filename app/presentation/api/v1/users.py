@@ -55,7 +55,7 @@ async def create_user(
         user = await user_service.create_user(user_data)
         
         # Convert User model to UserResponse schema
-        return UserResponse(
+        return UserResponse.model_construct(
             id=str(user.id),
             email=user.email,
             first_name=user.first_name,
@@ -120,7 +120,7 @@ async def get_users(
         
         # Convert User models to UserResponse schemas
         user_responses = [
-            UserResponse(
+            UserResponse.model_construct(
                 id=str(user.id),
                 email=user.email,
                 first_name=user.first_name,
@@ -133,7 +133,7 @@ async def get_users(
             for user in users
         ]
         
-        return UserListResponse(
+        return UserListResponse.model_construct(
             success=True,
             data=user_responses,
             total=total,
@@ -175,7 +175,7 @@ async def get_user(
     try:
         user = await user_service.get_user_by_id(user_id)
         
-        return UserResponse(
+        return UserResponse.model_construct(
             id=str(user.id),
             email=user.email,
             first_name=user.first_name,
@@ -225,7 +225,7 @@ async def update_user(
     try:
         user = await user_service.update_user(user_id, user_data)
         
-        return UserResponse(
+        return UserResponse.model_construct(
             id=str(user.id),
             email=user.email,
             first_name=user.first_name,
@@ -287,7 +287,7 @@ async def deactivate_user(
     try:
         user = await user_service.deactivate_user(user_id, current_user)
         
-        return UserResponse(
+        return UserResponse.model_construct(
             id=str(user.id),
             email=user.email,
             first_name=user.first_name,
@@ -6,6 +6,9 @@
 -- Crear extensión para UUIDs
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 
+-- Crear extensión para búsqueda por trigramas
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- Eliminar tablas si existen (para reinicializar)
 DROP TABLE IF EXISTS contact_requests CASCADE;
 DROP TABLE IF EXISTS medical_records CASCADE;
@@ -33,14 +36,18 @@ CREATE TABLE users (
 
 -- Índices para users
 CREATE INDEX idx_users_email ON users(email);
+-- En bases existentes crear con CREATE UNIQUE INDEX CONCURRENTLY
+CREATE UNIQUE INDEX ux_users_email ON users(lower(email));
 CREATE INDEX idx_users_role ON users(role);
 CREATE INDEX idx_users_is_active ON users(is_active);
+CREATE INDEX ix_users_created_at_id ON users(created_at, id);
 
 -- ============================================
 -- TABLA: patients
 -- ============================================
 CREATE TABLE patients (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    patient_number VARCHAR(20) UNIQUE,
     first_name VARCHAR(100) NOT NULL,
     last_name VARCHAR(100) NOT NULL,
     email VARCHAR(255) NOT NULL,
@@ -61,11 +68,16 @@ CREATE INDEX idx_patients_email ON patients(email);
 CREATE INDEX idx_patients_phone ON patients(phone);
 CREATE INDEX idx_patients_created_by ON patients(created_by);
 CREATE INDEX idx_patients_name ON patients(first_name, last_name);
+CREATE INDEX ix_patients_created_at_id ON patients(created_at, id);
 
 -- Índice de texto completo para búsqueda
 CREATE INDEX idx_patients_fulltext ON patients 
 USING gin(to_tsvector('spanish', first_name || ' ' || last_name || ' ' || email));
 
+-- Índice de trigramas para la búsqueda libre (nombre, email, teléfono, número de paciente)
+CREATE INDEX ix_patients_search_trgm ON patients
+USING gin((first_name || ' ' || last_name || ' ' || email || ' ' || phone || ' ' || coalesce(patient_number, '')) gin_trgm_ops);
+
 -- ============================================
 -- TABLA: medical_records
 -- ============================================
@@ -92,6 +104,8 @@ CREATE TABLE medical_records (
 CREATE INDEX idx_medical_records_patient_id ON medical_records(patient_id);
 CREATE INDEX idx_medical_records_dentist_id ON medical_records(dentist_id);
 CREATE INDEX idx_medical_records_visit_date ON medical_records(visit_date);
+CREATE INDEX ix_medical_records_patient_id_visit_date ON medical_records(patient_id, visit_date DESC, id DESC);
+CREATE INDEX ix_medical_records_dentist_id_visit_date ON medical_records(dentist_id, visit_date DESC, id DESC);
 CREATE INDEX idx_medical_records_next_appointment ON medical_records(next_appointment);
 
 -- Índice GIN para búsqueda en teeth_chart JSON
@@ -0,0 +1,80 @@
+"""Tests for the appointment detail response and its endpoint."""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.application.services.appointment_service import AppointmentService
+from app.domain.models.enums import AppointmentStatus
+from app.domain.models.user_model import UserRole
+from app.domain.schemas.appointment_schemas import AppointmentDetailResponse, AppointmentResponse
+from app.presentation.api.v1.appointments import get_appointment
+
+
+def make_appointment(**related):
+    now = datetime.now(timezone.utc)
+    return SimpleNamespace(
+        id=uuid4(),
+        patient_id=uuid4(),
+        dentist_id=uuid4(),
+        scheduled_time=now + timedelta(days=1),
+        duration_minutes=30,
+        status=AppointmentStatus.SCHEDULED,
+        reason="Limpieza dental",
+        notes=None,
+        created_by=uuid4(),
+        created_at=now,
+        updated_at=now,
+        **related
+    )
+
+
+class StubRepository:
+    def __init__(self, appointment):
+        self.appointment = appointment
+    
+    async def get_by_id_or_raise(self, appointment_id, load_relations=False):
+        return self.appointment
+
+
+def test_detail_reads_loaded_relations():
+    appointment = make_appointment(
+        patient=SimpleNamespace(full_name="María García", phone="3001234567"),
+        dentist=SimpleNamespace(full_name="Carlos Méndez")
+    )
+    
+    detail = AppointmentDetailResponse.model_validate(appointment)
+    
+    assert detail.id == appointment.id
+    assert detail.patient_name == "María García"
+    assert detail.patient_phone == "3001234567"
+    assert detail.dentist_name == "Carlos Méndez"
+
+
+def test_detail_accepts_a_basic_response():
+    basic = AppointmentResponse.model_validate(make_appointment(patient=None, dentist=None))
+    
+    detail = AppointmentDetailResponse.model_validate(basic)
+    
+    assert detail.id == basic.id
+    assert detail.patient_name is None
+    assert detail.dentist_name is None
+
+
+@pytest.mark.asyncio
+async def test_get_appointment_endpoint_returns_details():
+    appointment = make_appointment(
+        patient=SimpleNamespace(full_name="María García", phone="3001234567"),
+        dentist=SimpleNamespace(full_name="Carlos Méndez")
+    )
+    service = AppointmentService(session=None)
+    service.repository = StubRepository(appointment)
+    admin = SimpleNamespace(id=uuid4(), role=UserRole.ADMIN)
+    
+    response = await get_appointment(appointment.id, current_user=admin, service=service)
+    
+    assert isinstance(response, AppointmentDetailResponse)
+    assert response.patient_name == "María García"
+    assert response.dentist_name == "Carlos Méndez"
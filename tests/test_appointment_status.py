@@ -0,0 +1,165 @@
+"""Tests for the conditional appointment status update and its transition guard."""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.application.exceptions import AuthorizationError, ValidationError
+from app.application.services.appointment_service import (
+    _CANCELLABLE_STATUSES,
+    _PREVIOUS_STATUSES,
+    _VALID_TRANSITIONS,
+    AppointmentService,
+)
+from app.domain.models.enums import AppointmentStatus
+from app.domain.models.user_model import UserRole
+from app.domain.schemas.appointment_schemas import AppointmentStatusUpdate
+from app.insfraestructure.repositories.appointment_repository import AppointmentRepository
+
+
+class RecordingSession:
+    """Session stub that records the statements it is asked to run."""
+    
+    def __init__(self, row=None):
+        self.row = row
+        self.statements = []
+        self.commits = 0
+    
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return SimpleNamespace(scalar_one_or_none=lambda: self.row)
+    
+    async def commit(self):
+        self.commits += 1
+
+
+class StubRepository:
+    """Appointment repository stub for the service-level fallbacks."""
+    
+    def __init__(self, appointment):
+        self.appointment = appointment
+        self.conditional_calls = []
+    
+    async def update_status_conditional(self, *args, **kwargs):
+        self.conditional_calls.append((args, kwargs))
+        return None
+    
+    async def get_by_id_or_raise(self, appointment_id, load_relations=False):
+        return self.appointment
+
+
+def compile_where(stmt):
+    return stmt.whereclause.compile(dialect=postgresql.dialect())
+
+
+def make_service(appointment):
+    service = AppointmentService(session=None)
+    service.repository = StubRepository(appointment)
+    return service
+
+
+def test_previous_statuses_invert_valid_transitions():
+    for new_status in AppointmentStatus:
+        for current in AppointmentStatus:
+            allowed = new_status in _VALID_TRANSITIONS.get(current, frozenset())
+            assert (current in _PREVIOUS_STATUSES[new_status]) == allowed
+
+
+def test_final_statuses_cannot_be_left():
+    for current in (AppointmentStatus.COMPLETED, AppointmentStatus.CANCELLED, AppointmentStatus.NO_SHOW):
+        assert all(current not in previous for previous in _PREVIOUS_STATUSES.values())
+        assert current not in _CANCELLABLE_STATUSES
+
+
+@pytest.mark.asyncio
+async def test_empty_allowed_statuses_skip_the_update():
+    session = RecordingSession()
+    repository = AppointmentRepository(session)
+    
+    result = await repository.update_status_conditional(
+        uuid4(), AppointmentStatus.SCHEDULED, _PREVIOUS_STATUSES[AppointmentStatus.SCHEDULED]
+    )
+    
+    assert result is None
+    assert session.statements == []
+
+
+@pytest.mark.asyncio
+async def test_update_is_guarded_by_current_status():
+    row = object()
+    session = RecordingSession(row)
+    repository = AppointmentRepository(session)
+    
+    result = await repository.update_status_conditional(
+        uuid4(), AppointmentStatus.COMPLETED, _PREVIOUS_STATUSES[AppointmentStatus.COMPLETED]
+    )
+    
+    assert result is row
+    assert session.commits == 1
+    stmt = session.statements[0]
+    assert "RETURNING" in str(stmt.compile(dialect=postgresql.dialect()))
+    compiled = compile_where(stmt)
+    assert "appointments.status IN" in str(compiled)
+    assert "appointments.dentist_id" not in str(compiled)
+    guarded = [value for value in compiled.params.values() if isinstance(value, list)]
+    assert guarded == [[AppointmentStatus.IN_PROGRESS]]
+
+
+@pytest.mark.asyncio
+async def test_update_can_be_scoped_to_a_dentist():
+    session = RecordingSession()
+    repository = AppointmentRepository(session)
+    dentist_id = uuid4()
+    
+    await repository.update_status_conditional(
+        uuid4(), AppointmentStatus.CANCELLED, _CANCELLABLE_STATUSES, dentist_id=dentist_id
+    )
+    
+    compiled = compile_where(session.statements[0])
+    assert "appointments.dentist_id = " in str(compiled)
+    assert dentist_id in compiled.params.values()
+
+
+@pytest.mark.asyncio
+async def test_invalid_transition_is_reported_when_no_row_matches():
+    dentist = SimpleNamespace(id=uuid4(), role=UserRole.DENTIST)
+    appointment = SimpleNamespace(dentist_id=dentist.id, status=AppointmentStatus.COMPLETED)
+    service = make_service(appointment)
+    
+    with pytest.raises(ValidationError, match="Invalid status transition from completed"):
+        await service.update_appointment_status(
+            uuid4(), AppointmentStatusUpdate(status=AppointmentStatus.CONFIRMED), dentist
+        )
+    
+    (_, new_status, allowed), kwargs = service.repository.conditional_calls[0]
+    assert new_status == AppointmentStatus.CONFIRMED
+    assert allowed == {AppointmentStatus.SCHEDULED}
+    assert kwargs["dentist_id"] == dentist.id
+
+
+@pytest.mark.asyncio
+async def test_other_dentists_appointment_is_forbidden():
+    dentist = SimpleNamespace(id=uuid4(), role=UserRole.DENTIST)
+    appointment = SimpleNamespace(dentist_id=uuid4(), status=AppointmentStatus.SCHEDULED)
+    service = make_service(appointment)
+    
+    with pytest.raises(AuthorizationError):
+        await service.update_appointment_status(
+            uuid4(), AppointmentStatusUpdate(status=AppointmentStatus.CONFIRMED), dentist
+        )
+
+
+@pytest.mark.asyncio
+async def test_valid_transition_without_match_is_a_concurrent_change():
+    receptionist = SimpleNamespace(id=uuid4(), role=UserRole.RECEPTIONIST)
+    appointment = SimpleNamespace(dentist_id=uuid4(), status=AppointmentStatus.SCHEDULED)
+    service = make_service(appointment)
+    
+    with pytest.raises(ValidationError, match="modified concurrently"):
+        await service.update_appointment_status(
+            uuid4(), AppointmentStatusUpdate(status=AppointmentStatus.CONFIRMED), receptionist
+        )
+    
+    assert service.repository.conditional_calls[0][1]["dentist_id"] is None
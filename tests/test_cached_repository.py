@@ -0,0 +1,170 @@
+"""Tests for the repository read-through cache."""
+
+import pytest
+
+from app.insfraestructure.repositories import cached_repository
+from app.insfraestructure.repositories.cached_repository import CachedRepositoryMixin
+
+
+class FakeClock:
+    """Stand-in for ``time.monotonic`` that only moves when told to."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cached_repository.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+def repository_class():
+    # Cada test define su propia clase: la caché es compartida por clase
+    class CountingRepository(CachedRepositoryMixin):
+        _cached_methods = ("get_value", "get_other")
+        _ttl = 60
+        
+        def __init__(self):
+            self.calls = []
+        
+        async def get_value(self, key, missing=False):
+            self.calls.append(("get_value", key))
+            return None if missing else f"value-{key}"
+        
+        async def get_other(self, key):
+            self.calls.append(("get_other", key))
+            return f"other-{key}"
+        
+        async def get_uncached(self, key):
+            self.calls.append(("get_uncached", key))
+            return key
+        
+        async def write(self, key):
+            self._invalidate(key)
+    
+    return CountingRepository
+
+
+@pytest.mark.asyncio
+async def test_repeated_calls_hit_the_cache(clock, repository_class):
+    repository = repository_class()
+    
+    assert await repository.get_value(1) == "value-1"
+    assert await repository.get_value(1) == "value-1"
+    
+    assert repository.calls == [("get_value", 1)]
+
+
+@pytest.mark.asyncio
+async def test_cache_is_shared_between_instances(clock, repository_class):
+    first, second = repository_class(), repository_class()
+    
+    await first.get_value(1)
+    await second.get_value(1)
+    
+    assert first.calls == [("get_value", 1)]
+    assert second.calls == []
+
+
+@pytest.mark.asyncio
+async def test_entries_are_keyed_by_arguments(clock, repository_class):
+    repository = repository_class()
+    
+    await repository.get_value(1)
+    await repository.get_value(2)
+    await repository.get_value(key=1)
+    
+    assert repository.calls == [("get_value", 1), ("get_value", 2), ("get_value", 1)]
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl(clock, repository_class):
+    repository = repository_class()
+    
+    await repository.get_value(1)
+    clock.now += 59.9
+    await repository.get_value(1)
+    clock.now += 0.2
+    await repository.get_value(1)
+    
+    assert repository.calls == [("get_value", 1), ("get_value", 1)]
+
+
+@pytest.mark.asyncio
+async def test_none_results_are_not_cached(clock, repository_class):
+    repository = repository_class()
+    
+    assert await repository.get_value(1, missing=True) is None
+    assert await repository.get_value(1, missing=True) is None
+    
+    assert len(repository.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_uncached_methods_are_left_alone(clock, repository_class):
+    repository = repository_class()
+    
+    await repository.get_uncached(1)
+    await repository.get_uncached(1)
+    
+    assert len(repository.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_only_matching_entries(clock, repository_class):
+    repository = repository_class()
+    for key in (1, 2):
+        await repository.get_value(key)
+        await repository.get_other(key)
+    repository.calls.clear()
+    
+    await repository.write(1)
+    for key in (1, 2):
+        await repository.get_value(key)
+        await repository.get_other(key)
+    
+    assert repository.calls == [("get_value", 1), ("get_other", 1)]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_without_arguments_clears_everything(clock, repository_class):
+    repository = repository_class()
+    await repository.get_value(1)
+    await repository.get_other(2)
+    repository.calls.clear()
+    
+    repository._invalidate()
+    await repository.get_value(1)
+    await repository.get_other(2)
+    
+    assert repository.calls == [("get_value", 1), ("get_other", 2)]
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted(clock):
+    class SmallCache:
+        def __init__(self):
+            self.calls = []
+        
+        @cached_repository._ttl_cache(ttl=60, maxsize=2)
+        async def get(self, key):
+            self.calls.append(key)
+            return key
+    
+    repository = SmallCache()
+    await repository.get(1)
+    await repository.get(2)
+    await repository.get(1)
+    await repository.get(3)
+    repository.calls.clear()
+    
+    await repository.get(1)
+    await repository.get(2)
+    
+    assert repository.calls == [2]
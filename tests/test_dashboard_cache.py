@@ -0,0 +1,106 @@
+"""Tests for the dashboard statistics cache."""
+
+import asyncio
+
+import pytest
+
+from app.application import dashboard_cache as dashboard_cache_module
+from app.application.dashboard_cache import DashboardStatsCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(dashboard_cache_module.time, "monotonic", fake)
+    return fake
+
+
+class Counter:
+    """Compute function that records how often it ran."""
+    
+    def __init__(self, value="stats"):
+        self.value = value
+        self.calls = 0
+    
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.value
+
+
+@pytest.mark.asyncio
+async def test_values_are_served_until_the_ttl_expires(clock):
+    cache = DashboardStatsCache(ttl=30)
+    compute = Counter()
+    
+    await cache.get_or_compute(("admin",), compute)
+    clock.now += 29
+    await cache.get_or_compute(("admin",), compute)
+    clock.now += 2
+    await cache.get_or_compute(("admin",), compute)
+    
+    assert compute.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_are_coalesced(clock):
+    cache = DashboardStatsCache()
+    compute = Counter()
+    
+    results = await asyncio.gather(*(cache.get_or_compute(("admin",), compute) for _ in range(5)))
+    
+    assert results == ["stats"] * 5
+    assert compute.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_only_the_given_roles(clock):
+    cache = DashboardStatsCache()
+    admin, dentist = Counter(), Counter()
+    await cache.get_or_compute(("admin",), admin)
+    await cache.get_or_compute(("dentist", 1), dentist)
+    
+    cache.invalidate("admin")
+    await cache.get_or_compute(("admin",), admin)
+    await cache.get_or_compute(("dentist", 1), dentist)
+    
+    assert (admin.calls, dentist.calls) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_invalidate_without_roles_drops_everything(clock):
+    cache = DashboardStatsCache()
+    admin, dentist = Counter(), Counter()
+    await cache.get_or_compute(("admin",), admin)
+    await cache.get_or_compute(("dentist", 1), dentist)
+    
+    cache.invalidate()
+    await cache.get_or_compute(("admin",), admin)
+    await cache.get_or_compute(("dentist", 1), dentist)
+    
+    assert (admin.calls, dentist.calls) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_values_computed_across_an_invalidation_are_not_stored(clock):
+    cache = DashboardStatsCache()
+    compute = Counter()
+    
+    async def invalidated_midway():
+        value = await compute()
+        cache.invalidate("admin")
+        return value
+    
+    assert await cache.get_or_compute(("admin",), invalidated_midway) == "stats"
+    await cache.get_or_compute(("admin",), compute)
+    
+    assert compute.calls == 2
+
@@ -0,0 +1,99 @@
+"""Tests for the background dashboard counters and their lifespan wiring."""
+
+import asyncio
+import logging
+
+import pytest
+
+from app import main
+from app.application.dashboard_cache import DashboardMetricAggregator, DashboardStatsCache, admin_metrics
+from app.application.services import dashboard_service
+
+
+class Counters:
+    """Fetch function returning an increasing counter, or failing on demand."""
+    
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+        self.fetched = asyncio.Event()
+    
+    async def __call__(self):
+        self.calls += 1
+        self.fetched.set()
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        return {"total_users": self.calls}
+
+
+async def next_fetch(fetch: Counters):
+    fetch.fetched.clear()
+    await asyncio.wait_for(fetch.fetched.wait(), timeout=1)
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_refreshed_in_the_background():
+    aggregator = DashboardMetricAggregator(interval=60)
+    fetch = Counters()
+    
+    assert aggregator.snapshot is None
+    aggregator.start(fetch)
+    await next_fetch(fetch)
+    assert aggregator.snapshot == {"total_users": 1}
+    
+    aggregator.mark_dirty()
+    await next_fetch(fetch)
+    assert aggregator.snapshot == {"total_users": 2}
+    
+    await aggregator.stop()
+    assert aggregator.snapshot is None
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_the_last_snapshot(caplog):
+    aggregator = DashboardMetricAggregator(interval=60)
+    fetch = Counters()
+    aggregator.start(fetch)
+    await next_fetch(fetch)
+    
+    fetch.fail = True
+    with caplog.at_level(logging.ERROR, logger="app.application.dashboard_cache"):
+        aggregator.mark_dirty()
+        await next_fetch(fetch)
+    
+    assert aggregator.snapshot == {"total_users": 1}
+    assert "Dashboard metrics refresh failed" in caplog.text
+    await aggregator.stop()
+
+
+def test_invalidation_listeners_run_for_their_role():
+    cache = DashboardStatsCache()
+    calls = []
+    cache.on_invalidate("admin", lambda: calls.append("admin"))
+    
+    cache.invalidate("dentist")
+    cache.invalidate("admin")
+    cache.invalidate()
+    
+    assert calls == ["admin", "admin"]
+
+
+@pytest.mark.asyncio
+async def test_lifespan_runs_checks_and_owns_the_refresh_task(monkeypatch):
+    checks = []
+    fetch = Counters()
+    
+    async def check():
+        checks.append(True)
+    
+    monkeypatch.setattr(main, "validate_database_schema", check)
+    monkeypatch.setattr(main, "check_password_hash_cost", check)
+    monkeypatch.setattr(dashboard_service, "fetch_admin_counters", fetch)
+    
+    async with main.lifespan(main.app):
+        assert checks == [True, True]
+        await next_fetch(fetch)
+        assert admin_metrics.snapshot == {"total_users": 1}
+    
+    assert admin_metrics.snapshot is None
@@ -0,0 +1,84 @@
+"""Tests for the dashboard statistics service."""
+
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+import pytest
+
+from app.application.services import dashboard_service
+from app.application.services.dashboard_service import DashboardService
+from app.domain.models import ContactStatus
+
+
+class SessionFactory:
+    """Stand-in for async_sessionmaker that hands out numbered sessions."""
+    
+    def __init__(self):
+        self.opened = []
+    
+    @asynccontextmanager
+    async def __call__(self):
+        session = object()
+        self.opened.append(session)
+        yield session
+
+
+def fake_repository(**results):
+    """Build a repository class whose methods return ``results`` and log their calls."""
+    calls = []
+    
+    class FakeRepository:
+        def __init__(self, session):
+            self.session = session
+    
+    for name, value in results.items():
+        async def method(self, *args, _name=name, _value=value, **kwargs):
+            calls.append((_name, self.session, args, kwargs))
+            return _value
+        setattr(FakeRepository, name, method)
+    
+    FakeRepository.calls = calls
+    return FakeRepository
+
+
+@pytest.mark.asyncio
+async def test_read_runs_the_query_on_its_own_session():
+    factory = SessionFactory()
+    service = DashboardService(session_factory=factory)
+    
+    async def query(session):
+        return session
+    
+    first = await service._read(query)
+    second = await service._read(query)
+    
+    assert factory.opened == [first, second]
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_receptionist_stats_use_one_session_per_read(monkeypatch):
+    patients = fake_repository(count_by_creator=4, count_recent=2)
+    contacts = fake_repository(count_all=9, count_by_status=3)
+    records = fake_repository(count_upcoming_and_today_appointments=(7, 1))
+    monkeypatch.setattr(dashboard_service, "PatientRepository", patients)
+    monkeypatch.setattr(dashboard_service, "ContactRequestRepository", contacts)
+    monkeypatch.setattr(dashboard_service, "MedicalRecordRepository", records)
+    # Only the reads are under test, not the response schema
+    monkeypatch.setattr(dashboard_service, "ReceptionistDashboardStats", dict)
+    factory = SessionFactory()
+    receptionist_id = uuid4()
+    
+    stats = await DashboardService(session_factory=factory).get_receptionist_dashboard_stats(receptionist_id)
+    
+    assert stats == {
+        "total_patients": 4,
+        "recent_patients": 2,
+        "pending_contact_requests": 3,
+        "total_contact_requests": 9,
+        "upcoming_appointments": 7,
+        "today_appointments": 1,
+    }
+    assert ("count_by_creator", factory.opened[0], (receptionist_id,), {}) in patients.calls
+    assert ("count_by_status", factory.opened[3], (ContactStatus.PENDING,), {}) in contacts.calls
+    assert len(set(map(id, factory.opened))) == 5
@@ -0,0 +1,41 @@
+"""Tests for the role guard dependencies."""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.domain.models import UserRole
+from app.presentation.api.dependencies import require_admin_or_dentist, requires
+
+
+def user_with(role):
+    return SimpleNamespace(id=uuid4(), role=role)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("role", [UserRole.ADMIN, UserRole.DENTIST])
+async def test_allowed_roles_pass_through(role):
+    user = user_with(role)
+    
+    assert await require_admin_or_dentist(current_user=user) is user
+
+
+@pytest.mark.asyncio
+async def test_other_roles_are_forbidden():
+    with pytest.raises(HTTPException) as exc_info:
+        await require_admin_or_dentist(current_user=user_with(UserRole.RECEPTIONIST))
+    
+    assert exc_info.value.status_code == 403
+    assert exc_info.value.detail == "Administrator or Dentist privileges required"
+
+
+@pytest.mark.asyncio
+async def test_requires_uses_its_own_detail():
+    guard = requires(UserRole.RECEPTIONIST, detail="Front desk only")
+    
+    with pytest.raises(HTTPException) as exc_info:
+        await guard(current_user=user_with(UserRole.DENTIST))
+    
+    assert exc_info.value.detail == "Front desk only"
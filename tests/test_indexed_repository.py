@@ -0,0 +1,65 @@
+"""Tests for the startup index validation of repositories."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.application.exceptions import DatabaseError
+from app.core.database import find_missing_indexes
+from app.insfraestructure.repositories import PatientRepository, UserRepository
+
+
+class CatalogConnection:
+    """Connection stub answering the catalog queries from a fixed index list."""
+    
+    def __init__(self, indexes):
+        # table -> [(leading key, unique)]
+        self.indexes = indexes
+    
+    async def scalar(self, statement, params):
+        return params["table"] if params["table"] in self.indexes else None
+    
+    async def execute(self, statement, params):
+        rows = self.indexes[params["table"]]
+        return SimpleNamespace(all=lambda: rows)
+
+
+USERS_WITH_CONSTRAINT_ONLY = {"users": [("id", True), ("email", True), ("created_at", False)]}
+
+
+@pytest.mark.asyncio
+async def test_plain_email_index_does_not_satisfy_lower_email():
+    conn = CatalogConnection(USERS_WITH_CONSTRAINT_ONLY)
+    
+    with pytest.raises(DatabaseError, match=r"users\(lower\(\(email\)::text\)\)"):
+        await UserRepository.validate_schema(conn)
+
+
+@pytest.mark.asyncio
+async def test_expression_index_satisfies_user_lookups():
+    conn = CatalogConnection({"users": [("id", True), ("lower((email)::text)", True)]})
+    
+    await UserRepository.validate_schema(conn)
+
+
+@pytest.mark.asyncio
+async def test_unique_requirement_needs_a_unique_index():
+    conn = CatalogConnection({"users": [("id", True), ("lower((email)::text)", False)]})
+    
+    missing = await find_missing_indexes(conn, UserRepository.__required_indexes__)
+    
+    assert missing == [("users", "lower((email)::text)", True)]
+
+
+@pytest.mark.asyncio
+async def test_index_on_another_column_does_not_count():
+    conn = CatalogConnection({"patients": [("id", True), ("created_by", False)]})
+    
+    missing = await find_missing_indexes(conn, (("patients", "created_at", False),))
+    
+    assert missing == [("patients", "created_at", False)]
+
+
+@pytest.mark.asyncio
+async def test_missing_tables_are_skipped():
+    await PatientRepository.validate_schema(CatalogConnection({}))
@@ -0,0 +1,54 @@
+"""Tests for the keyset pagination helpers."""
+
+import base64
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.application.exceptions import ValidationError
+from app.application.pagination import (
+    MAX_LEGACY_SKIP,
+    check_legacy_skip,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def test_cursor_round_trip():
+    key = (datetime(2025, 3, 14, 9, 30, 15, 123456, tzinfo=timezone.utc), uuid4())
+    
+    assert decode_cursor(encode_cursor(key)) == key
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor((datetime(2025, 1, 1), uuid4()))
+    
+    assert all(c.isalnum() or c in "-_=" for c in cursor)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor",
+    base64.urlsafe_b64encode(b"{}").decode(),
+    base64.urlsafe_b64encode(b'["2025-01-01T00:00:00", "not-a-uuid"]').decode(),
+    base64.urlsafe_b64encode(b'["yesterday", "6f1c1b6e-8a41-4a55-9d5e-0d1b2f0c3a11"]').decode(),
+    "ñ",
+])
+def test_decode_cursor_rejects_malformed_tokens(cursor):
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor)
+
+
+def test_check_legacy_skip_warns_deprecation():
+    with pytest.warns(DeprecationWarning):
+        check_legacy_skip(0)
+
+
+def test_check_legacy_skip_accepts_limit():
+    with pytest.warns(DeprecationWarning):
+        check_legacy_skip(MAX_LEGACY_SKIP)
+
+
+def test_check_legacy_skip_rejects_deep_offsets():
+    with pytest.warns(DeprecationWarning), pytest.raises(ValidationError):
+        check_legacy_skip(MAX_LEGACY_SKIP + 1)
@@ -0,0 +1,58 @@
+"""Tests for the service-level role checks."""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.application.exceptions import AuthorizationError
+from app.application.permissions import require_roles
+from app.domain.models import UserRole
+
+
+class ReportService:
+    @require_roles(UserRole.ADMIN, UserRole.RECEPTIONIST, message="Staff only")
+    async def build_report(self, report_id, current_user, fmt="pdf"):
+        return report_id, fmt
+    
+    @require_roles(UserRole.ADMIN)
+    async def purge(self, current_user):
+        return "purged"
+
+
+def user_with(role):
+    return SimpleNamespace(id=uuid4(), role=role)
+
+
+@pytest.mark.asyncio
+async def test_allowed_user_passed_by_position():
+    service = ReportService()
+    
+    assert await service.build_report(7, user_with(UserRole.RECEPTIONIST), "csv") == (7, "csv")
+
+
+@pytest.mark.asyncio
+async def test_allowed_user_passed_by_keyword():
+    service = ReportService()
+    
+    assert await service.build_report(7, current_user=user_with(UserRole.ADMIN)) == (7, "pdf")
+
+
+@pytest.mark.asyncio
+async def test_other_roles_are_rejected_with_the_message():
+    service = ReportService()
+    
+    with pytest.raises(AuthorizationError, match="Staff only"):
+        await service.build_report(7, user_with(UserRole.DENTIST))
+
+
+@pytest.mark.asyncio
+async def test_default_message_is_used_when_none_is_given():
+    with pytest.raises(AuthorizationError) as exc_info:
+        await ReportService().purge(user_with(UserRole.DENTIST))
+    
+    assert exc_info.value.message == AuthorizationError().message
+
+
+def test_decorated_method_keeps_its_metadata():
+    assert ReportService.build_report.__name__ == "build_report"
@@ -0,0 +1,138 @@
+"""Tests for the shared repository page query and its total strategy."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.application.pagination import decode_cursor, encode_cursor
+from app.domain.models import Patient
+from app.insfraestructure.repositories.pagination import paginate
+
+
+class FakeResult:
+    """Result stub serving window rows, scalars or a single count."""
+    
+    def __init__(self, rows):
+        self.rows = rows
+    
+    def all(self):
+        return self.rows
+    
+    def scalars(self):
+        return SimpleNamespace(all=lambda: self.rows)
+    
+    def scalar(self):
+        return self.rows
+
+
+class RecordingSession:
+    """Session stub that replays queued results and records the statements."""
+    
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+    
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return FakeResult(self.results.pop(0))
+
+
+def make_patient():
+    return SimpleNamespace(created_at=datetime(2025, 1, 1, tzinfo=timezone.utc), id=uuid4())
+
+
+class Row(tuple):
+    """Row stub: ``row[0]`` is the entity and ``row.total`` the window count."""
+    
+    def __new__(cls, entity, total):
+        row = super().__new__(cls, (entity,))
+        row.total = total
+        return row
+
+
+def compile_sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+async def get_page(db, **kwargs):
+    filters = [Patient.created_by == uuid4()]
+    return await paginate(db, Patient, (Patient.created_at, Patient.id), filters, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_first_page_total_comes_from_window_count():
+    patients = [make_patient(), make_patient()]
+    db = RecordingSession([Row(patient, 42) for patient in patients])
+    
+    items, total, next_cursor = await get_page(db, limit=2)
+    
+    assert items == patients
+    assert total == 42
+    assert decode_cursor(next_cursor) == (patients[-1].created_at, patients[-1].id)
+    assert len(db.statements) == 1
+    assert "count(*) OVER ()" in compile_sql(db.statements[0])
+
+
+@pytest.mark.asyncio
+async def test_empty_first_page_has_zero_total_without_count():
+    db = RecordingSession([])
+    
+    items, total, next_cursor = await get_page(db, limit=10)
+    
+    assert (items, total, next_cursor) == ([], 0, None)
+    assert len(db.statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_cursor_page_runs_filtered_count():
+    cursor = encode_cursor((datetime(2025, 1, 1, tzinfo=timezone.utc), uuid4()))
+    db = RecordingSession([make_patient()], 11)
+    
+    items, total, next_cursor = await get_page(db, limit=10, cursor=cursor)
+    
+    assert len(items) == 1
+    assert total == 11
+    assert next_cursor is None
+    page_sql, count_sql = (compile_sql(stmt) for stmt in db.statements)
+    assert "OVER" not in page_sql
+    assert "(patients.created_at, patients.id) <" in page_sql
+    assert "count(*)" in count_sql
+    assert "patients.created_by" in count_sql
+
+
+@pytest.mark.asyncio
+async def test_offset_past_the_end_runs_count():
+    db = RecordingSession([], 7)
+    
+    items, total, _ = await get_page(db, limit=10, skip=20)
+    
+    assert items == []
+    assert total == 7
+    assert "OFFSET" in compile_sql(db.statements[0])
+
+
+@pytest.mark.asyncio
+async def test_total_is_none_when_not_requested():
+    db = RecordingSession([make_patient()])
+    
+    items, total, _ = await get_page(db, limit=10, include_total=False)
+    
+    assert len(items) == 1
+    assert total is None
+    assert len(db.statements) == 1
+    assert "OVER" not in compile_sql(db.statements[0])
+
+
+@pytest.mark.asyncio
+async def test_ascending_cursor_seeks_forward():
+    cursor = encode_cursor((datetime(2025, 1, 1, tzinfo=timezone.utc), uuid4()))
+    db = RecordingSession([])
+    
+    await get_page(db, limit=10, cursor=cursor, include_total=False, descending=False)
+    
+    page_sql = compile_sql(db.statements[0])
+    assert "(patients.created_at, patients.id) >" in page_sql
+    assert "patients.created_at ASC" in page_sql
@@ -0,0 +1,104 @@
+"""Tests for JWT decoding and verification helpers."""
+
+import base64
+import json
+import time
+from datetime import timedelta
+
+import jwt
+import pytest
+
+from app.core import security
+from app.core.security import (
+    create_access_token,
+    decode_token,
+    peek_claims,
+    verify_access_token_cached,
+)
+
+
+def forge(token: str, **claims) -> str:
+    """Swap the payload of ``token`` while keeping its original signature."""
+    header, _, signature = token.split(".")
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=").decode()
+    return f"{header}.{payload}.{signature}"
+
+
+def test_decode_token_verifies_signature():
+    token = create_access_token({"sub": "user-1", "role": "dentist"})
+    
+    assert decode_token(token)["sub"] == "user-1"
+    with pytest.raises(jwt.InvalidSignatureError):
+        decode_token(forge(token, sub="user-1", role="admin"))
+
+
+def test_peek_claims_reads_payload_without_verifying():
+    token = create_access_token({"sub": "user-1", "role": "dentist"})
+    
+    assert peek_claims(token)["role"] == "dentist"
+    assert peek_claims(forge(token, sub="user-1", role="admin"))["role"] == "admin"
+
+
+@pytest.mark.parametrize("token", ["", "no-dots", "a.!!!.c", "a.bm90IGpzb24.c"])
+def test_peek_claims_rejects_malformed_tokens(token):
+    with pytest.raises(jwt.DecodeError):
+        peek_claims(token)
+
+
+@pytest.fixture
+def verifications(monkeypatch):
+    """Count the signature checks behind verify_access_token_cached."""
+    calls = []
+    verify = security.verify_access_token
+    
+    def counting_verify(token):
+        calls.append(token)
+        return verify(token)
+    
+    security._token_cache.clear()
+    monkeypatch.setattr(security, "verify_access_token", counting_verify)
+    yield calls
+    security._token_cache.clear()
+
+
+def test_cached_verification_is_reused(verifications):
+    token = create_access_token({"sub": "user-1"})
+    
+    first = verify_access_token_cached(token)
+    second = verify_access_token_cached(token)
+    
+    assert first == second
+    assert verifications == [token]
+
+
+def test_cached_verification_expires_with_the_cache_ttl(verifications, monkeypatch):
+    token = create_access_token({"sub": "user-1"})
+    now = time.time()
+    
+    verify_access_token_cached(token)
+    monkeypatch.setattr(security.time, "time", lambda: now + security._TOKEN_CACHE_TTL + 1)
+    verify_access_token_cached(token)
+    
+    assert len(verifications) == 2
+
+
+def test_cached_verification_never_outlives_the_token(verifications, monkeypatch):
+    token = create_access_token({"sub": "user-1"}, expires_delta=timedelta(seconds=5))
+    now = time.time()
+    
+    verify_access_token_cached(token)
+    monkeypatch.setattr(security.time, "time", lambda: now + 10)
+    verify_access_token_cached(token)
+    
+    assert len(verifications) == 2
+
+
+def test_forged_tokens_are_not_cached(verifications):
+    token = create_access_token({"sub": "user-1", "role": "dentist"})
+    forged = forge(token, sub="user-1", role="admin")
+    
+    for _ in range(2):
+        with pytest.raises(jwt.InvalidSignatureError):
+            verify_access_token_cached(forged)
+    
+    assert verifications == [forged, forged]
@@ -58,8 +58,8 @@ def check_requirements():
         'sqlalchemy',
         'asyncpg',
         'psycopg',
-        'python-jose',
-        'passlib',
+        'PyJWT',
+        'bcrypt',
         'gunicorn',
         'pydantic',
         'pydantic-settings'